@@ -2,6 +2,16 @@
 # akaru.py – AKARU CORE Launcher
 # Jalankan: python akaru.py
 # Atau lewat alias: akaru (setelah setup.sh)
+#
+#   akaru                 → interaktif (attach ke server kalau aktif)
+#   akaru -c "<perintah>" → satu perintah lalu keluar
+#   akaru --server        → server lokal, state tetap hangat di RAM
+#   akaru --batch <file>  → jalankan banyak perintah, satu commit di akhir
+#   akaru -               → sama, perintah dibaca dari stdin
+#   akaru impor <file>    → bulk import catatan/tugas (TXT/CSV/JSONL)
+#   akaru sync ...        → delta sync dengan device lain (lihat core/sync.py)
+#   akaru backup [...]    → backup inkremental data/ (lihat core/backup.py)
+#   akaru --record [file] → rekam perintah sesi ini (untuk bench/replay.py)
 
 import os
 import sys
@@ -9,65 +19,212 @@ import sys
 # Pastikan direktori project ada di path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from core.config import load_config, ensure_data_dir
+from core.config import ensure_data_dir
 from core import display as D
 from core import memory as M
-from core.engine import route, execute, violates_goal, print_help
+from core.engine import EXIT_WORDS, load_state, handle
 
 def main():
+    args = sys.argv[1:]
+    if "--server" in args:
+        return _serve()
+    if "-c" in args:
+        i = args.index("-c")
+        return _one_shot(" ".join(args[i + 1:]))
+    if "--batch" in args or "-" in args:
+        return _batch(args)
+    if args[:1] == ["impor"]:
+        if len(args) < 2:
+            return D.err("Format: akaru impor <file>")
+        # Path absolut: server bisa jalan dari direktori lain
+        return _one_shot("impor " + os.path.abspath(" ".join(args[1:])))
+    if args[:1] == ["sync"]:
+        if len(args) == 2 and not args[1].startswith("-"):
+            # Folder lain: lewat server kalau aktif, supaya state di RAM ikut
+            return _one_shot("sync " + os.path.abspath(args[1]))
+        from core import sync
+        return sync.main(args[1:])
+    if args[:1] == ["backup"]:
+        if len(args) == 1:
+            # Lewat server kalau aktif: antrian write-behind-nya di-flush dulu
+            return _one_shot("backup")
+        from core import backup
+        return backup.main(args[1:])
+
+    # Server aktif → cukup jadi thin client
+    from core.server import connect
+    sock = connect()
+    if sock:
+        return _attach(sock)
+
     ensure_data_dir()
 
     # Load semua state sekali di awal
-    cfg     = load_config()
-    mem     = M.load_memory()
-    ctx     = M.load_context()
-    logs    = M.load_logs()
+    state = load_state()
+    cfg   = state["cfg"]
+    ctx   = state["context"]
 
     D.set_color(cfg.get("color", True))
+    _start_writer(cfg)
 
     # Update sesi
     M.start_session(ctx)
 
     # Banner
-    os.system("clear")
+    D.clear_screen()
     D.print_banner(cfg)
 
     # Greeting kontekstual
-    _greet(ctx, cfg)
+    _greet(ctx, cfg, state["memory"])
 
-    state = {"cfg": cfg, "memory": mem, "context": ctx, "logs": logs}
+    # Rekam sesi (opsional) — lewat flag atau config record_session
+    rec = None
+    if "--record" in args or cfg.get("record_session"):
+        from core.recorder import Recorder
+        i    = args.index("--record") if "--record" in args else -1
+        path = args[i + 1] if 0 <= i < len(args) - 1 and not args[i + 1].startswith("-") else None
+        rec  = Recorder(path)
+        D.set_input(rec.input_hook)
+        D.dim(f"Sesi direkam → {rec.path}")
 
     # ── Main loop ──────────────────────────────────────────
-    while True:
+    try:
+        while True:
+            user_input = _read_command(cfg["username"])
+            if user_input is None:
+                break
+            if user_input:
+                if rec:
+                    rec.command(user_input)
+                handle(user_input, state)
+    finally:
+        if rec:
+            rec.close()
+        from core import writer
+        writer.stop()  # flush sebelum keluar (atexit juga, ini biar eksplisit)
+
+def _read_command(username):
+    """Baca satu perintah. Return None kalau user keluar."""
+    try:
+        prompt = D.c(f"\n  {username} ❯ ", D.CYAN, D.BOLD)
+        user_input = input(prompt).strip()
+    except (EOFError, KeyboardInterrupt):
+        print(D.c("\n\n  Stay consistent. AKARU offline.\n", D.GRAY))
+        return None
+
+    if user_input.lower() in EXIT_WORDS:
+        print(D.c("\n  AKARU offline. Tetap konsisten.\n", D.CYAN, D.BOLD))
+        return None
+    return user_input
+
+# ── Mode server / client ──────────────────────────────────
+def _serve():
+    from core.server import Server
+    ensure_data_dir()
+    state = load_state()
+    D.set_color(state["cfg"].get("color", True))
+    _start_writer(state["cfg"])
+    M.start_session(state["context"])
+    Server(state, greet=_greet).serve()
+
+def _start_writer(cfg):
+    """Save di thread latar supaya prompt berikutnya tidak menunggu disk."""
+    if cfg.get("write_behind", True):
+        from core import writer
+        writer.start()
+
+def _one_shot(text):
+    """`akaru -c "..."` — lewat server kalau aktif, kalau tidak jalan lokal."""
+    if not text.strip():
+        D.err('Format: akaru -c "<perintah>"')
+        return
+    from core.server import connect, Client
+    sock = connect()
+    if sock:
+        client = Client(sock)
         try:
-            prompt = D.c(f"\n  {cfg['username']} ❯ ", D.CYAN, D.BOLD)
-            user_input = input(prompt).strip()
-        except (EOFError, KeyboardInterrupt):
-            print(D.c("\n\n  Stay consistent. AKARU offline.\n", D.GRAY))
-            break
+            client.request(text)
+        finally:
+            client.close()
+        return
+    ensure_data_dir()
+    state = load_state()
+    D.set_color(state["cfg"].get("color", True))
+    handle(text, state)
+
+# ── Mode batch ────────────────────────────────────────────
+def _batch(args):
+    """
+    akaru --batch <file> [--yes] [-q]   |   akaru - [--yes] [-q]
+    --yes : jawab 'y' untuk konfirmasi strict mode (default: dibatalkan)
+    -q    : sembunyikan output tiap perintah, cuma tampilkan ringkasan
+    """
+    import io
+    from contextlib import redirect_stdout
+    from core.engine import run_batch
 
-        if not user_input:
-            continue
+    if "--batch" in args:
+        i = args.index("--batch")
+        if i + 1 >= len(args):
+            D.err("Format: akaru --batch <file>")
+            return
+        try:
+            src = open(args[i + 1], "r", encoding="utf-8")
+        except OSError as e:
+            D.err(f"Tidak bisa buka file: {e}")
+            return
+    else:
+        src = sys.stdin
 
-        if user_input.lower() in ("exit", "quit", "keluar", "q"):
-            print(D.c("\n  AKARU offline. Tetap konsisten.\n", D.CYAN, D.BOLD))
-            break
+    ensure_data_dir()
+    state = load_state()
+    D.set_color(state["cfg"].get("color", True) and sys.stdout.isatty())
+    assume_yes = "--yes" in args
+    D.set_input(lambda prompt: "y" if assume_yes else "")
 
-        intent = route(user_input)
+    try:
+        if "-q" in args:
+            with redirect_stdout(io.StringIO()):
+                stats = run_batch(src, state)
+        else:
+            stats = run_batch(src, state)
+    except Exception as e:
+        D.err(f"Batch dibatalkan, tidak ada data yang ditulis: {e}")
+        return
+    finally:
+        D.set_input(None)
+        if src is not sys.stdin:
+            src.close()
 
-        # Goal enforcement — hanya untuk input konten
-        if intent in ("NOTE", "TASK_ADD") and violates_goal(user_input):
-            D.warn("Ditahan: bertentangan dengan goal aktif.")
-            M.append_log(logs, intent, ok=False, note="goal_violation",
-                         max_logs=cfg.get("max_logs", 80))
-            continue
+    D.header("BATCH SELESAI", D.CYAN)
+    D.info("Perintah dijalankan", str(stats["commands"]))
+    D.info("File ditulis",        f"{stats['files']} (satu commit)")
+    D.info("Waktu eksekusi",      f"{stats['exec_s']:.3f} detik")
+    D.info("Waktu total",         f"{stats['total_s']:.3f} detik")
+    D.info("Throughput",          f"{stats['rate']:.0f} perintah/detik")
+    for intent, count in stats["intents"].most_common(5):
+        D.info(f"  {intent}", str(count))
+    D.sep()
 
-        execute(intent, user_input, state)
-        M.append_log(logs, intent, ok=True, max_logs=cfg.get("max_logs", 80))
-        M.update_context(ctx, intent)
+def _attach(sock):
+    from core.server import Client
+    client = Client(sock)
+    try:
+        D.clear_screen()
+        client.request(op="greet")
+        while True:
+            user_input = _read_command(client.user)
+            if user_input is None:
+                break
+            if user_input:
+                client.request(user_input)
+    except ConnectionError as e:
+        D.err(str(e))
+    finally:
+        client.close()
 
 # ── Greeting kontekstual ──────────────────────────────────
-def _greet(ctx, cfg):
+def _greet(ctx, cfg, mem=None):
     from datetime import datetime
     name    = cfg.get("username", "User")
     streak  = ctx.get("streak_days", 0)
@@ -101,6 +258,17 @@ def _greet(ctx, cfg):
         except Exception:
             pass
 
+    # Deadline dari index (heap): terlambat + yang berikutnya, tanpa scan tugas
+    if mem is not None:
+        from core import deadline
+        late = deadline.overdue(mem)
+        if late:
+            print(D.c(f"  ⏰ {len(late)} tugas terlambat — tertua: #{late[0]['id']} {late[0]['v'][:40]}", D.RED))
+        nxt = deadline.next_due(mem, len(late) + 1)[len(late):]
+        if nxt:
+            tk = nxt[0]
+            print(D.c(f"  Berikutnya: #{tk['id']} {tk['v'][:40]} ({deadline.label(tk['due'])})", D.GRAY))
+
     D.blank()
 
 if __name__ == "__main__":
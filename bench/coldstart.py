@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# bench/coldstart.py – Waktu load saat startup: JSON vs snapshot biner (.snap)
+# Tiap pengukuran di proses baru (tanpa cache parse), load_state() seperti launcher
+#
+# Jalankan: python bench/coldstart.py [--scales 10k,100k,1m] [--repeat 3] [--out hasil.json]
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench.gen import generate, write, parse_scale  # noqa: E402
+
+DEFAULT_SCALES = "10k,100k,1m"
+REPEAT         = 3
+
+# Dijalankan di proses anak: AKARU_DATA_DIR sudah diset oleh parent
+CHILD = """
+import sys, time, json
+sys.path.insert(0, {root!r})
+from core import config
+if {json_only!r}:
+    config.SNAPSHOT_MIN_BYTES = float("inf")
+from core.engine import load_state
+t0 = time.perf_counter()
+state = load_state()
+dt = time.perf_counter() - t0
+print(json.dumps({{"load_s": dt, "notes": len(state["memory"]["notes"]), "logs": len(state["logs"])}}))
+"""
+
+def _child(data_dir, json_only):
+    env = dict(os.environ, AKARU_DATA_DIR=data_dir)
+    t0  = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", CHILD.format(root=ROOT, json_only=json_only)],
+                         env=env, capture_output=True, text=True, check=True).stdout
+    res = json.loads(out.strip().splitlines()[-1])
+    res["proc_s"] = time.perf_counter() - t0
+    return res
+
+def _median(rows, key):
+    vals = sorted(r[key] for r in rows)
+    return vals[len(vals) // 2]
+
+def run_scale(label, repeat):
+    n   = parse_scale(label)
+    tmp = tempfile.mkdtemp(prefix="akaru_cold_")
+    try:
+        write(tmp, generate(n))
+        json_runs = [_child(tmp, True) for _ in range(repeat)]
+        _child(tmp, False)                      # run pertama: bikin .snap
+        snap_runs = [_child(tmp, False) for _ in range(repeat)]
+        snap_b = sum(os.path.getsize(os.path.join(tmp, f))
+                     for f in os.listdir(tmp) if f.endswith(".snap"))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    res = {
+        "json_s"     : _median(json_runs, "load_s"),
+        "snap_s"     : _median(snap_runs, "load_s"),
+        "json_proc_s": _median(json_runs, "proc_s"),
+        "snap_proc_s": _median(snap_runs, "proc_s"),
+        "snap_bytes" : snap_b,
+    }
+    print(f"  {label:>5}  {res['json_s'] * 1000:10.1f} ms {res['snap_s'] * 1000:10.1f} ms"
+          f"  {res['json_s'] / max(res['snap_s'], 1e-9):6.1f}x"
+          f"  {res['json_proc_s']:7.2f} s {res['snap_proc_s']:7.2f} s")
+    return res
+
+def main(args):
+    def opt(flag, default=None):
+        return args[args.index(flag) + 1] if flag in args and args.index(flag) + 1 < len(args) else default
+
+    if "--help" in args:
+        print("Usage: python bench/coldstart.py [--scales 10k,100k,1m] [--repeat 3] [--out file.json]")
+        return 0
+
+    repeat = int(opt("--repeat", str(REPEAT)))
+    print(f"  {'skala':>5}  {'load JSON':>13} {'load .snap':>13}  {'cepat':>7}"
+          f"  {'proses JSON':>9} {'proses .snap':>9}")
+    results = {label: run_scale(label, repeat) for label in opt("--scales", DEFAULT_SCALES).split(",")}
+
+    out = opt("--out")
+    if out:
+        with open(out, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "repeat": repeat, "results": results}, f, indent=2)
+        print(f"[coldstart] hasil → {out}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
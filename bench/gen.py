@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# bench/gen.py – AKARU Synthetic Data Generator
+# Dataset deterministik (seed tetap) untuk notes, tasks, logs, mood
+#
+# Jalankan: python bench/gen.py <folder_data> <skala> [--seed N]
+# Skala   : 1k | 10k | 100k | 1m  (atau angka langsung)
+
+import os
+import sys
+import json
+import random
+from datetime import datetime, timedelta
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+INTENTS = [
+    "NOTE", "TASK_ADD", "TASK_DONE", "VIEW_NOTES", "VIEW_TASKS", "STATUS",
+    "SUMMARY_DAY", "SEARCH", "ANALYZE", "MOOD_CHECKIN", "VIEW_LOG", "HELP",
+]
+WORDS = (
+    "kerja belajar python termux akaru rapat proyek laporan olahraga baca buku "
+    "tidur makan kopi kode bug fitur data server rumah keluarga uang belanja "
+    "jadwal ide tulis review deploy test desain catatan target minggu"
+).split()
+
+def parse_scale(s):
+    s = str(s).lower()
+    return SCALES[s] if s in SCALES else int(s)
+
+def _text(rng, lo=3, hi=9):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(lo, hi)))
+
+def _timeline(rng, n, days, end):
+    """n timestamp urut naik, tersebar di `days` hari terakhir sampai `end`."""
+    start = end - timedelta(days=days)
+    span  = days * 86400
+    secs  = sorted(rng.randrange(span) for _ in range(n))
+    return [(start + timedelta(seconds=s)).isoformat(timespec="seconds") for s in secs]
+
+def generate(n, seed=42, days=365, end=None):
+    """
+    Return dict {memory, logs, mood, context} dengan n record per koleksi
+    (mood n // 10 — satu check-in per beberapa aktivitas, seperti pemakaian nyata).
+    """
+    rng = random.Random(seed)
+    end = end or datetime.now().replace(microsecond=0)
+
+    notes = [
+        {"id": i, "t": t, "v": _text(rng)}
+        for i, t in enumerate(_timeline(rng, n, days, end), 1)
+    ]
+    tasks = []
+    for i, t in enumerate(_timeline(rng, n, days, end), 1):
+        task = {"id": i, "t": t, "v": _text(rng, 2, 6), "done": rng.random() < 0.6}
+        if task["done"]:
+            task["done_at"] = (datetime.fromisoformat(t) + timedelta(hours=rng.randint(1, 72))).isoformat(timespec="seconds")
+        tasks.append(task)
+    logs = [
+        {"t": t, "i": rng.choice(INTENTS), "ok": rng.random() < 0.97}
+        for t in _timeline(rng, n, days, end)
+    ]
+    mood = []
+    for t in _timeline(rng, max(n // 10, 1), days, end):
+        mood.append({
+            "t"     : t,
+            "date"  : t[:10],
+            "mood"  : rng.randint(1, 5),
+            "energy": rng.randint(1, 5),
+            "note"  : _text(rng, 1, 4) if rng.random() < 0.3 else "",
+        })
+    context = {
+        "last_active"  : end.isoformat(timespec="seconds"),
+        "last_intent"  : "NOTE",
+        "last_note"    : notes[-1]["v"][:80] if notes else None,
+        "session_count": n // 20 + 1,
+        "streak_days"  : 7,
+        "last_date"    : end.strftime("%Y-%m-%d"),
+    }
+    return {"memory": {"notes": notes, "tasks": tasks}, "logs": logs, "mood": mood, "context": context}
+
+def write(data_dir, data):
+    """Tulis dataset dengan format yang sama seperti save_json (indent=2)."""
+    os.makedirs(data_dir, exist_ok=True)
+    files = {
+        "memory.json" : data["memory"],
+        "log.json"    : data["logs"],
+        "mood.json"   : data["mood"],
+        "context.json": data["context"],
+    }
+    for name, obj in files.items():
+        with open(os.path.join(data_dir, name), "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if len(args) < 2 or "--help" in args:
+        print("Usage: python bench/gen.py <folder_data> <1k|10k|100k|1m|N> [--seed N]")
+        sys.exit(0)
+    seed = int(args[args.index("--seed") + 1]) if "--seed" in args else 42
+    n    = parse_scale(args[1])
+    write(args[0], generate(n, seed=seed))
+    print(f"[gen] {n} record/koleksi → {args[0]}")
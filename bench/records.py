@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# bench/records.py – Ukuran RAM per record: dict JSON vs record __slots__
+#
+# Jalankan: python bench/records.py [skala]   (default 100k)
+
+import os
+import sys
+import json
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench.gen import generate, parse_scale  # noqa: E402
+from core.memory import Note, Task, LogEntry  # noqa: E402
+from core.mood import MoodEntry               # noqa: E402
+
+KINDS = [
+    ("notes", lambda d: d["memory"]["notes"], Note),
+    ("tasks", lambda d: d["memory"]["tasks"], Task),
+    ("logs",  lambda d: d["logs"],            LogEntry),
+    ("mood",  lambda d: d["mood"],            MoodEntry),
+]
+
+def _traced(fn):
+    """Return (hasil, byte yang masih teralokasi)."""
+    tracemalloc.start()
+    out  = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return out, size
+
+def _timed(fn):
+    """Waktu tanpa tracemalloc (tracemalloc memperlambat alokasi)."""
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+def main(args):
+    n    = parse_scale(args[0] if args else "100k")
+    data = generate(n)
+    print(f"[records] {n} record per koleksi (mood {max(n // 10, 1)})")
+    print(f"  {'koleksi'.ljust(8)} {'dict B/rec':>11} {'slots B/rec':>12} {'hemat':>7}"
+          f" {'parse':>9} {'+konversi':>10}")
+    for name, pick, cls in KINDS:
+        raw = json.dumps(pick(data))
+        # Keduanya diukur dari hasil parse JSON asli, seperti saat load dari disk
+        dicts, size_d = _traced(lambda: json.loads(raw))
+        count = len(dicts)
+        del dicts
+        recs, size_r = _traced(lambda: [cls.from_json(d) for d in json.loads(raw)])
+        del recs
+        t_parse = _timed(lambda: json.loads(raw))
+        t_conv  = _timed(lambda: [cls.from_json(d) for d in json.loads(raw)])
+        print(f"  {name.ljust(8)} {size_d / count:11.0f} {size_r / count:12.0f}"
+              f" {1 - size_r / size_d:7.0%} {t_parse * 1000:7.0f}ms {t_conv * 1000:8.0f}ms")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# bench/replay.py – AKARU Session Replay
+# Putar ulang rekaman sesi (akaru --record) lewat route/execute
+# pada SALINAN folder data, lalu laporkan latensi per intent
+#
+# Jalankan: python bench/replay.py <rekaman.jsonl> [--data <folder_data>]
+#                                  [--realtime] [--speed X] [--out hasil.json]
+#   --data     : folder data sumber (default: data/ repo). Tidak pernah diubah.
+#   --realtime : jaga jeda antar perintah seperti aslinya (dibagi --speed)
+
+import os
+import sys
+import io
+import json
+import time
+import shutil
+import tempfile
+from collections import defaultdict
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+def replay(steps, realtime=False, speed=1.0):
+    """Return dict intent → list latensi (detik). Folder data harus sudah diset."""
+    from core import display as D
+    from core.engine import load_state, handle
+
+    state   = load_state()
+    lat     = defaultdict(list)
+    answers = []
+    D.set_input(lambda prompt: answers.pop(0) if answers else "")
+
+    sink  = io.StringIO()
+    prev  = None
+    for ts, cmd, ans in steps:
+        if realtime and prev is not None and ts > prev:
+            time.sleep((ts - prev) / speed)
+        prev = ts
+        answers[:] = list(ans)
+        with redirect_stdout(sink):
+            t0     = time.perf_counter()
+            intent = handle(cmd, state)
+            lat[intent].append(time.perf_counter() - t0)
+        sink.seek(0)
+        sink.truncate()
+    D.set_input(None)
+    return lat
+
+def report(lat):
+    from core.perf import percentile as _pct
+    rows = {}
+    for intent, vals in lat.items():
+        vals = sorted(vals)
+        rows[intent] = {
+            "count": len(vals),
+            "p50"  : _pct(vals, 50),
+            "p95"  : _pct(vals, 95),
+            "p99"  : _pct(vals, 99),
+            "max"  : vals[-1],
+        }
+    return rows
+
+def main(args):
+    def opt(flag, default=None):
+        return args[args.index(flag) + 1] if flag in args and args.index(flag) + 1 < len(args) else default
+
+    if not args or "--help" in args:
+        print("Usage: python bench/replay.py <rekaman.jsonl> [--data dir] [--realtime] [--speed X] [--out file.json]")
+        return 0
+
+    src_data = opt("--data", os.path.join(ROOT, "data"))
+    tmp      = tempfile.mkdtemp(prefix="akaru_replay_")
+    work     = os.path.join(tmp, "data")
+    if os.path.isdir(src_data):
+        shutil.copytree(src_data, work, ignore=shutil.ignore_patterns("sessions", "*.sock"))
+    else:
+        os.makedirs(work)
+    os.environ["AKARU_DATA_DIR"] = work  # sebelum import core
+
+    try:
+        from core.recorder import load_recording
+        steps = load_recording(args[0])
+        print(f"[replay] {len(steps)} perintah dari {args[0]} (data: salinan {src_data})")
+        t0   = time.perf_counter()
+        rows = report(replay(steps, realtime="--realtime" in args, speed=float(opt("--speed", "1"))))
+        total = time.perf_counter() - t0
+        from core import perf
+        perf.flush()  # tulis sekarang, sebelum folder sementara dihapus
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"  {'intent'.ljust(16)} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for intent, r in sorted(rows.items(), key=lambda x: -x[1]["p95"]):
+        print(f"  {intent.ljust(16)} {r['count']:>6} {r['p50'] * 1000:9.2f} {r['p95'] * 1000:9.2f}"
+              f" {r['p99'] * 1000:9.2f} {r['max'] * 1000:9.2f}")
+    print(f"[replay] selesai dalam {total:.2f} detik")
+
+    out = opt("--out")
+    if out:
+        with open(out, "w", encoding="utf-8") as f:
+            json.dump({"recording": args[0], "total_s": total, "intents": rows}, f, indent=2)
+        print(f"[replay] hasil → {out}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
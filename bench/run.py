@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# bench/run.py – AKARU Benchmark Suite
+# Ukur hot path core pada dataset sintetis yang makin besar
+#
+# Jalankan: python bench/run.py [--scales 1k,10k,100k] [--out hasil.json]
+#                               [--baseline base.json] [--threshold 0.25]
+#
+# Per target dicatat: wall time (median), peak memory (tracemalloc),
+# dan byte yang ditulis ke folder data.
+
+import os
+import sys
+import io
+import json
+import time
+import shutil
+import tempfile
+import tracemalloc
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Folder data harus diset SEBELUM modul core di-import
+DATA_DIR = tempfile.mkdtemp(prefix="akaru_bench_")
+os.environ["AKARU_DATA_DIR"] = DATA_DIR
+
+from bench.gen import generate, write, parse_scale  # noqa: E402
+
+DEFAULT_SCALES = "1k,10k,100k"
+REPEAT         = 5
+
+ROUTE_SAMPLES = [
+    "catat ide baru", "tugas beli kopi", "selesai 3", "lihat catatan", "status",
+    "summary", "summary minggu", "analisis", "cari python", "lihat mood", "xyz",
+]
+
+# ── Target ────────────────────────────────────────────────
+def _targets(state):
+    from core import memory as M
+    from core.engine import route, execute
+    from core.summary import daily_summary, weekly_summary
+    from core.analyzer import show_analysis, productivity_score
+
+    mem, ctx = state["memory"], state["context"]
+    return [
+        ("route",            lambda: [route(s) for s in ROUTE_SAMPLES]),
+        ("execute_search",   lambda: execute("SEARCH", "cari deploy review", state)),
+        ("daily_summary",    lambda: daily_summary(mem, ctx)),
+        ("weekly_summary",   lambda: weekly_summary(mem, ctx)),
+        ("show_analysis",    lambda: show_analysis(mem)),
+        ("productivity_score", lambda: productivity_score(mem)),
+        ("load_memory",      M.load_memory),
+        ("add_note",         lambda: M.add_note(mem, "catatan benchmark")),
+        # Sama, dengan core/writer aktif: yang diukur hanya jeda sampai prompt kembali
+        ("add_note_wb",      lambda: M.add_note(mem, "catatan benchmark")),
+    ]
+
+def _dir_state():
+    out = {}
+    for name in os.listdir(DATA_DIR):
+        st = os.stat(os.path.join(DATA_DIR, name))
+        out[name] = (st.st_mtime_ns, st.st_size)
+    return out
+
+def _bytes_written(before, after):
+    """Total ukuran file yang berubah/baru — semua store ditulis ulang penuh."""
+    return sum(size for name, (mtime, size) in after.items() if before.get(name) != (mtime, size))
+
+def _measure(fn):
+    from core import writer
+    sink = io.StringIO()
+    times, written = [], 0
+    for _ in range(REPEAT):
+        before = _dir_state()
+        with redirect_stdout(sink):
+            t0 = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - t0)
+        writer.flush()  # no-op kalau write-behind tidak aktif
+        written = _bytes_written(before, _dir_state())
+        sink.seek(0)
+        sink.truncate()
+
+    # Peak memory diukur di run terpisah: tracemalloc memperlambat eksekusi
+    tracemalloc.start()
+    with redirect_stdout(sink):
+        fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    times.sort()
+    return {
+        "wall_s"       : times[len(times) // 2],
+        "min_s"        : times[0],
+        "peak_kb"      : round(peak / 1024, 1),
+        "bytes_written": written,
+    }
+
+def run_scale(label, seed=42):
+    from core import writer
+    from core.engine import load_state
+    n = parse_scale(label)
+    for name in os.listdir(DATA_DIR):
+        os.remove(os.path.join(DATA_DIR, name))
+    write(DATA_DIR, generate(n, seed=seed))
+    state = load_state()
+    results = {}
+    for name, fn in _targets(state):
+        if name.endswith("_wb"):
+            writer.start()
+        try:
+            results[name] = _measure(fn)
+        finally:
+            writer.stop()
+        print(f"  {label:>5}  {name.ljust(20)} {results[name]['wall_s'] * 1000:10.2f} ms"
+              f"  {results[name]['peak_kb']:10.1f} KB  {results[name]['bytes_written']:>10} B")
+    return results
+
+# ── Baseline ──────────────────────────────────────────────
+def compare(current, baseline, threshold):
+    """Return list regresi (scale, target, base_s, now_s) yang lebih lambat dari threshold."""
+    regressions = []
+    for scale, targets in current["results"].items():
+        for name, r in targets.items():
+            base = baseline.get("results", {}).get(scale, {}).get(name)
+            if base and r["wall_s"] > base["wall_s"] * (1 + threshold):
+                regressions.append((scale, name, base["wall_s"], r["wall_s"]))
+    return regressions
+
+def main(args):
+    def opt(flag, default=None):
+        return args[args.index(flag) + 1] if flag in args and args.index(flag) + 1 < len(args) else default
+
+    if "--help" in args:
+        print("Usage: python bench/run.py [--scales 1k,10k,100k] [--out file.json]")
+        print("                           [--baseline file.json] [--threshold 0.25]")
+        return 0
+
+    scales    = opt("--scales", DEFAULT_SCALES).split(",")
+    out       = opt("--out", os.path.join(ROOT, "bench_results.json"))
+    baseline  = opt("--baseline")
+    threshold = float(opt("--threshold", "0.25"))
+
+    print(f"[bench] data sementara: {DATA_DIR}")
+    print(f"  {'skala':>5}  {'target'.ljust(20)} {'wall':>13}  {'peak':>13}  {'ditulis':>12}")
+    current = {
+        "meta": {
+            "time"   : time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python" : sys.version.split()[0],
+            "repeat" : REPEAT,
+        },
+        "results": {label: run_scale(label) for label in scales},
+    }
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(current, f, indent=2)
+    print(f"[bench] hasil → {out}")
+
+    if baseline:
+        with open(baseline, "r", encoding="utf-8") as f:
+            regressions = compare(current, json.load(f), threshold)
+        if regressions:
+            print(f"[bench] REGRESI (> {threshold:.0%} lebih lambat dari baseline):")
+            for scale, name, base_s, now_s in regressions:
+                print(f"  {scale:>5}  {name.ljust(20)} {base_s * 1000:.2f} ms → {now_s * 1000:.2f} ms")
+            return 1
+        print("[bench] Tidak ada regresi terhadap baseline.")
+    return 0
+
+if __name__ == "__main__":
+    try:
+        code = main(sys.argv[1:])
+    finally:
+        shutil.rmtree(DATA_DIR, ignore_errors=True)
+    sys.exit(code)
@@ -7,9 +7,11 @@
 # Atau dari orchestrator: modules.brain.run()
 
 import os
+import json
 import datetime
 
 # ── Import modules ────────────────────────────────────────
+from core import locks
 from modules.analyzer import (
     analisa_mingguan,
     analisa_mood,
@@ -19,6 +21,9 @@ from modules.analyzer import (
     generate_saran,
 )
 from modules.memory_manager import (
+    SHORT_TERM_FILE,
+    LONG_TERM_FILE,
+    MAIN_MEMORY_FILE,
     load_short,
     load_long,
     memory_stats,
@@ -28,9 +33,21 @@ from modules.memory_manager import (
 )
 
 # ── Config ────────────────────────────────────────────────
-INSIGHT_LOG_DIR  = "logs"
-INSIGHT_LOG_FILE = os.path.join(INSIGHT_LOG_DIR, "brain_insights.log")
-EXPORT_DIR       = "exports"
+INSIGHT_LOG_DIR   = "logs"
+INSIGHT_LOG_FILE  = os.path.join(INSIGHT_LOG_DIR, "brain_insights.log")
+INSIGHT_INDEX     = os.path.join(INSIGHT_LOG_DIR, "brain_insights.idx.json")
+INSIGHT_CACHE     = os.path.join(INSIGHT_LOG_DIR, "brain_cache.json")
+INSIGHT_LOG_MAX   = 256 * 1024  # byte, lewat dari ini log di-rotate
+INSIGHT_LOG_KEEP  = 5           # jumlah file rotasi yang disimpan
+EXPORT_DIR        = "exports"
+
+# ── Daemon ────────────────────────────────────────────────
+DAEMON_DAILY_AT       = (21, 0)    # jam auto-log insight harian
+DAEMON_STREAK_EVERY   = 3 * 3600   # cek ulang streak warning walau data diam (detik)
+DAEMON_POLL_MAX       = 5 * 60     # batas interval stat store saat idle (detik)
+
+# File yang jadi input insight — dipakai untuk fingerprint
+INPUT_FILES = (SHORT_TERM_FILE, LONG_TERM_FILE, MAIN_MEMORY_FILE)
 
 # ====================================================
 # A. CORE INSIGHT GENERATOR
@@ -42,6 +59,16 @@ def generate_insight(mode="full"):
     mode: 'full' | 'short' | 'streak' | 'mood'
     Return: string insight siap print/export
     """
+    return _with_header(insight_body(mode))
+
+def _with_header(body):
+    """Header + jam tampil. Jam dibuat saat ditampilkan, tidak ikut di-cache."""
+    now_str = datetime.datetime.now().strftime("%d %b %Y, %H:%M")
+    header  = ["=" * 50, "  SHADOW BRAIN INSIGHT v2.0", f"  {now_str}", "=" * 50]
+    return "\n".join(header) + "\n" + body
+
+def insight_body(mode="full"):
+    """Isi insight tanpa header (bagian yang di-cache per fingerprint input)."""
     # Sync dulu biar data fresh
     sync_from_main()
     update_streak()
@@ -56,16 +83,8 @@ def generate_insight(mode="full"):
     weekly  = analisa_mingguan()
     saran   = generate_saran(stats, mood, streak, jam)
 
-    now_str = datetime.datetime.now().strftime("%d %b %Y, %H:%M")
-
     lines = []
 
-    # ── Header ────────────────────────────────────────────
-    lines.append("=" * 50)
-    lines.append("  SHADOW BRAIN INSIGHT v2.0")
-    lines.append(f"  {now_str}")
-    lines.append("=" * 50)
-
     if mode in ("full", "short"):
         # ── Memory summary ────────────────────────────────
         lines.append("")
@@ -171,15 +190,147 @@ def export_insight(content, fmt="txt"):
         with open(path, "w", encoding="utf-8") as f:
             f.write(content)
     elif fmt == "log":
-        path = INSIGHT_LOG_FILE
-        os.makedirs(INSIGHT_LOG_DIR, exist_ok=True)
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(content + "\n\n")
+        path = _append_insight_log(content)
     else:
         raise ValueError(f"Format tidak dikenal: {fmt}")
 
     return path
 
+# ====================================================
+# B2. INSIGHT LOG (rotasi + index per tanggal)
+# ====================================================
+
+def _load_index():
+    try:
+        with open(INSIGHT_INDEX, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _save_index(index):
+    os.makedirs(INSIGHT_LOG_DIR, exist_ok=True)
+    tmp = INSIGHT_INDEX + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, INSIGHT_INDEX)
+
+def _rotate_log(index):
+    """
+    Pindahkan log aktif ke file bertimestamp kalau sudah lewat batas.
+    Nama file rotasi tidak pernah digeser, jadi offset di index tetap valid.
+    """
+    try:
+        if os.path.getsize(INSIGHT_LOG_FILE) < INSIGHT_LOG_MAX:
+            return
+    except OSError:
+        return
+
+    stamp   = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    rotated = f"brain_insights.{stamp}.log"
+    os.replace(INSIGHT_LOG_FILE, os.path.join(INSIGHT_LOG_DIR, rotated))
+    active  = os.path.basename(INSIGHT_LOG_FILE)
+    for refs in index.values():
+        for ref in refs:
+            if ref[0] == active:
+                ref[0] = rotated
+
+    # Retensi: buang file rotasi paling lama
+    olds = sorted(
+        f for f in os.listdir(INSIGHT_LOG_DIR)
+        if f.startswith("brain_insights.") and f.endswith(".log") and f != active
+    )
+    for old in olds[:max(len(olds) - INSIGHT_LOG_KEEP, 0)]:
+        os.remove(os.path.join(INSIGHT_LOG_DIR, old))
+        for day in list(index):
+            index[day] = [r for r in index[day] if r[0] != old]
+            if not index[day]:
+                del index[day]
+
+def _append_insight_log(content):
+    """Append insight ke log + catat offset-nya di index. Return path log."""
+    os.makedirs(INSIGHT_LOG_DIR, exist_ok=True)
+    # Rotasi + append + index satu kesatuan: dua proses brain tidak saling
+    # menimpa index atau mencatat offset yang sama
+    with locks.exclusive(INSIGHT_LOG_FILE):
+        index = _load_index()
+        _rotate_log(index)
+
+        raw = (content + "\n\n").encode("utf-8")
+        with open(INSIGHT_LOG_FILE, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(raw)
+
+        day = datetime.datetime.now().strftime("%Y-%m-%d")
+        index.setdefault(day, []).append(
+            [os.path.basename(INSIGHT_LOG_FILE), offset, len(raw)]
+        )
+        _save_index(index)
+    return INSIGHT_LOG_FILE
+
+def lookup_insight(day):
+    """
+    Ambil semua insight yang di-log pada tanggal `day` (YYYY-MM-DD).
+    Baca langsung lewat offset di index, tanpa scan seluruh log.
+    """
+    found = []
+    for name, offset, length in _load_index().get(day, []):
+        try:
+            with open(os.path.join(INSIGHT_LOG_DIR, name), "rb") as f:
+                f.seek(offset)
+                found.append(f.read(length).decode("utf-8").rstrip())
+        except OSError:
+            continue
+    return found
+
+# ====================================================
+# B3. INSIGHT CACHE (fingerprint input)
+# ====================================================
+
+def input_fingerprint(mode="full"):
+    """
+    Fingerprint murah dari input insight: mtime + size tiap store, tanggal, mode.
+    Tidak baca isi file sama sekali.
+    """
+    parts = [datetime.datetime.now().strftime("%Y-%m-%d"), mode]
+    for path in INPUT_FILES:
+        try:
+            st = os.stat(path)
+            parts.append(f"{path}:{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append(f"{path}:-")
+    return "|".join(parts)
+
+def _load_cache():
+    try:
+        with open(INSIGHT_CACHE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _save_cache(cache):
+    os.makedirs(INSIGHT_LOG_DIR, exist_ok=True)
+    tmp = INSIGHT_CACHE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp, INSIGHT_CACHE)
+
+def cached_insight(mode="full"):
+    """
+    Return (insight, fresh).
+    fresh=False → input tidak berubah sejak run terakhir, isi diambil dari cache.
+    Header (jam tampil) selalu dibuat baru, hanya isinya yang di-cache.
+    """
+    cache = _load_cache()
+    entry = cache.get(mode)
+    if entry and entry.get("fp") == input_fingerprint(mode) and "body" in entry:
+        return _with_header(entry["body"]), False
+
+    body = insight_body(mode=mode)
+    # Fingerprint diambil SETELAH generate: sync/streak bisa ikut menulis store
+    cache[mode] = {"fp": input_fingerprint(mode), "body": body}
+    _save_cache(cache)
+    return _with_header(body), True
+
 # ====================================================
 # C. AUTO-LOG (dipanggil dari orchestrator/scheduler)
 # ====================================================
@@ -188,9 +339,13 @@ def auto_log_insight():
     """
     Generate insight 'short' dan append ke brain_insights.log.
     Cocok dipanggil dari scheduler/orchestrator tiap hari.
+    Kalau data tidak berubah, tidak ada append duplikat.
     """
-    content = generate_insight(mode="short")
-    path    = export_insight(content, fmt="log")
+    content, fresh = cached_insight(mode="short")
+    if not fresh:
+        print("[Brain] Data tidak berubah, auto-log dilewati.")
+        return None
+    path = export_insight(content, fmt="log")
     print(f"[Brain] Auto-log saved → {path}")
     return path
 
@@ -201,7 +356,7 @@ def auto_log_insight():
 def streak_report():
     """
     Quick report hanya fokus ke streak + warning.
-    Dipanggil dari triggers.py atau watchdog.
+    Rule streak_warning di modules/triggers.py memakai analisa yang sama.
     """
     update_streak()
     streak = analisa_streak()
@@ -217,7 +372,7 @@ def streak_report():
 # ====================================================
 
 def mood_report(days=7):
-    """Quick report fokus mood. Bisa dipanggil dari triggers.py."""
+    """Quick report fokus mood. Alert otomatis: rule mood_drop di modules/triggers.py."""
     mood  = analisa_mood(days=days)
     lines = [f"[ MOOD REPORT ({days} hari terakhir) ]"]
     dist  = mood["distribution"]
@@ -257,11 +412,14 @@ def run(mode="full", export=False):
     mode   : 'full' | 'short' | 'streak' | 'mood'
     export : True → simpan ke file TXT sekaligus
     """
-    insight = generate_insight(mode=mode)
+    insight, fresh = cached_insight(mode=mode)
     print(insight)
 
-    # Auto-append ke log setiap kali run
-    export_insight(insight, fmt="log")
+    # Auto-append ke log hanya kalau report baru
+    if fresh:
+        export_insight(insight, fmt="log")
+    else:
+        print("\n[Brain] Data tidak berubah sejak run terakhir (cache).")
 
     # Export ke TXT kalau diminta
     if export:
@@ -270,6 +428,49 @@ def run(mode="full", export=False):
 
     return insight
 
+# ====================================================
+# G2. DAEMON (proses resident + scheduler internal)
+# ====================================================
+
+def _daemon_jobs(sched):
+    """Insight harian terjadwal jam; sisanya dipicu perubahan store (modules/triggers)."""
+    from modules.triggers import TriggerEngine, brain_rules
+
+    engine = TriggerEngine(brain_rules(streak_every=DAEMON_STREAK_EVERY),
+                           poll_max=DAEMON_POLL_MAX)
+    sched.daily(*DAEMON_DAILY_AT, auto_log_insight, name="daily_insight")
+    sched.adaptive(engine.tick, name="triggers")
+    return engine
+
+def daemon():
+    """
+    Jalankan brain sebagai proses resident.
+    Semua job diatur scheduler heap; di antara job proses cuma tidur.
+    Streak warning, promote & mood drop hanya dievaluasi saat store-nya berubah.
+    """
+    import signal
+    from modules.scheduler import Scheduler
+
+    sched  = Scheduler()
+    engine = _daemon_jobs(sched)
+
+    def _stop(signum, frame):
+        sched.stop()
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, _stop)
+    print(f"[Brain] Daemon aktif (pid {os.getpid()}). Ctrl+C untuk berhenti.")
+    for when, name in sched.pending():
+        at = datetime.datetime.fromtimestamp(when).strftime("%d %b %H:%M")
+        print(f"  - {name.ljust(16)} berikutnya {at}")
+    try:
+        sched.run()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    print(f"[Brain] Daemon berhenti ({engine.polls} poll store).")
+    for name, runs, deferred, _ in engine.status():
+        print(f"  - {name.ljust(16)} {runs}x jalan, {deferred}x tertahan rate limit")
+
 # ====================================================
 # H. CLI LANGSUNG
 # ====================================================
@@ -288,10 +489,29 @@ if __name__ == "__main__":
 
     if "--help" in args:
         print("Usage: python brain.py [--short|--streak|--mood] [--export]")
+        print("       python brain.py --date YYYY-MM-DD")
+        print("       python brain.py --daemon")
         print("  --short   Insight ringkas (memory + streak)")
         print("  --streak  Hanya laporan streak")
         print("  --mood    Hanya laporan mood")
         print("  --export  Simpan insight ke file TXT di exports/")
+        print("  --date    Tampilkan insight yang di-log pada tanggal itu")
+        print("  --daemon  Proses resident: insight harian + trigger streak/promote/mood")
+        sys.exit(0)
+
+    if "--daemon" in args:
+        daemon()
+        sys.exit(0)
+
+    if "--date" in args:
+        i   = args.index("--date")
+        day = args[i + 1] if i + 1 < len(args) else datetime.datetime.now().strftime("%Y-%m-%d")
+        reports = lookup_insight(day)
+        if not reports:
+            print(f"[Brain] Tidak ada insight untuk {day}.")
+        for r in reports:
+            print(r)
+            print()
         sys.exit(0)
 
     run(mode=mode, export=export)
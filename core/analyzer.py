@@ -4,14 +4,23 @@
 
 from datetime import datetime, timedelta
 from collections import Counter
-from core.config import LOG_FILE, MOOD_FILE, load_json
+from core.config import LOG_FILE, MOOD_FILE, load_json_view, iter_json_array
 from core import display as D
+from core import membudget
 
 def _load_logs():
-    return load_json(LOG_FILE, [])
+    return load_json_view(LOG_FILE, ())
 
 def _load_mood():
-    return load_json(MOOD_FILE, [])
+    return load_json_view(MOOD_FILE, ())
+
+# Semua analisis di bawah cukup satu kali lewat data, jadi saat mode
+# hemat RAM sumbernya bisa diganti iterator streaming.
+def _iter_logs():
+    return iter_json_array(LOG_FILE) if membudget.low_mem() else _load_logs()
+
+def _iter_mood():
+    return iter_json_array(MOOD_FILE) if membudget.low_mem() else _load_mood()
 
 def _parse_date(iso):
     try:
@@ -29,21 +38,20 @@ def productivity_score(memory):
     """
     tasks  = memory.get("tasks", [])
     notes  = memory.get("notes", [])
-    logs   = _load_logs()
 
     # 1. Task completion ratio
     total = len(tasks)
-    done  = len([t for t in tasks if t.get("done")])
+    done  = sum(1 for t in tasks if t.get("done"))
     task_score = int((done / total) * 40) if total > 0 else 0
 
     # 2. Notes this week
     week_ago = (datetime.now() - timedelta(days=7)).isoformat()
-    recent_notes = [n for n in notes if n.get("t", "") >= week_ago]
-    note_score = min(len(recent_notes) * 6, 30)  # cap 30
+    notes_week = sum(1 for n in notes if n.get("t", "") >= week_ago)
+    note_score = min(notes_week * 6, 30)  # cap 30
 
     # 3. Active days streak (from logs, last 14 days)
     active_days = set()
-    for entry in logs:
+    for entry in _iter_logs():
         d = _parse_date(entry.get("t", ""))
         if d:
             active_days.add(d)
@@ -66,17 +74,14 @@ def productivity_score(memory):
         "streak_days"  : streak,
         "done_tasks"   : done,
         "total_tasks"  : total,
-        "notes_week"   : len(recent_notes),
+        "notes_week"   : notes_week,
     }
 
 # ── Pola Aktivitas ────────────────────────────────────────
 def activity_pattern():
     """Jam paling aktif berdasarkan log."""
-    logs = _load_logs()
-    if not logs:
-        return None
     hours = []
-    for entry in logs:
+    for entry in _iter_logs():
         try:
             h = datetime.fromisoformat(entry["t"]).hour
             hours.append(h)
@@ -102,30 +107,31 @@ def _hour_label(h):
 
 # ── Intent Distribution ───────────────────────────────────
 def intent_distribution():
-    logs = _load_logs()
-    intents = [e.get("i", "?") for e in logs]
-    return dict(Counter(intents).most_common(8))
+    return dict(Counter(e.get("i", "?") for e in _iter_logs()).most_common(8))
 
 # ── Mood Correlation ──────────────────────────────────────
 def mood_vs_productivity():
     """Rata-rata mood pada hari aktif vs tidak aktif."""
-    mood_data = _load_mood()
-    logs      = _load_logs()
-    if not mood_data or not logs:
-        return None
-
     active_dates = set()
-    for e in logs:
+    for e in _iter_logs():
         d = _parse_date(e.get("t", ""))
         if d:
             active_dates.add(d)
+    if not active_dates:
+        return None
 
-    active_moods   = [e["mood"] for e in mood_data if e.get("date") in active_dates]
-    inactive_moods = [e["mood"] for e in mood_data if e.get("date") not in active_dates]
+    # [jumlah, total] — akumulator, tanpa list perantara
+    active, inactive = [0, 0], [0, 0]
+    for e in _iter_mood():
+        acc = active if e.get("date") in active_dates else inactive
+        acc[0] += 1
+        acc[1] += e["mood"]
+    if not active[0] and not inactive[0]:
+        return None
 
     return {
-        "active_avg"  : round(sum(active_moods)   / len(active_moods),   1) if active_moods   else None,
-        "inactive_avg": round(sum(inactive_moods) / len(inactive_moods), 1) if inactive_moods else None,
+        "active_avg"  : round(active[1]   / active[0],   1) if active[0]   else None,
+        "inactive_avg": round(inactive[1] / inactive[0], 1) if inactive[0] else None,
     }
 
 # ── Display Analyzer ─────────────────────────────────────
@@ -162,6 +168,26 @@ def show_analysis(memory):
             bar_s = D.c("▪" * bar_w, D.CYAN)
             print(f"    {intent.ljust(16)} {bar_s} {D.c(count, D.GRAY)}")
 
+    # Tag terbanyak (hitungan dari index tag, tanpa scan teks)
+    from core import tags
+    top = tags.top_tags(memory, 5)
+    if top:
+        D.blank()
+        print(f"  {D.c('Tag terbanyak:', D.GRAY)}")
+        for tag, count in top:
+            bar_s = D.c("▪" * min(count, 20), D.MAGENTA)
+            print(f"    {('#' + tag).ljust(16)} {bar_s} {D.c(count, D.GRAY)}")
+
+    # Topik per minggu (TF-IDF dari sidecar topics.json, tanpa hitung ulang korpus)
+    from core.topics import recent_weeks
+    weeks = recent_weeks(memory, weeks=4, n=3)
+    if weeks:
+        D.blank()
+        print(f"  {D.c('Topik per minggu:', D.GRAY)}")
+        for wk, top in weeks:
+            words = ", ".join(w for w, _ in top)
+            print(f"    {wk.ljust(16)} {D.c(words, D.CYAN)}")
+
     # Mood vs produktivitas
     corr = mood_vs_productivity()
     if corr and corr["active_avg"] and corr["inactive_avg"]:
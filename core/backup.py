@@ -0,0 +1,343 @@
+# core/backup.py
+# AKARU – Backup Inkremental data/ (chunk content-addressed + zlib)
+# Tiap file di data/ dipotong jadi chunk berdasarkan isinya, bukan offset:
+# batas chunk jatuh setelah baris yang crc32-nya cocok dengan MASK (minimal
+# CHUNK_MIN, maksimal CHUNK_MAX byte). Menyisipkan satu catatan hanya mengubah
+# chunk di sekitarnya — chunk lain tetap sama hash-nya dan tidak disimpan lagi.
+#
+#   backup/chunks/ab/<hash>   isi chunk, zlib (nama = blake2b isi mentah)
+#   backup/snaps/<id>.json    manifest: file → (mtime_ns, ukuran, [hash chunk])
+#
+# File yang mtime & ukurannya sama dengan backup terakhir tidak dibaca sama
+# sekali — manifest lama dipakai ulang. Backup harian dataset besar yang hanya
+# berubah sedikit = stat semua file + baca file yang berubah saja.
+#
+# Retensi (config): backup_last terakhir, lalu backup_daily harian,
+# backup_weekly mingguan, backup_monthly bulanan; sisanya dipangkas, lalu
+# chunk yatim dihapus.
+#
+#   akaru backup                      buat backup sekarang
+#   akaru backup daftar               semua titik backup
+#   akaru backup pulih <id|waktu> [file…]   pulihkan (waktu: 2026-10-18[T21:00])
+#   akaru backup pangkas              terapkan retensi sekarang
+
+import hashlib
+import json
+import os
+import re
+import zlib
+from datetime import datetime
+from core.config import DATA_DIR, BACKUP_DIR, load_config, write_bytes
+from core import locks
+from core.locks import LOCK_DIR, GEN_FILE
+
+BACKUP_VERSION = 1
+CHUNK_MIN   = 32 * 1024     # chunk terkompresi ±6 KB: tidak boros blok 4 KB flash
+CHUNK_MAX   = 256 * 1024
+MASK        = 0x3F          # rata-rata batas tiap ±64 baris setelah CHUNK_MIN
+LEVEL       = 6
+SKIP_SUFFIX = (".tmp", ".snap", ".sock")   # cache turunan & file sementara
+SKIP_NAMES  = (GEN_FILE,)                  # counter milik proses yang sedang jalan
+
+CHUNK_DIR = os.path.join(BACKUP_DIR, "chunks")
+SNAP_DIR  = os.path.join(BACKUP_DIR, "snaps")
+
+# ── Chunking ──────────────────────────────────────────────
+def chunks(data):
+    """Potong bytes jadi chunk content-defined (batas di akhir baris)."""
+    out, start, n = [], 0, len(data)
+    crc, find = zlib.crc32, data.find
+    while n - start > CHUNK_MIN:
+        # Baris sebelum CHUNK_MIN tidak pernah jadi batas → langsung lompat;
+        # yang dicek hanya ±(MASK+1) baris kandidat per chunk (find di C)
+        limit = start + CHUNK_MAX
+        pos   = start + CHUNK_MIN
+        line  = max(start, data.rfind(b"\n", start, pos) + 1)
+        while True:
+            nl = find(b"\n", pos, limit)
+            if nl == -1:
+                cut = min(limit, n)     # baris raksasa / file biner
+                break
+            if not crc(data[line:nl]) & MASK:
+                cut = nl + 1
+                break
+            line = pos = nl + 1
+        out.append(data[start:cut])
+        start = cut
+    if start < n:
+        out.append(data[start:])
+    return out
+
+def _digest(raw):
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+def _chunk_path(h):
+    return os.path.join(CHUNK_DIR, h[:2], h)
+
+def _put_chunk(h, raw):
+    """Simpan chunk kalau belum ada. Return byte terkompresi yang ditulis (0 = sudah ada)."""
+    path = _chunk_path(h)
+    if os.path.exists(path):
+        return 0
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    comp = zlib.compress(raw, LEVEL)
+    tmp  = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(comp)
+    os.replace(tmp, path)
+    return len(comp)
+
+def _get_chunk(h):
+    with open(_chunk_path(h), "rb") as f:
+        raw = zlib.decompress(f.read())
+    if _digest(raw) != h:
+        raise ValueError(f"chunk rusak: {h}")
+    return raw
+
+# ── Manifest ──────────────────────────────────────────────
+def _files():
+    """relpath → os.stat untuk file biasa di data/ (tanpa folder backup & cache)."""
+    out  = {}
+    skip = os.path.abspath(BACKUP_DIR)
+    for root, dirs, names in os.walk(DATA_DIR):
+        dirs[:] = [d for d in dirs if d != LOCK_DIR and os.path.abspath(os.path.join(root, d)) != skip]
+        for name in names:
+            if name.endswith(SKIP_SUFFIX) or name in SKIP_NAMES:
+                continue
+            path = os.path.join(root, name)
+            st   = os.lstat(path)
+            if os.path.isfile(path) and not os.path.islink(path):
+                out[os.path.relpath(path, DATA_DIR)] = st
+    return out
+
+def _write_json(path, obj):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+def snapshots():
+    """[id] terurut lama → baru. Id = YYYYMMDD-HHMMSS[-n], jadi urut string = urut waktu."""
+    try:
+        names = os.listdir(SNAP_DIR)
+    except FileNotFoundError:
+        return []
+    return sorted(n[:-5] for n in names if n.endswith(".json"))
+
+def manifest(snap_id):
+    with open(os.path.join(SNAP_DIR, snap_id + ".json"), encoding="utf-8") as f:
+        m = json.load(f)
+    if m.get("v") != BACKUP_VERSION:
+        raise ValueError(f"versi backup {snap_id} tidak dikenal")
+    return m
+
+def _new_id(now):
+    base = now.strftime("%Y%m%d-%H%M%S")
+    sid, n = base, 1
+    while os.path.exists(os.path.join(SNAP_DIR, sid + ".json")):
+        n += 1
+        sid = f"{base}-{n}"
+    return sid
+
+# ── Backup ────────────────────────────────────────────────
+def create(prune_after=True):
+    """Backup data/ sekarang. Return dict statistik (id, file, dibaca, chunk baru, byte)."""
+    from core import writer
+    writer.flush()   # antrian write-behind harus sudah di disk
+    os.makedirs(SNAP_DIR, exist_ok=True)
+    ids   = snapshots()
+    prev  = manifest(ids[-1])["files"] if ids else {}
+    now   = datetime.now()
+    files = {}
+    stats = {"files": 0, "read": 0, "chunks": 0, "new_chunks": 0,
+             "bytes": 0, "stored": 0}
+    for rel, st in sorted(_files().items()):
+        key = [st.st_mtime_ns, st.st_size]
+        old = prev.get(rel)
+        stats["files"] += 1
+        stats["bytes"] += st.st_size
+        if old and old["stat"] == key:
+            files[rel] = old
+            stats["chunks"] += len(old["chunks"])
+            continue
+        try:
+            with open(os.path.join(DATA_DIR, rel), "rb") as f:
+                data = f.read()
+        except OSError:
+            continue   # hilang di tengah jalan
+        hashes = []
+        for raw in chunks(data):
+            h = _digest(raw)
+            written = _put_chunk(h, raw)
+            if written:
+                stats["new_chunks"] += 1
+                stats["stored"]     += written
+            hashes.append(h)
+        files[rel] = {"stat": key, "chunks": hashes}
+        stats["read"]   += 1
+        stats["chunks"] += len(hashes)
+    sid = _new_id(now)
+    _write_json(os.path.join(SNAP_DIR, sid + ".json"),
+                {"v": BACKUP_VERSION, "t": now.isoformat(timespec="seconds"),
+                 "files": files, "stats": stats})
+    stats["id"] = sid
+    if prune_after:
+        stats["pruned"] = prune()[0]
+    return stats
+
+# ── Retensi ───────────────────────────────────────────────
+def _keep(ids, cfg):
+    """Id yang dipertahankan: terbaru per hari/minggu/bulan sesuai config."""
+    rules = (
+        (cfg.get("backup_daily", 7),    lambda d: d.strftime("%Y-%m-%d")),
+        (cfg.get("backup_weekly", 4),   lambda d: "%d-W%02d" % d.isocalendar()[:2]),
+        (cfg.get("backup_monthly", 12), lambda d: d.strftime("%Y-%m")),
+    )
+    keep = set(ids[-max(1, cfg.get("backup_last", 5)):])   # terbaru tidak pernah dipangkas
+    for limit, period in rules:
+        seen = set()
+        for sid in reversed(ids):
+            p = period(datetime.strptime(sid[:15], "%Y%m%d-%H%M%S"))
+            if p in seen:
+                continue
+            if len(seen) >= limit:
+                break
+            seen.add(p)
+            keep.add(sid)
+    return keep
+
+def prune(cfg=None):
+    """Hapus backup di luar retensi lalu chunk yang tidak dirujuk lagi. Return (backup, chunk)."""
+    ids  = snapshots()
+    keep = _keep(ids, cfg or load_config())
+    gone = [sid for sid in ids if sid not in keep]
+    for sid in gone:
+        os.remove(os.path.join(SNAP_DIR, sid + ".json"))
+    if not gone:
+        return 0, 0
+    # Mark & sweep: chunk yang dirujuk backup tersisa
+    live = set()
+    for sid in keep:
+        for f in manifest(sid)["files"].values():
+            live.update(f["chunks"])
+    swept = 0
+    for sub in (os.listdir(CHUNK_DIR) if os.path.isdir(CHUNK_DIR) else ()):
+        folder = os.path.join(CHUNK_DIR, sub)
+        for name in os.listdir(folder):
+            if name not in live:
+                os.remove(os.path.join(folder, name))
+                swept += 1
+    return len(gone), swept
+
+# ── Restore ───────────────────────────────────────────────
+_TIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}(T\d{2}(:\d{2}){0,2})?$")
+
+def resolve(point):
+    """Id persis, atau waktu (YYYY-MM-DD[THH:MM]) → backup terakhir pada/sebelum waktu itu."""
+    ids = snapshots()
+    if point in ids:
+        return point
+    if not _TIME_RE.match(point or ""):
+        return None
+    # '2026-10-18' berarti sampai akhir hari itu
+    t = datetime.fromisoformat(point if "T" in point else point + "T23:59:59")
+    key = t.strftime("%Y%m%d-%H%M%S") + "~"   # '~' > '-n': ikut id dengan akhiran
+    cand = [sid for sid in ids if sid <= key]
+    return cand[-1] if cand else None
+
+def restore(snap_id, only=None):
+    """
+    Tulis ulang file dari backup (atomik per file). only: relpath yang dipulihkan
+    (default semua). File yang tidak ada di backup dibiarkan. Return jumlah file.
+    Seluruh pemulihan di dalam transaksi data/, tiap file lewat write_bytes
+    (lock + bump generation) — sesi lain memuat ulang, tidak menimpa balik.
+    """
+    from core import writer
+    files = manifest(snap_id)["files"]
+    if only:
+        missing = [p for p in only if p not in files]
+        if missing:
+            raise ValueError("tidak ada di backup: " + ", ".join(missing))
+        files = {p: files[p] for p in only}
+    files = {rel: f for rel, f in files.items() if os.path.basename(rel) not in SKIP_NAMES}
+    with locks.transaction(DATA_DIR):
+        writer.flush()   # antrian lama tidak boleh menimpa hasil pulih
+        for rel, f in files.items():
+            path = os.path.join(DATA_DIR, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_bytes(path, (_get_chunk(h) for h in f["chunks"]))
+    return len(files)
+
+# ── Tampilan & CLI ────────────────────────────────────────
+def _kb(n):
+    return f"{n / 1024:.1f} KB" if n < 1024 * 1024 else f"{n / 1024 / 1024:.1f} MB"
+
+def show_create():
+    from core import display as D
+    st = create()
+    D.ok(f"Backup {st['id']}: {st['files']} file ({_kb(st['bytes'])}), "
+         f"{st['read']} berubah, {st['new_chunks']}/{st['chunks']} chunk baru, "
+         f"+{_kb(st['stored'])} tersimpan")
+    if st.get("pruned"):
+        D.dim(f"{st['pruned']} backup lama dipangkas (retensi).")
+    return st
+
+def show_list():
+    from core import display as D
+    ids = snapshots()
+    D.header("BACKUP", D.CYAN)
+    if not ids:
+        D.dim("Belum ada backup. Ketik 'backup'.")
+        D.sep()
+        return
+    for sid in ids:
+        m  = manifest(sid)
+        st = m.get("stats", {})
+        print(f"  {D.c(sid, D.MAGENTA, D.BOLD)}  {D.c(m['t'][:16].replace('T', ' '), D.GRAY)}  "
+              f"{len(m['files'])} file · {_kb(st.get('bytes', 0))} · +{_kb(st.get('stored', 0))}")
+    D.blank()
+    D.dim(f"Folder: {BACKUP_DIR}")
+    D.sep()
+
+def main(args):
+    from core import display as D
+    from core.config import ensure_data_dir
+    ensure_data_dir()
+    cmd = args[0] if args else ""
+    try:
+        if not cmd:
+            show_create()
+        elif cmd in ("daftar", "list"):
+            show_list()
+        elif cmd in ("pangkas", "prune"):
+            n, c = prune()
+            D.ok(f"{n} backup & {c} chunk dihapus.")
+        elif cmd in ("pulih", "restore") and len(args) >= 2:
+            from core.server import connect
+            sock = connect()
+            if sock:
+                sock.close()
+                D.err("Server aktif — matikan dulu sebelum memulihkan backup.")
+                return 1
+            sid = resolve(args[1])
+            if sid is None:
+                D.err(f"Tidak ada backup untuk '{args[1]}'.")
+                return 1
+            missing = [p for p in args[2:] if p not in manifest(sid)["files"]]
+            if missing:
+                D.err(f"Tidak ada di backup {sid}: {', '.join(missing)}")
+                return 1
+            if not D.confirm(f"Pulihkan data dari backup {sid}? (y/N): "):
+                D.dim("Dibatalkan.")
+                return 0
+            with locks.transaction(DATA_DIR):   # tidak ada tulisan di antara keduanya
+                safety = create(prune_after=False)["id"]   # pemulihan bisa dibatalkan
+                n = restore(sid, args[2:] or None)
+            D.ok(f"{n} file dipulihkan dari {sid}. Data sebelumnya: backup {safety}.")
+        else:
+            print("Usage: akaru backup [daftar | pangkas | pulih <id|YYYY-MM-DD[THH:MM]> [file…]]")
+            return 1
+    except (OSError, ValueError, zlib.error) as e:
+        D.err(f"Backup gagal: {e}")
+        return 1
+    return 0
@@ -0,0 +1,336 @@
+# core/binlog.py
+# AKARU – Binary Record Log (opsional, config `binary_logs: true`)
+# Mood & log aktivitas sebagai record biner lebar tetap (struct) +
+# string heap terpisah untuk teks bebas (catatan mood, intent, note log).
+#
+#   data/mood.bin  + mood.heap   → semua check-in mood
+#   data/log.bin   + log.heap    → riwayat aktivitas PENUH (log.json dipangkas max_logs)
+#
+# Record ke-k ada di offset HEADER + k * size, jadi N terakhir cukup satu seek,
+# dan rentang waktu dicari dengan binary search di atas mmap tanpa parse.
+# JSON tetap bisa diekspor: python -m core.binlog export mood|log <file.json>
+#
+# Waktu disimpan sebagai integer YYYYMMDDhhmmss (dari ISO lokal): terurut,
+# lossless, tanpa urusan zona waktu.
+
+import os
+import sys
+import json
+import mmap
+import struct
+from core.config import (
+    DATA_DIR, MOOD_FILE, LOG_FILE, ensure_data_dir, io_stats,
+    in_batch, after_commit, register_abort_hook,
+)
+from core import events
+
+MAGIC   = b"AKBN"
+VERSION = 1
+HEADER  = struct.Struct("<4sHH8s")   # magic, versi, ukuran record, jenis
+NONE    = 0xFFFF                     # panjang string = NONE → field tidak ada
+
+# ── Waktu ─────────────────────────────────────────────────
+def pack_time(iso):
+    """'2026-10-19T08:30:05' → 20261019083005. Format lain → 0."""
+    digits = "".join(ch for ch in (iso or "")[:19] if ch.isdigit())
+    return int(digits.ljust(14, "0")) if len(digits) >= 8 else 0
+
+def unpack_time(v):
+    s = f"{v:014d}"
+    return f"{s[0:4]}-{s[4:6]}-{s[6:8]}T{s[8:10]}:{s[10:12]}:{s[12:14]}"
+
+# ── Store ─────────────────────────────────────────────────
+class BinStore:
+    """
+    Satu file record lebar tetap + satu file heap.
+    Subclass mengisi KIND, RECORD (struct) dan encode/decode.
+    Record selalu ditulis SETELAH string-nya ada di heap; record terpotong
+    di ujung file (crash) diabaikan dan ditimpa saat append berikutnya.
+    """
+    KIND   = b""
+    RECORD = None
+
+    def __init__(self, path):
+        self.path      = path
+        self.heap_path = os.path.splitext(path)[0] + ".heap"
+        self._strings  = None   # str → (offset, len) untuk string berulang (intent)
+
+    # ── Layout ────────────────────────────────────────────
+    def _header(self):
+        return HEADER.pack(MAGIC, VERSION, self.RECORD.size, self.KIND)
+
+    def _check(self, f):
+        head = f.read(HEADER.size)
+        if head != self._header():
+            raise ValueError(f"{self.path}: bukan store {self.KIND.decode().strip()} v{VERSION}")
+
+    def count(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return 0
+        return max(size - HEADER.size, 0) // self.RECORD.size
+
+    # ── Heap ──────────────────────────────────────────────
+    def _put(self, heap, text, dedup=False):
+        if text is None:
+            return 0, NONE
+        if dedup and text in self._strings:
+            return self._strings[text]
+        raw = text.encode("utf-8")[:NONE - 1]
+        ref = (heap.seek(0, os.SEEK_END), len(raw))
+        heap.write(raw)
+        io_stats["write_b"] += len(raw)
+        if dedup:
+            self._strings[text] = ref
+        return ref
+
+    def _load_strings(self, fields):
+        """Peta string berulang yang sudah ada di heap (sekali per proses)."""
+        self._strings = {}
+        refs = {(r[o], r[n]) for r in self._records(0, self.count())
+                for o, n in fields if r[n] != NONE}
+        if not refs:
+            return
+        with open(self.heap_path, "rb") as heap:
+            for off, ln in sorted(refs):
+                heap.seek(off)
+                self._strings.setdefault(heap.read(ln).decode("utf-8"), (off, ln))
+
+    # ── Tulis ─────────────────────────────────────────────
+    def append(self, entry):
+        self.extend([entry])
+
+    def extend(self, entries):
+        ensure_data_dir()
+        if self._strings is None:
+            self._load_strings(self.DEDUP)
+        with open(self.heap_path, "ab") as heap, open(self.path, "ab") as f:
+            end = f.seek(0, os.SEEK_END)
+            if end < HEADER.size:
+                # Baru, atau crash sebelum header utuh tertulis
+                f.truncate(0)
+                f.write(self._header())
+            else:
+                # Buang record terpotong di ujung (sisa crash) sebelum menulis
+                keep = HEADER.size + self.count() * self.RECORD.size
+                if end > keep:
+                    f.truncate(keep)
+            rows = [self.RECORD.pack(*self.encode(e, heap)) for e in entries]
+            heap.flush()   # string harus sudah di disk sebelum record yang menunjuknya
+            raw = b"".join(rows)
+            f.write(raw)
+        io_stats["write_b"] += len(raw)
+        io_stats["saves"]   += 1
+
+    # ── Baca ──────────────────────────────────────────────
+    def _records(self, start, stop):
+        """Tuple mentah record [start, stop) — satu seek, satu read."""
+        if stop <= start:
+            return []
+        with open(self.path, "rb") as f:
+            self._check(f)
+            f.seek(HEADER.size + start * self.RECORD.size)
+            raw = f.read((stop - start) * self.RECORD.size)
+        io_stats["read_b"] += len(raw)
+        usable = len(raw) - len(raw) % self.RECORD.size
+        return list(self.RECORD.iter_unpack(raw[:usable]))
+
+    def _decode_all(self, recs):
+        if not recs:
+            return []
+        with open(self.heap_path, "rb") as heap:
+            hm = mmap.mmap(heap.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(self.heap_path) else b""
+            try:
+                return [self.decode(r, hm) for r in recs]
+            finally:
+                if hm:
+                    hm.close()
+
+    def tail(self, n):
+        """n record terakhir, tanpa membaca sisa file."""
+        total = self.count()
+        return self._decode_all(self._records(max(total - n, 0), total))
+
+    def range(self, since=None, until=None):
+        """
+        Record dengan waktu di [since, until) (string ISO / tanggal, opsional).
+        Binary search di atas mmap: hanya record di rentang yang di-unpack.
+        """
+        total = self.count()
+        if not total:
+            return []
+        lo_t = pack_time(since) if since else 0
+        hi_t = pack_time(until) if until else None
+        rs   = self.RECORD
+        with open(self.path, "rb") as f:
+            self._check(f)
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                def t_at(k):
+                    return rs.unpack_from(mm, HEADER.size + k * rs.size)[0]
+                start = _bisect(t_at, total, lo_t)
+                stop  = total if hi_t is None else _bisect(t_at, total, hi_t)
+                recs  = [rs.unpack_from(mm, HEADER.size + k * rs.size) for k in range(start, stop)]
+            finally:
+                mm.close()
+        io_stats["read_b"] += len(recs) * rs.size
+        return self._decode_all(recs)
+
+    def export_json(self, out_path):
+        """Tulis ulang seluruh store sebagai array JSON (format sama dengan file asli)."""
+        data = self.tail(self.count())
+        tmp  = out_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, out_path)
+        return len(data)
+
+def _bisect(t_at, total, target):
+    """Indeks pertama dengan waktu ≥ target."""
+    lo, hi = 0, total
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if t_at(mid) < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def _text(hm, off, length):
+    return None if length == NONE else bytes(hm[off:off + length]).decode("utf-8")
+
+# ── Mood: t, mood, energi, catatan (heap) — 16 byte ──────
+class MoodStore(BinStore):
+    KIND   = b"MOOD    "
+    RECORD = struct.Struct("<QBBIH")
+    DEDUP  = ()
+
+    def encode(self, e, heap):
+        off, ln = self._put(heap, e.get("note"))
+        return pack_time(e.get("t")), e.get("mood", 0), e.get("energy", 0), off, ln
+
+    def decode(self, r, hm):
+        t = unpack_time(r[0])
+        out = {"t": t, "date": t[:10], "mood": r[1], "energy": r[2]}
+        note = _text(hm, r[3], r[4])
+        if note is not None:
+            out["note"] = note
+        return out
+
+# ── Log aktivitas: t, intent (heap, dedup), ok, note (heap) — 21 byte ──
+class LogStore(BinStore):
+    KIND   = b"ACTIVITY"
+    RECORD = struct.Struct("<QIHBIH")
+    DEDUP  = ((1, 2),)   # (offset, len) intent di tuple record
+
+    def encode(self, e, heap):
+        i_off, i_len = self._put(heap, e.get("i"), dedup=True)
+        n_off, n_len = self._put(heap, e.get("n"))
+        return pack_time(e.get("t")), i_off, i_len, 1 if e.get("ok") else 0, n_off, n_len
+
+    def decode(self, r, hm):
+        out = {"t": unpack_time(r[0]), "i": _text(hm, r[1], r[2]), "ok": bool(r[3])}
+        note = _text(hm, r[4], r[5])
+        if note is not None:
+            out["n"] = note
+        return out
+
+MOOD_BIN_FILE = os.path.join(DATA_DIR, "mood.bin")
+LOG_BIN_FILE  = os.path.join(DATA_DIR, "log.bin")
+
+_stores = {}
+
+def mood_store():
+    return _stores.setdefault("mood", MoodStore(MOOD_BIN_FILE))
+
+def log_store():
+    return _stores.setdefault("log", LogStore(LOG_BIN_FILE))
+
+def enabled(cfg):
+    return bool(cfg.get("binary_logs"))
+
+def _sources():
+    return ((mood_store(), MOOD_FILE), (log_store(), LOG_FILE))
+
+def _seed(store, src):
+    from core.config import iter_json_array
+    rows = list(iter_json_array(src))
+    if rows:
+        store.extend(rows)
+    return len(rows)
+
+def seed_from_json():
+    """Isi store yang masih kosong dari mood.json / log.json. Return jumlah record."""
+    return sum(_seed(store, src) for store, src in _sources() if store.count() == 0)
+
+def record(kind, entry):
+    """
+    Tambah entry yang BARU SAJA disimpan ke JSON. Store masih kosong →
+    diisi dari JSON dulu (entry ini sudah termasuk), supaya riwayat lama ikut.
+    Selama batch, entry ditahan dan ditulis sekaligus setelah commit_batch
+    (JSON-nya juga baru ada di disk saat itu); batch batal → dibuang.
+    """
+    if in_batch():
+        if not _held:
+            after_commit(_release)
+        _held.setdefault(kind, []).append(entry)
+        return
+    _write(kind, [entry])
+
+_held = {}   # jenis → [entry] menunggu commit batch
+
+def _write(kind, entries):
+    store, src = dict(zip(("mood", "log"), _sources()))[kind]
+    if store.count() == 0:
+        _seed(store, src)
+    else:
+        store.extend(entries)
+
+def _release():
+    held = dict(_held)
+    _held.clear()
+    for kind, entries in held.items():
+        _write(kind, entries)
+
+register_abort_hook(_held.clear)
+
+# Berlangganan hanya lewat enable(), dipanggil engine saat binary_logs aktif.
+# Modul lain boleh meng-import binlog untuk membaca store tanpa ikut
+# memasang handler — tanpa store biner tidak ada biaya per perintah.
+def _on_log(rec, cfg):
+    if enabled(cfg):
+        record("log", rec)
+
+def _on_mood(rec):
+    from core.config import load_config
+    if enabled(load_config()):
+        record("mood", rec)
+
+def enable():
+    """Pasang handler event (idempoten) lalu isi store kosong dari JSON."""
+    events.subscribe(events.COMMAND_LOGGED, _on_log)
+    events.subscribe(events.MOOD_LOGGED,    _on_mood)
+    return seed_from_json()
+
+# ── CLI: ekspor / impor JSON ──────────────────────────────
+def main(args):
+    stores = {"mood": mood_store, "log": log_store}
+    if len(args) < 2 or args[0] not in ("export", "seed", "info") or args[1] not in stores:
+        print("Usage: python -m core.binlog export mood|log <file.json>")
+        print("       python -m core.binlog seed   mood|log      (impor dari JSON kalau kosong)")
+        print("       python -m core.binlog info   mood|log")
+        return 1
+    store = stores[args[1]]()
+    if args[0] == "export":
+        out = args[2] if len(args) > 2 else os.path.splitext(store.path)[0] + "_export.json"
+        print(f"{store.export_json(out)} record → {out}")
+    elif args[0] == "seed":
+        n = _seed(store, dict(_sources())[store]) if store.count() == 0 else 0
+        print(f"{n} record diimpor")
+    else:
+        print(f"{store.path}: {store.count()} record × {store.RECORD.size} byte")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,8 +1,14 @@
 # core/config.py
 # AKARU – Konfigurasi & Konstanta Global
 
+import gc
 import json
+import marshal
 import os
+import time
+from contextlib import contextmanager
+from types import MappingProxyType
+from core import locks
 
 VERSION     = "2.1.0"
 APP_NAME    = "AKARU"
@@ -10,12 +16,18 @@ TAGLINE     = "Shadow Assistant Engine"
 
 # ── Path ──────────────────────────────────────────────────
 BASE_DIR    = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DATA_DIR    = os.path.join(BASE_DIR, "data")
+# AKARU_DATA_DIR: arahkan ke folder data lain (benchmark, replay, device kedua)
+DATA_DIR    = os.environ.get("AKARU_DATA_DIR") or os.path.join(BASE_DIR, "data")
 MEMORY_FILE = os.path.join(DATA_DIR, "memory.json")
 LOG_FILE    = os.path.join(DATA_DIR, "log.json")
 CONTEXT_FILE= os.path.join(DATA_DIR, "context.json")
 MOOD_FILE   = os.path.join(DATA_DIR, "mood.json")
+MOOD_RING_FILE = os.path.join(DATA_DIR, "mood_ring.json")
+TOPICS_FILE = os.path.join(DATA_DIR, "topics.json")
 CONFIG_FILE = os.path.join(DATA_DIR, "config.json")
+SOCKET_FILE = os.path.join(DATA_DIR, "akaru.sock")
+# AKARU_BACKUP_DIR: simpan backup di media lain (SD card, folder sync)
+BACKUP_DIR  = os.environ.get("AKARU_BACKUP_DIR") or os.path.join(DATA_DIR, "backup")
 
 # ── Defaults ──────────────────────────────────────────────
 DEFAULT_CONFIG = {
@@ -24,6 +36,15 @@ DEFAULT_CONFIG = {
     "max_logs"        : 80,
     "show_timestamps" : True,
     "color"           : True,
+    "record_session"  : False,
+    "mem_budget_mb"   : 96,
+    "mem_trace"       : False,
+    "write_behind"    : True,
+    "binary_logs"     : False,
+    "backup_last"     : 5,
+    "backup_daily"    : 7,
+    "backup_weekly"   : 4,
+    "backup_monthly"  : 12,
     "goal"            : 
 "Bangun asisten pribadi," 
 "stabil di HP low-end,"
@@ -42,20 +63,529 @@ LAZY_KEYWORDS = [
 ]
 
 # ── Util ──────────────────────────────────────────────────
+_deferred = None  # path → data selama batch aktif (lihat begin_batch)
+_on_commit = []   # fn yang menunggu commit_batch (after_commit)
+_on_abort  = []   # fn yang dipanggil abort_batch (register_abort_hook)
+_writer   = None  # core/writer.WriteBehind kalau write-behind aktif
+last_write = {}   # path → (stat_key sebelum, sesudah) tulisan terakhir proses ini
+
+# Counter I/O kumulatif — dibaca core/perf untuk selisih per perintah
+io_stats = {"io_s": 0.0, "read_b": 0, "write_b": 0, "loads": 0, "saves": 0,
+            "cache_hit": 0, "cache_miss": 0}
+
 def ensure_data_dir():
     os.makedirs(DATA_DIR, exist_ok=True)
 
+def set_writer(writer):
+    """Dipanggil core/writer.start/stop: save_json lewat thread latar atau sinkron."""
+    global _writer
+    _writer = writer
+
+def _default(default):
+    return default if not callable(default) else default()
+
+def _pending(path):
+    """Data yang belum sampai disk: batch aktif atau antrian write-behind."""
+    if _deferred is not None and path in _deferred:
+        return _deferred[path]
+    if _writer is not None:
+        return _writer.peek(path)
+    return None
+
 def load_json(path, default):
+    """Data milik pemanggil — boleh diubah."""
+    data = _pending(path)
+    if data is not None:
+        return data
+    key = stat_key(path)
+    hit = _cache.get(path)
+    if key is not None and hit is not None and hit[0] == key:
+        io_stats["cache_hit"] += 1
+        return thaw(hit[1])
+    data = _parse(path, key)
+    return _default(default) if data is _MISSING else data
+
+def load_json_view(path, default):
+    """
+    Versi read-only untuk pembaca yang tidak mengubah data (analyzer, summary,
+    statistik mood): dari cache tanpa parse ulang dan tanpa salinan.
+    Hasilnya tuple + MappingProxyType — jangan diubah, jangan disimpan balik.
+    """
+    data = _pending(path)
+    if data is not None:
+        return data
+    key = stat_key(path)
+    hit = _cache.get(path)
+    if key is not None and hit is not None and hit[0] == key:
+        io_stats["cache_hit"] += 1
+        return hit[1]
+    data = _parse(path, key)
+    if data is _MISSING:
+        return _default(default)
+    hit = _cache.get(path)
+    return hit[1] if hit is not None and hit[0] == key else data
+
+@contextmanager
+def bulk_load():
+    """
+    Matikan GC siklik selama membangun banyak objek sekaligus (parse/decode,
+    konversi record). Tanpa ini GC generasi-2 berjalan berkali-kali di tengah
+    load 100k+ record. Aman bersarang.
+    """
+    was = gc.isenabled()
+    gc.disable()
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        yield
+    finally:
+        if was:
+            gc.enable()
+
+def _parse(path, key):
+    """
+    Baca file dari disk: snapshot biner kalau masih cocok, kalau tidak JSON
+    (lalu snapshot dibuat ulang). File kecil langsung masuk cache (versi beku).
+    """
+    io_stats["cache_miss"] += 1
+    with bulk_load():
+        data = _read_snapshot(path, key)
+    if data is not _MISSING:
+        return data   # sudah cepat; membekukan record untuk cache justru lebih mahal
+    t0 = time.perf_counter()
+    try:
+        with locks.shared(path), open(path, "rb") as f:   # append_json menulis di tempat
+            raw = f.read()
+        with bulk_load():
+            data = json.loads(raw)
     except Exception:
-        return default if not callable(default) else default()
+        return _MISSING
+    finally:
+        io_stats["io_s"] += time.perf_counter() - t0
+    io_stats["read_b"] += len(raw)
+    io_stats["loads"]  += 1
+    _cache_put(path, key, data)
+    _write_snapshot(path, key, data, owned=True)
+    _snap_due.pop(path, None)
+    return data
 
 def save_json(path, data):
+    if _deferred is not None:
+        _deferred[path] = data
+        return
+    if _writer is not None:
+        _writer.submit(path, data)
+        return
+    write_file(path, data)
+
+def write_file(path, data, owned=False):
+    """
+    Tulis sinkron & atomik (.tmp + rename). Dipakai save_json dan writer.
+    owned=True: data sudah salinan plain (snapshot writer), tidak perlu disalin lagi.
+    """
+    ensure_data_dir()
+    _replace(_write_tmp(path, data), path)
+    _after_write(path, data, owned)
+
+def write_bytes(path, parts):
+    """
+    Ganti isi file dengan bytes mentah (pemulihan backup) lewat jalur yang
+    sama dengan write_file: lock eksklusif + bump generation, jadi proses lain
+    memuat ulang. Cache & snapshot versi lama dibuang.
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        for part in parts:
+            f.write(part)
+    _replace(tmp, path)
+    _cache.pop(path, None)
+    _snap_due.pop(path, None)
+    _drop_snapshot(path)
+
+def _replace(tmp, path):
+    """Rename atomik di bawah lock eksklusif + bump generation."""
+    with locks.exclusive(path):
+        old = stat_key(path)
+        os.replace(tmp, path)
+        locks.bump(path)
+        last_write[path] = (old, stat_key(path))
+
+def _after_write(path, data, owned=False):
+    """
+    Cache ikut versi baru. Snapshot biner tidak ditulis tiap save (marshal
+    store besar = biaya sebesar store-nya): versi ini dicatat di _snap_due,
+    ditulis sekali oleh flush_snapshots() saat writer ditutup, atau oleh
+    load pertama yang mendapati snapshot basi.
+    """
+    key = stat_key(path)
+    _cache_put(path, key, data)
+    if key is not None and key[1] >= SNAPSHOT_MIN_BYTES:
+        _snap_due[path] = key
+    else:
+        _snap_due.pop(path, None)
+        _drop_snapshot(path)
+
+def _encode(obj):
+    """Record __slots__ (core/memory.Record) → dict JSON."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    to_json = getattr(obj, "to_json", None)
+    if to_json is None:
+        raise TypeError(f"Tidak bisa diserialisasi: {type(obj).__name__}")
+    return to_json()
+
+def _write_tmp(path, data):
+    t0  = time.perf_counter()
+    raw = json.dumps(data, indent=2, ensure_ascii=False, default=_encode).encode("utf-8")
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(raw)
+    io_stats["io_s"]    += time.perf_counter() - t0
+    io_stats["write_b"] += len(raw)
+    io_stats["saves"]   += 1
+    return tmp
+
+# ── Cache hasil parse ─────────────────────────────────────
+# Key (st_mtime_ns, st_size): file diubah proses lain → key beda → parse ulang.
+# Isi cache dibekukan (dict → MappingProxyType, list → tuple) supaya pemanggil
+# tidak bisa merusaknya; load_json memberi salinan, load_json_view langsung.
+# File besar tidak di-cache: di RAM sudah ada versi record-nya di state.
+CACHE_FILE_MAX = 1024 * 1024
+
+_MISSING = object()
+_SCALAR  = (str, int, float, bool, type(None))
+_cache   = {}   # path → ((mtime_ns, size), data beku)
+
+def stat_key(path):
+    """(st_mtime_ns, st_size) — identitas versi file di disk, None kalau tidak ada."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _freeze(obj):
+    t = type(obj)
+    if t is dict or t is MappingProxyType:
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if t is list or t is tuple:
+        return tuple(_freeze(v) for v in obj)
+    to_json = getattr(obj, "to_json", None)
+    return _freeze(to_json()) if to_json is not None else obj
+
+def thaw(obj):
+    t = type(obj)
+    if t is MappingProxyType:
+        return {k: thaw(v) for k, v in obj.items()}
+    if t is tuple:
+        return [thaw(v) for v in obj]
+    return obj
+
+def _cache_put(path, key, data):
+    if key is None or key[1] > CACHE_FILE_MAX:
+        _cache.pop(path, None)
+    else:
+        _cache[path] = (key, _freeze(data))
+
+def plain(obj):
+    """Salinan dengan container biasa (dict/list): record → to_json(), view → dict."""
+    t = type(obj)
+    if t is list or t is tuple:
+        return [v if type(v) in _SCALAR else plain(v) for v in obj]
+    if t is dict or t is MappingProxyType:
+        return {k: v if type(v) in _SCALAR else plain(v) for k, v in obj.items()}
+    if t in _SCALAR:
+        return obj
+    to_json = getattr(obj, "to_json", None)
+    return plain(to_json()) if to_json is not None else obj
+
+def clear_cache():
+    """Lepas semua hasil parse (dipanggil saat mode hemat RAM)."""
+    _cache.clear()
+
+def cache_info():
+    return {"files": len(_cache), "hit": io_stats["cache_hit"], "miss": io_stats["cache_miss"]}
+
+# ── Snapshot biner (sidecar) ──────────────────────────────
+# <file>.json.snap = marshal ((versi, versi marshal, schema, mtime_ns, size), data).
+# Dipakai hanya kalau mtime & ukuran JSON sumber masih sama persis. JSON tetap
+# sumber kebenaran: diedit manual / diganti proses lain → snapshot diabaikan.
+SNAPSHOT_VERSION   = 2
+SNAPSHOT_SUFFIX    = ".snap"
+SNAPSHOT_MIN_BYTES = 64 * 1024   # file kecil: parse JSON sudah cukup cepat
+
+_codecs   = {}   # path → (schema, encode, decode), lihat register_snapshot_codec
+_snap_due = {}   # path → stat_key versi tersimpan yang snapshot-nya belum ditulis
+
+def register_snapshot_codec(path, schema, encode, decode):
+    """
+    Store berisi record (core/memory, core/mood) menyimpan snapshot sebagai baris
+    tuple, bukan dict — lebih kecil & record bisa dibangun langsung tanpa dict.
+    schema (mis. tuple FIELDS) ikut dicek: field berubah → snapshot lama diabaikan.
+    decode(payload) boleh mengembalikan record; record bertingkah seperti dict.
+    """
+    _codecs[path] = (schema, encode, decode)
+
+def _snapshot_header(path, key):
+    schema = _codecs[path][0] if path in _codecs else None
+    return (SNAPSHOT_VERSION, marshal.version, schema) + key
+
+def _read_snapshot(path, key):
+    if key is None or key[1] < SNAPSHOT_MIN_BYTES:
+        return _MISSING
+    t0 = time.perf_counter()
+    try:
+        with open(path + SNAPSHOT_SUFFIX, "rb") as f:
+            raw = f.read()
+        header, payload = marshal.loads(raw)
+        if header != _snapshot_header(path, key):
+            return _MISSING
+        data = _codecs[path][2](payload) if path in _codecs else payload
+    except Exception:
+        return _MISSING
+    finally:
+        io_stats["io_s"] += time.perf_counter() - t0
+    io_stats["read_b"] += len(raw)
+    io_stats["loads"]  += 1
+    return data
+
+def _write_snapshot(path, key, data, owned=False):
+    """owned=True: data sudah plain milik kita (hasil parse / snapshot writer)."""
+    if key is None or key[1] < SNAPSHOT_MIN_BYTES:
+        return
+    t0  = time.perf_counter()
+    tmp = path + SNAPSHOT_SUFFIX + ".tmp"
+    try:
+        if path in _codecs:
+            payload = _codecs[path][1](data)
+        else:
+            payload = data if owned else plain(data)
+        raw = marshal.dumps((_snapshot_header(path, key), payload))
+        with open(tmp, "wb") as f:
+            f.write(raw)
+        os.replace(tmp, path + SNAPSHOT_SUFFIX)
+    except (OSError, ValueError):
+        return   # snapshot cuma percepatan; gagal → load berikutnya pakai JSON
+    finally:
+        io_stats["io_s"] += time.perf_counter() - t0
+    io_stats["write_b"] += len(raw)
+
+def flush_snapshots():
+    """
+    Tulis snapshot yang tertunda dari cache (dipanggil core/writer.stop saat exit).
+    Versi yang sudah diganti proses lain atau tidak ada di cache (> CACHE_FILE_MAX)
+    dilewati — load berikutnya parse JSON lalu menulis snapshot-nya.
+    Return jumlah snapshot yang ditulis.
+    """
+    due = list(_snap_due.items())
+    _snap_due.clear()
+    n = 0
+    for path, key in due:
+        hit = _cache.get(path)
+        if hit is None or hit[0] != key or stat_key(path) != key:
+            continue
+        _write_snapshot(path, key, thaw(hit[1]), owned=True)
+        n += 1
+    return n
+
+def _drop_snapshot(path):
+    try:
+        os.remove(path + SNAPSHOT_SUFFIX)
+    except OSError:
+        pass
+
+def iter_json_array(path, chunk=64 * 1024):
+    """
+    Yield elemen array JSON satu per satu tanpa memuat seluruh file.
+    Dipakai mode hemat RAM untuk mood.json / log.json yang besar.
+    """
+    if _deferred is not None and path in _deferred:
+        yield from _deferred[path]
+        return
+    if _writer is not None:
+        snap = _writer.peek(path)
+        if snap is not None:
+            yield from snap
+            return
+    hit = _cache.get(path)
+    if hit is not None and hit[0] == stat_key(path):
+        io_stats["cache_hit"] += 1
+        yield from hit[1]
+        return
+    dec = json.JSONDecoder()
+    try:
+        f = open(path, "r", encoding="utf-8")
+    except OSError:
+        return
+    with f, locks.shared(path):
+        buf, pos, eof = f.read(chunk), 0, False
+        pos = _skip_ws(buf, pos)
+        if pos >= len(buf) or buf[pos] != "[":
+            return
+        pos += 1
+        while True:
+            pos = _skip_ws(buf, pos, ",")
+            if pos < len(buf) and buf[pos] == "]":
+                return
+            try:
+                if pos >= len(buf):
+                    raise ValueError
+                obj, end = dec.raw_decode(buf, pos)
+                if end >= len(buf) and not eof:
+                    raise ValueError  # mungkin terpotong (angka di ujung buffer)
+            except ValueError:
+                if eof:
+                    return
+                more = f.read(chunk)
+                eof  = not more
+                buf, pos = buf[pos:] + more, 0
+                continue
+            yield obj
+            pos = end
+            if pos > chunk:
+                buf, pos = buf[pos:], 0
+
+def _skip_ws(buf, pos, extra=""):
+    while pos < len(buf) and (buf[pos].isspace() or buf[pos] in extra):
+        pos += 1
+    return pos
+
+# ── Append & tail array JSON tanpa baca/tulis ulang seluruh file ──
+# Mengandalkan format save_json (indent=2): tiap elemen top-level array
+# diawali "\n  {" — newline mentah tidak mungkin muncul di dalam string JSON.
+def append_json(path, item):
+    """
+    Tambah satu elemen di ujung array JSON: seek ke ']' penutup, tulis elemen
+    baru + ']'. Return stat_key baru, atau None kalau tidak bisa (batch aktif,
+    ada save tertunda, file belum ada / bukan array) — pemanggil fallback ke
+    save_json penuh.
+    """
+    if _deferred is not None or (_writer is not None and _writer.has_pending(path)):
+        return None
+    body = json.dumps(plain(item), indent=2, ensure_ascii=False)
+    body = "\n".join("  " + line for line in body.splitlines())
+    t0   = time.perf_counter()
+    try:
+        with locks.exclusive(path), open(path, "r+b") as f:
+            old  = stat_key(path)
+            end  = f.seek(0, os.SEEK_END)
+            back = min(end, 256)
+            f.seek(end - back)
+            tail = f.read(back).rstrip()
+            if not tail.endswith(b"]"):
+                return None
+            before = tail[:-1].rstrip()
+            if not before:
+                return None
+            sep = b"\n" if before.endswith(b"[") else b",\n"
+            raw = sep + body.encode("utf-8") + b"\n]"
+            f.seek(end - back + len(before))
+            f.write(raw)
+            f.truncate()
+            locks.bump(path)
+            last_write[path] = (old, stat_key(path))
+    except OSError:
+        return None
+    finally:
+        io_stats["io_s"] += time.perf_counter() - t0
+    io_stats["write_b"] += len(raw)
+    io_stats["saves"]   += 1
+    _cache.pop(path, None)
+    _drop_snapshot(path)
+    return stat_key(path)
+
+def tail_json_array(path, n, chunk=16 * 1024):
+    """n elemen terakhir array JSON, dibaca mundur dari ujung file."""
+    if n <= 0:
+        return []
+    data = _pending(path)
+    if data is None:
+        hit = _cache.get(path)
+        if hit is not None and hit[0] == stat_key(path):
+            data = hit[1]
+    if data is not None:
+        return [thaw(e) for e in data[-n:]]
+    dec = json.JSONDecoder()
+    t0  = time.perf_counter()
+    try:
+        with locks.shared(path), open(path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            win  = chunk
+            while True:
+                start = max(size - win, 0)
+                f.seek(start)
+                buf = f.read(size - start)
+                if start == 0:
+                    io_stats["read_b"] += len(buf)
+                    return json.loads(buf)[-n:]
+                # Mulai dari awal elemen utuh pertama (sisa elemen sebelumnya dibuang)
+                first = buf.find(b"\n  {")
+                if first >= 0:
+                    text   = buf[first:].decode("utf-8")
+                    starts = []
+                    i      = 0
+                    while i >= 0:
+                        starts.append(i + 3)
+                        i = text.find("\n  {", i + 1)
+                    if len(starts) >= n:
+                        io_stats["read_b"] += len(buf)
+                        return [dec.raw_decode(text, i)[0] for i in starts[-n:]]
+                win *= 4
+    except (OSError, ValueError):
+        return []
+    finally:
+        io_stats["io_s"] += time.perf_counter() - t0
+
+# ── Batch: tunda semua save, commit sekali di akhir ───────
+# Sidecar yang tidak lewat save_json (append biner, telemetri) memakai
+# after_commit: ditunda sampai commit, dibuang kalau batch dibatalkan.
+# Modul dengan state sidecar di RAM mendaftar register_abort_hook supaya
+# membaca ulang versi disk setelah batch batal.
+def begin_batch():
+    global _deferred
+    _deferred = {}
+    _on_commit.clear()
+
+def in_batch():
+    return _deferred is not None
+
+def after_commit(fn):
+    """Jalankan fn setelah batch di-commit (langsung kalau tidak ada batch)."""
+    if _deferred is None:
+        fn()
+    else:
+        _on_commit.append(fn)
+
+def register_abort_hook(fn):
+    if fn not in _on_abort:
+        _on_abort.append(fn)
+
+def commit_batch():
+    """
+    Tulis semua file tertunda. Semua .tmp ditulis dulu, baru di-rename,
+    jadi kalau gagal di tengah tidak ada store yang setengah jadi.
+    Return jumlah file yang ditulis.
+    """
+    global _deferred
+    pending, _deferred = _deferred or {}, None
+    if _writer is not None:
+        _writer.flush()  # save lama di antrian jangan sampai menimpa hasil batch
     ensure_data_dir()
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    tmps = [(_write_tmp(path, data), path) for path, data in pending.items()]
+    for tmp, path in tmps:
+        _replace(tmp, path)
+    for path, data in pending.items():
+        _after_write(path, data)
+    hooks = _on_commit[:]
+    _on_commit.clear()
+    for fn in hooks:
+        fn()
+    return len(tmps)
+
+def abort_batch():
+    global _deferred
+    _deferred = None
+    _on_commit.clear()
+    for fn in _on_abort:
+        fn()
 
 def load_config():
     cfg = load_json(CONFIG_FILE, {})
@@ -65,3 +595,7 @@ def load_config():
 
 def save_config(cfg):
     save_json(CONFIG_FILE, cfg)
+
+# Mode hemat RAM → cache parse ikut dilepas
+from core import membudget  # noqa: E402
+membudget.register_release(clear_cache)
@@ -0,0 +1,239 @@
+# core/deadline.py
+# AKARU – Deadline Index
+# Tugas boleh punya tanggal jatuh tempo & prioritas:
+#
+#   tugas kirim laporan @besok !1
+#   tugas bayar listrik @25/10
+#
+# Index = min-heap (due, prioritas, id) di RAM, dibangun sekali per list tugas
+# lalu dirawat inkremental (push saat tambah, hapus malas saat selesai/dihapus).
+# "Berikutnya", "terlambat", "minggu ini" cukup jalan dari akar heap: O(k log k)
+# untuk k hasil, tanpa scan semua tugas. memory.json tidak berubah schema —
+# cukup field `due` & `pri` per tugas; index selalu bisa dibangun ulang.
+
+import heapq
+import itertools
+from bisect import bisect_left
+from datetime import datetime, timedelta, date
+from core import events
+
+PRI_NONE = 4   # tanpa prioritas → urut setelah !3
+
+# ── Parsing @tanggal !prioritas ───────────────────────────
+_REL = {"hariini": 0, "today": 0, "besok": 1, "lusa": 2}
+_DAYS = ("senin", "selasa", "rabu", "kamis", "jumat", "sabtu", "minggu")
+
+def _today():
+    return datetime.now().date()
+
+def _date_token(tok, today):
+    """'besok', 'jumat', '+3', '2026-10-25', '25/10', '25-10-2026' → date | None."""
+    tok = tok.lower()
+    if tok in _REL:
+        return today + timedelta(days=_REL[tok])
+    if tok in _DAYS:
+        return today + timedelta(days=(_DAYS.index(tok) - today.weekday()) % 7)
+    if tok.startswith("+") and tok[1:].isdigit():
+        return today + timedelta(days=int(tok[1:]))
+    try:
+        return date.fromisoformat(tok)
+    except ValueError:
+        pass
+    parts = tok.replace("-", "/").split("/")
+    if len(parts) in (2, 3) and all(p.isdigit() for p in parts):
+        d, m = int(parts[0]), int(parts[1])
+        y = int(parts[2]) if len(parts) == 3 else today.year
+        if y < 100:
+            y += 2000
+        try:
+            due = date(y, m, d)
+        except ValueError:
+            return None
+        if len(parts) == 2 and due < today:
+            due = due.replace(year=y + 1)   # 05/01 di bulan Oktober → tahun depan
+        return due
+    return None
+
+def parse_due(text, today=None):
+    """
+    Pisahkan token @tanggal dan !1..!3 dari teks tugas.
+    Return (teks_bersih, due 'YYYY-MM-DD' | None, prioritas 1-3 | None).
+    Token @ yang bukan tanggal (mis. @budi) dibiarkan di teks.
+    """
+    today = today or _today()
+    due = pri = None
+    words = []
+    for w in text.split():
+        if w.startswith("@") and len(w) > 1:
+            d = _date_token(w[1:], today)
+            if d is not None:
+                due = d.isoformat()
+                continue
+        elif w in ("!1", "!2", "!3"):
+            pri = int(w[1])
+            continue
+        words.append(w)
+    return " ".join(words), due, pri
+
+def label(due, today=None):
+    """'terlambat 2 hari' / 'hari ini' / 'besok' / '3 hari lagi' / tanggal."""
+    today = today or _today()
+    try:
+        delta = (date.fromisoformat(due) - today).days
+    except (TypeError, ValueError):
+        return str(due)
+    if delta < 0:
+        return f"terlambat {-delta} hari"
+    if delta == 0:
+        return "hari ini"
+    if delta == 1:
+        return "besok"
+    if delta < 7:
+        return f"{delta} hari lagi"
+    return due
+
+# ── Index ─────────────────────────────────────────────────
+# tasks: list tugas yang di-index (identitas objek), n: jumlah tugas list itu
+# yang sudah dilihat (tugas baru selalu di ujung list), seq: id → nomor push entry
+# yang masih berlaku. Entry heap = (due, prioritas, id, nomor push): id bisa
+# dipakai ulang (hapus tugas terakhir lalu tambah lagi), nomor push tidak —
+# entry lama tidak akan pernah cocok dengan tugas baru ber-id sama.
+_index = {"tasks": None, "n": 0, "heap": [], "seq": {}}
+_pushes = itertools.count()
+
+def _entry(task):
+    return (task["due"], task.get("pri") or PRI_NONE, task["id"], next(_pushes))
+
+def _pending_due(task):
+    return not task.get("done") and task.get("due")
+
+def _rebuild(tasks):
+    heap = [_entry(tk) for tk in tasks if _pending_due(tk)]
+    heapq.heapify(heap)
+    _index.update(tasks=tasks, heap=heap, seq={e[2]: e[3] for e in heap}, n=len(tasks))
+
+def _sync(memory):
+    """Heap untuk memory["tasks"] — bangun sekali, lalu cukup susul tugas baru."""
+    tasks = memory.get("tasks", [])
+    if _index["tasks"] is not tasks:
+        _rebuild(tasks)
+        return _index["heap"]
+    # Tugas yang ditambah tanpa event ada di ujung list. Dihitung dari jumlah,
+    # bukan id terbesar: id tugas terakhir yang dihapus bisa dipakai lagi.
+    new = len(tasks) - _index["n"]
+    if new < 0:
+        _rebuild(tasks)
+        return _index["heap"]
+    for tk in tasks[len(tasks) - new:]:
+        _push(tk)
+    _index["n"] = len(tasks)
+    # Entry basi lebih banyak dari yang hidup → padatkan (amortized O(1))
+    if len(_index["heap"]) > 2 * len(_index["seq"]) + 32:
+        _rebuild(tasks)
+    return _index["heap"]
+
+def _push(task):
+    if _pending_due(task):
+        entry = _entry(task)
+        heapq.heappush(_index["heap"], entry)
+        _index["seq"][entry[2]] = entry[3]
+
+def _find(tasks, tid):
+    i = bisect_left(tasks, tid, key=lambda tk: tk["id"])
+    return tasks[i] if i < len(tasks) and tasks[i]["id"] == tid else None
+
+def _valid(tasks, entry):
+    due, pri, tid, seq = entry
+    if _index["seq"].get(tid) != seq:
+        return None
+    tk = _find(tasks, tid)
+    if tk is None or not _pending_due(tk) or tk["due"] != due or (tk.get("pri") or PRI_NONE) != pri:
+        return None
+    return tk
+
+# ── Hook (event dari core/memory) ─────────────────────────
+def add(memory, task):
+    """Tugas baru, atau tugas yang sudah diubah dan masih berjatuh tempo."""
+    if _index["tasks"] is memory.get("tasks"):
+        _push(task)
+
+def discard(memory, task):
+    """Tugas selesai / dihapus: entry-nya tidak berlaku lagi, dibuang malas dari heap."""
+    if _index["tasks"] is memory.get("tasks"):
+        _index["seq"].pop(task["id"], None)
+
+def _gone(memory, rec):
+    if _pending_due(rec):
+        discard(memory, rec)
+
+def _count(memory, step):
+    if _index["tasks"] is memory.get("tasks"):
+        _index["n"] += step
+
+def _added(memory, rec):
+    _count(memory, +1)
+    add(memory, rec)
+
+def _deleted(memory, rec):
+    _count(memory, -1)
+    _gone(memory, rec)
+
+events.subscribe(events.TASK_ADDED,    _added,                                name="deadline.add")
+events.subscribe(events.TASK_CHANGING, _gone,                                 name="deadline.discard")
+events.subscribe(events.TASK_CHANGED,  lambda memory, rec: add(memory, rec),  name="deadline.add")
+events.subscribe(events.TASK_DELETED,  _deleted,                              name="deadline.discard")
+
+# ── Query ─────────────────────────────────────────────────
+def _walk(memory):
+    """
+    Tugas valid terurut (due, prioritas, id), dihasilkan satu per satu.
+    Heap tidak diubah: simpul dijelajah lewat heap bantu berisi indeks
+    anak, jadi k hasil pertama cost O(k log k) berapa pun jumlah tugas.
+    """
+    heap  = _sync(memory)
+    tasks = memory.get("tasks", [])
+    # Entry basi di akar dibuang permanen (hapus malas)
+    while heap and _valid(tasks, heap[0]) is None:
+        heapq.heappop(heap)
+    front = [(heap[0], 0)] if heap else []
+    while front:
+        entry, i = heapq.heappop(front)
+        tk = _valid(tasks, entry)
+        if tk is not None:
+            yield tk
+        for c in (2 * i + 1, 2 * i + 2):
+            if c < len(heap):
+                heapq.heappush(front, (heap[c], c))
+
+def next_due(memory, k=1):
+    """k tugas dengan jatuh tempo terdekat."""
+    out = []
+    for tk in _walk(memory):
+        if len(out) >= k:
+            break
+        out.append(tk)
+    return out
+
+def due_before(memory, until):
+    """Tugas dengan due < until ('YYYY-MM-DD'), terurut."""
+    out = []
+    for tk in _walk(memory):
+        if tk["due"] >= until:
+            break
+        out.append(tk)
+    return out
+
+def overdue(memory, today=None):
+    return due_before(memory, (today or _today()).isoformat())
+
+def due_today(memory, today=None):
+    today = today or _today()
+    return [tk for tk in due_before(memory, (today + timedelta(days=1)).isoformat())
+            if tk["due"] == today.isoformat()]
+
+def due_within(memory, days=7, today=None):
+    """Belum terlambat, jatuh tempo dalam `days` hari ke depan (termasuk hari ini)."""
+    today = today or _today()
+    start = today.isoformat()
+    return [tk for tk in due_before(memory, (today + timedelta(days=days)).isoformat())
+            if tk["due"] >= start]
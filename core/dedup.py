@@ -0,0 +1,212 @@
+# core/dedup.py
+# AKARU – Near-Duplicate Notes (MinHash + LSH band)
+# Tiap catatan → himpunan kata (huruf kecil, tanpa tanda baca). Dua catatan
+# dianggap hampir sama kalau kemiripan Jaccard kata-katanya ≥ MIN_SIM.
+#
+# Index LSH: signature MinHash PERMS nilai dipotong BANDS band × ROWS baris.
+# Catatan hanya dibandingkan (Jaccard persis) dengan catatan yang berbagi
+# minimal satu band — bukan semua catatan — jadi cek saat `catat` ≈ O(1).
+# 8 × 3: pasangan dengan Jaccard 0.7 jadi kandidat ±96%, 0.8 → 99.9%,
+# pasangan acak (Jaccard 0.1) hanya ±0.8% — sisanya tidak pernah disentuh.
+#
+# (SimHash sempat dicoba: untuk catatan pendek satu kata berbeda sudah
+# menggeser 10+ bit, terlalu berisik untuk ambang jarak kecil.)
+#
+# Index hidup di RAM (dibangun sekali per list catatan, dirawat inkremental
+# oleh add_note/delete_note). `rapikan` mengelompokkan semua duplikat sekaligus.
+
+import re
+import random
+from hashlib import blake2b
+from core import events
+
+BANDS   = 8
+ROWS    = 3
+PERMS   = BANDS * ROWS
+MIN_SIM = 0.7
+WORD_RE = re.compile(r"\w+")
+_M64    = (1 << 64) - 1
+_PERMS  = [(r.getrandbits(64) | 1, r.getrandbits(64)) for r in [random.Random(0x414B52)]
+           for _ in range(PERMS)]   # (a ganjil, b) tetap → signature stabil antar proses
+
+# ── MinHash ───────────────────────────────────────────────
+# Nilai PERMS hash per kata di-cache (kosakata catatan kecil), jadi signature
+# satu catatan cukup min kolom-per-kolom: tuple(map(min, zip(...))) di C.
+_word_cache = {}
+
+def _word_sig(word):
+    sig = _word_cache.get(word)
+    if sig is None:
+        h   = int.from_bytes(blake2b(word.encode("utf-8"), digest_size=8).digest(), "little")
+        sig = tuple((a * h + b) & _M64 for a, b in _PERMS)
+        if len(_word_cache) < 50_000:
+            _word_cache[word] = sig
+    return sig
+
+def features(text):
+    return frozenset(WORD_RE.findall(text.lower()))
+
+def minhash(feats):
+    """PERMS nilai minimum (a·h + b mod 2⁶⁴) atas kata-kata catatan."""
+    return tuple(map(min, zip(*map(_word_sig, feats))))
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+def _bands(sig):
+    return [(k, sig[k * ROWS:(k + 1) * ROWS]) for k in range(BANDS)]
+
+# ── Index ─────────────────────────────────────────────────
+class SimIndex:
+    __slots__ = ("items", "n", "feats", "sigs", "buckets")
+
+    def __init__(self):
+        self.items = None
+
+    def rebuild(self, items):
+        self.items, self.n = items, 0
+        self.feats, self.sigs, self.buckets = {}, {}, {}
+        for rec in items:
+            self.add(rec)
+
+    def add(self, rec):
+        rid   = rec["id"]
+        feats = features(rec["v"])
+        self.n += 1
+        if not feats:
+            return
+        sig = minhash(feats)
+        self.feats[rid], self.sigs[rid] = feats, sig
+        for key in _bands(sig):
+            self.buckets.setdefault(key, []).append(rid)
+
+    def discard(self, rec):
+        rid = rec["id"]
+        self.n -= 1
+        sig = self.sigs.pop(rid, None)
+        self.feats.pop(rid, None)
+        if sig is None:
+            return
+        for key in _bands(sig):
+            ids = self.buckets.get(key)
+            if ids and rid in ids:
+                ids.remove(rid)
+                if not ids:
+                    del self.buckets[key]
+
+    def sync(self, items):
+        if self.items is not items:
+            self.rebuild(items)
+            return self
+        # Sama seperti TagIndex.sync: susul berdasarkan jumlah, bukan id
+        new = len(items) - self.n
+        if new < 0:
+            self.rebuild(items)
+        elif new:
+            for rec in items[-new:]:
+                self.add(rec)
+        return self
+
+    def near(self, feats, exclude=None):
+        """{id: kemiripan} untuk kandidat band bersama yang Jaccard-nya ≥ MIN_SIM."""
+        out, seen = {}, set()
+        for key in _bands(minhash(feats)):
+            for rid in self.buckets.get(key, ()):
+                if rid == exclude or rid in seen:
+                    continue
+                seen.add(rid)
+                sim = jaccard(feats, self.feats[rid])
+                if sim >= MIN_SIM:
+                    out[rid] = sim
+        return out
+
+_index = SimIndex()
+
+def index(memory):
+    return _index.sync(memory.get("notes", []))
+
+# ── Hook (event dari core/memory) ─────────────────────────
+def add(memory, note):
+    if _index.items is memory.get("notes"):
+        _index.add(note)
+
+def discard(memory, note):
+    if _index.items is memory.get("notes"):
+        _index.discard(note)
+
+events.subscribe(events.NOTE_ADDED,   lambda memory, rec: add(memory, rec),     name="dedup.add")
+events.subscribe(events.NOTE_DELETED, lambda memory, rec: discard(memory, rec), name="dedup.discard")
+
+# ── API ───────────────────────────────────────────────────
+def similar(memory, text, exclude=None):
+    """Catatan yang hampir sama dengan `text`: [(note, kemiripan 0-1)], paling mirip dulu."""
+    from core.tags import by_id
+    feats = features(text)
+    if not feats:
+        return []
+    idx   = index(memory)
+    notes = memory.get("notes", [])
+    hits  = sorted(idx.near(feats, exclude).items(), key=lambda kv: (-kv[1], kv[0]))
+    return [(n, sim) for n, sim in ((by_id(notes, rid), sim) for rid, sim in hits) if n is not None]
+
+def clusters(memory):
+    """
+    Kelompok catatan hampir sama (≥ 2 anggota), tiap kelompok list id naik.
+    Union-find di atas pasangan dari bucket LSH — tanpa perbandingan n².
+    """
+    idx    = index(memory)
+    parent = {}
+
+    def find(x):
+        root = x
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while x != root:            # kompresi jalur
+            parent[x], x = root, parent[x]
+        return root
+
+    for ids in idx.buckets.values():
+        if len(ids) < 2:
+            continue
+        for i, a in enumerate(ids):
+            for b in ids[i + 1:]:
+                if jaccard(idx.feats[a], idx.feats[b]) >= MIN_SIM:
+                    ra, rb = find(a), find(b)
+                    if ra != rb:
+                        parent[max(ra, rb)] = min(ra, rb)
+    groups = {}
+    for x in parent:
+        groups.setdefault(find(x), set()).add(x)
+    for root, members in groups.items():
+        members.add(root)
+    return sorted(sorted(g) for g in groups.values() if len(g) > 1)
+
+def show_tidy(memory):
+    """`rapikan`: tampilkan kelompok duplikat, simpan catatan tertua, hapus sisanya."""
+    from core import display as D
+    from core import memory as M
+    from core.tags import by_id
+    groups = clusters(memory)
+    D.header("RAPIKAN CATATAN", D.CYAN)
+    if not groups:
+        D.dim("Tidak ada catatan yang mirip.")
+        D.sep()
+        return 0
+    notes = memory["notes"]
+    extra = 0
+    for g in groups:
+        keep = by_id(notes, g[0])
+        print(f"  {D.c('#' + str(keep['id']), D.MAGENTA, D.BOLD)}  {keep['v']}")
+        for rid in g[1:]:
+            n = by_id(notes, rid)
+            print(f"  {D.c('  #' + str(rid), D.GRAY)}  {D.c(n['v'], D.GRAY)}")
+        extra += len(g) - 1
+    D.blank()
+    D.dim(f"{len(groups)} kelompok · {extra} catatan duplikat (yang tertua disimpan)")
+    D.sep()
+    if not D.confirm(f"Hapus {extra} catatan duplikat? (y/N): "):
+        D.dim("Dibatalkan.")
+        return 0
+    removed = M.delete_notes(memory, {rid for g in groups for rid in g[1:]})
+    D.ok(f"{removed} catatan duplikat dihapus.")
+    return removed
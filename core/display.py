@@ -5,6 +5,7 @@
 import sys
 import os
 import shutil
+from contextlib import contextmanager
 from datetime import datetime
 from core.config import VERSION, APP_NAME, TAGLINE
 
@@ -23,11 +24,34 @@ WHITE   = "\033[97m"
 GRAY    = "\033[90m"
 
 _use_color = True  # diset dari engine berdasarkan config
+_input_fn  = input # diganti server/batch supaya prompt tidak baca stdin lokal
+_guard     = None  # engine: context manager di sekitar tiap prompt (lepas lock)
 
 def set_color(enabled: bool):
     global _use_color
     _use_color = enabled
 
+def set_input(fn):
+    """Ganti sumber jawaban prompt interaktif. None → kembali ke input()."""
+    global _input_fn
+    _input_fn = fn or input
+
+@contextmanager
+def prompt_guard(fn):
+    """Selama blok, tiap ask() jalan di dalam `with fn():`."""
+    global _guard
+    prev, _guard = _guard, fn
+    try:
+        yield
+    finally:
+        _guard = prev
+
+def ask(prompt):
+    if _guard is None:
+        return _input_fn(prompt)
+    with _guard():
+        return _input_fn(prompt)
+
 def c(text, *codes):
     if not _use_color:
         return str(text)
@@ -66,6 +90,11 @@ def dim(msg):
 def tag(label, color=MAGENTA):
     return c(f"[{label}]", color)
 
+def clear_screen():
+    """Clear pakai ANSI langsung, tanpa fork shell seperti os.system('clear')."""
+    sys.stdout.write("\033[2J\033[H")
+    sys.stdout.flush()
+
 # ── Banner ────────────────────────────────────────────────
 def print_banner(cfg):
     goal = cfg.get("goal", "")
@@ -92,7 +121,7 @@ def now_pretty():
 
 def confirm(prompt="Yakin? (y/N): "):
     try:
-        ans = input(c(f"  ⚠  {prompt}", YELLOW)).strip().lower()
+        ans = ask(c(f"  ⚠  {prompt}", YELLOW)).strip().lower()
         return ans in ("y", "ya", "yes")
     except (EOFError, KeyboardInterrupt):
         return False
@@ -3,10 +3,17 @@
 # Lazy import untuk hemat RAM di startup
 
 import os
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from core.config import DOCTRINE, LAZY_KEYWORDS, load_config, save_config
+from collections import Counter
+from core.config import DOCTRINE, LAZY_KEYWORDS, DATA_DIR, load_config, save_config, bulk_load
 from core import memory as M
 from core import display as D
+from core import perf
+from core import events
+from core import locks
+from core import membudget
 
 # ── Help ──────────────────────────────────────────────────
 def print_help():
@@ -15,20 +22,27 @@ def print_help():
         ("── CATATAN ──────────────────", ""),
         ("catat <teks>",         "Simpan catatan baru"),
         ("lihat catatan",        "Tampilkan semua catatan"),
+        ("lihat catatan <hal>",  "Halaman tertentu (20 per halaman, 1 = terbaru)"),
         ("hapus catatan <no>",   "Hapus catatan"),
+        ("rapikan",              "Kelompokkan & hapus catatan yang hampir sama"),
         ("── TUGAS ───────────────────", ""),
         ("tugas <teks>",         "Tambah tugas baru"),
+        ("  … @besok !1",        "Jatuh tempo (@hariini/@lusa/@jumat/@+3/@25/10) & prioritas"),
         ("lihat tugas",          "Tampilkan semua tugas"),
+        ("lihat tugas <hal>",    "Halaman tertentu (20 per halaman)"),
+        ("deadline",             "Tugas terlambat, hari ini & 7 hari ke depan"),
         ("selesai <no>",         "Tandai tugas selesai"),
         ("hapus tugas <no>",     "Hapus tugas"),
         ("── MOOD & INSIGHT ─────────", ""),
         ("mood",                 "Check-in mood & energi hari ini"),
-        ("lihat mood",           "Riwayat mood"),
+        ("lihat mood [n]",       "Riwayat mood (default 7)"),
         ("summary",              "Summary harian"),
         ("summary minggu",       "Summary mingguan"),
         ("analisis",             "Analisis produktivitas lokal"),
         ("── SISTEM ──────────────────", ""),
         ("cari <kata>",          "Cari di catatan & tugas"),
+        ("cari #a -#b [kata]",   "Filter tag: punya #a, tanpa #b"),
+        ("cari tipe:tugas ...",  "Query: tipe: status: dari: sampai: \"frasa\" --explain"),
         ("status",               "Ringkasan sistem"),
         ("doktrin",              "Tampilkan doktrin"),
         ("goal",                 "Tampilkan goal aktif"),
@@ -36,8 +50,12 @@ def print_help():
         ("set nama <nama>",      "Ganti username"),
         ("config",               "Lihat konfigurasi"),
         ("ekspor",               "Ekspor data ke TXT"),
+        ("impor <file>",         "Impor catatan/tugas (TXT/CSV/JSONL)"),
+        ("sync <folder>",        "Sync dua arah dengan folder data device lain"),
+        ("backup",               "Backup inkremental data/ (lihat backup: daftar)"),
         ("reset log",            "Hapus semua log"),
         ("lihat log",            "10 log terakhir"),
+        ("lihat perf",           "Latensi p50/p95/p99 per perintah"),
         ("bersih",               "Clear layar"),
         ("exit / quit",          "Keluar"),
     ]
@@ -49,6 +67,11 @@ def print_help():
     D.sep()
 
 # ── Intent Router ────────────────────────────────────────
+def _page_arg(t, prefix):
+    """'lihat catatan 2' → 2; tanpa nomor halaman → None."""
+    rest = t[len(prefix):].strip() if t.startswith(prefix + " ") else ""
+    return int(rest) if rest.isdigit() else None
+
 def route(text):
     t = text.lower().strip()
 
@@ -57,10 +80,15 @@ def route(text):
     if t.startswith("selesai "):                    return "TASK_DONE"
     if t.startswith("hapus catatan"):               return "DEL_NOTE"
     if t.startswith("hapus tugas"):                 return "DEL_TASK"
-    if t in ("lihat catatan", "catatan"):           return "VIEW_NOTES"
-    if t in ("lihat tugas", "tugas"):               return "VIEW_TASKS"
+    if t in ("lihat catatan", "catatan") \
+            or _page_arg(t, "lihat catatan") is not None: return "VIEW_NOTES"
+    if t == "rapikan":                              return "TIDY_NOTES"
+    if t in ("lihat tugas", "tugas") \
+            or _page_arg(t, "lihat tugas") is not None:   return "VIEW_TASKS"
+    if t in ("deadline", "lihat deadline", "jatuh tempo"): return "VIEW_DUE"
     if t.startswith("lihat log") or t == "log":     return "VIEW_LOG"
-    if t == "lihat mood":                           return "VIEW_MOOD"
+    if t == "lihat perf":                           return "VIEW_PERF"
+    if t == "lihat mood" or t.startswith("lihat mood "): return "VIEW_MOOD"
     if t == "mood":                                 return "MOOD_CHECKIN"
     if t == "summary minggu":                       return "SUMMARY_WEEK"
     if t in ("summary", "ringkasan"):               return "SUMMARY_DAY"
@@ -74,14 +102,170 @@ def route(text):
     if t.startswith("cari "):                       return "SEARCH"
     if t == "bersih":                               return "CLEAR"
     if t == "ekspor":                               return "EXPORT"
+    if t.startswith("impor "):                      return "IMPORT"
+    if t.startswith("sync "):                       return "SYNC"
+    if t == "backup":                               return "BACKUP"
+    if t == "lihat backup":                         return "VIEW_BACKUP"
     if t == "reset log":                            return "RESET_LOG"
     if t in ("help", "bantuan", "?"):               return "HELP"
     return "UNKNOWN"
 
+EXIT_WORDS = ("exit", "quit", "keluar", "q")
+
 # ── Goal check ───────────────────────────────────────────
 def violates_goal(text):
     return any(k in text.lower() for k in LAZY_KEYWORDS)
 
+# ── State & satu siklus perintah ─────────────────────────
+def load_state():
+    """Load semua state sekali. Dipakai launcher, server, dan batch."""
+    with locks.transaction(DATA_DIR), bulk_load():
+        state = {
+            "cfg"    : load_config(),
+            "memory" : M.load_memory(),
+            "context": M.load_context(),
+            "logs"   : M.load_logs(),
+        }
+        locks.changed(DATA_DIR)   # titik awal generation counter
+    _binlog(state["cfg"])
+    return state
+
+def _binlog(cfg):
+    if cfg.get("binary_logs"):
+        # Store biner baru diaktifkan → isi dari JSON sebelum log.json dipangkas
+        from core import binlog
+        binlog.enable()
+
+def handle(text, state):
+    """
+    Route → goal enforcement → execute → log → context.
+    Satu-satunya jalur eksekusi perintah; return intent.
+    Tiap perintah diukur (waktu, I/O) dan dicatat ke core/perf.
+    """
+    snap   = perf.begin()
+    intent = "UNKNOWN"
+    # Satu perintah = satu transaksi: proses lain (sesi Termux kedua, `akaru -c`)
+    # menunggu, dan perubahan mereka dimuat dulu sebelum perintah ini jalan.
+    # Prompt di tengah perintah melepas lock (lihat _unlocked).
+    with locks.transaction(DATA_DIR), D.prompt_guard(lambda: _unlocked(state)):
+        refresh(state)
+        cfg = state["cfg"]
+        membudget.begin(cfg)
+        try:
+            intent = _handle(text, state)
+        finally:
+            events.drain()
+            perf.end(snap, intent, ev=events.take_ms(), **membudget.end(cfg))
+    return intent
+
+class StalePrompt(Exception):
+    """Store diubah proses lain selama perintah menunggu jawaban."""
+
+@contextmanager
+def _unlocked(state):
+    """
+    Lock transaksi dilepas selama menunggu jawaban manusia, supaya sesi lain
+    tidak ikut menunggu. Sesudahnya: store di state diubah proses lain →
+    state dimuat ulang dan perintah dibatalkan (jawaban diberikan atas data
+    lama). Di dalam batch / transaksi pemanggil lock tetap dipegang.
+    """
+    txn = locks.txn_lock(DATA_DIR)
+    if txn.held() != 1:
+        yield
+        return
+    with txn.suspended():
+        yield
+    if set(refresh(state)) & _STORES.keys():
+        raise StalePrompt
+
+_STORES = {   # file di data/ → (kunci state, loader)
+    "memory.json" : ("memory",  M.load_memory),
+    "context.json": ("context", M.load_context),
+    "log.json"    : ("logs",    M.load_logs),
+    "config.json" : ("cfg",     load_config),
+}
+
+def refresh(state):
+    """
+    Store yang diubah proses lain sejak terakhir dilihat → muat ulang ke state.
+    Biaya normal satu stat (generation counter). Index di RAM ikut membangun
+    ulang sendiri (list record baru); modul lain dapat event STORE_CHANGED.
+    Return daftar file yang dimuat ulang.
+    """
+    names = locks.changed(DATA_DIR)
+    for name in names:
+        if name in _STORES:
+            key, loader = _STORES[name]
+            state[key] = loader()
+        events.publish(events.STORE_CHANGED, path=os.path.join(DATA_DIR, name))
+    if "config.json" in names:
+        _binlog(state["cfg"])   # binary_logs bisa dinyalakan dari luar proses ini
+    return names
+
+def _handle(text, state):
+    intent = route(text)
+
+    # Goal enforcement — hanya untuk input konten
+    if intent in ("NOTE", "TASK_ADD") and violates_goal(text):
+        D.warn("Ditahan: bertentangan dengan goal aktif.")
+        _log(state, intent, ok=False, note="goal_violation")
+        return intent
+
+    try:
+        execute(intent, text, state)
+    except StalePrompt:
+        D.warn("Data diubah sesi lain selama menunggu jawaban — dibatalkan, ulangi perintah.")
+        _log(state, intent, ok=False, note="stale_prompt")
+        return intent
+    _log(state, intent, ok=True)
+    M.update_context(state["context"], intent)
+    return intent
+
+def _log(state, intent, ok, note=""):
+    cfg   = state["cfg"]
+    entry = M.append_log(state["logs"], intent, ok=ok, note=note,
+                         max_logs=cfg.get("max_logs", 80))
+    events.publish(events.COMMAND_LOGGED, rec=entry, cfg=cfg)
+
+def run_batch(lines, state):
+    """
+    Jalankan banyak perintah dengan satu commit di akhir.
+    Baris kosong & komentar (#) dilewati, 'exit' menghentikan batch.
+    Kalau ada error, tidak ada yang ditulis ke disk.
+    Return dict statistik throughput.
+    """
+    from core.config import begin_batch, commit_batch, abort_batch
+    intents = Counter()
+    lineno  = 0
+    start   = time.perf_counter()
+    # Seluruh batch satu transaksi: tidak ada proses lain di antara perintah & commit
+    with locks.transaction(DATA_DIR):
+        begin_batch()
+        try:
+            for lineno, raw in enumerate(lines, 1):
+                text = raw.strip()
+                if not text or text.startswith("#"):
+                    continue
+                if text.lower() in EXIT_WORDS:
+                    break
+                intents[handle(text, state)] += 1
+        except BaseException:
+            abort_batch()
+            raise
+        exec_s  = time.perf_counter() - start
+        files   = commit_batch()
+    total_s = time.perf_counter() - start
+    count   = sum(intents.values())
+    return {
+        "commands": count,
+        "lines"   : lineno,
+        "files"   : files,
+        "exec_s"  : exec_s,
+        "total_s" : total_s,
+        "rate"    : count / total_s if total_s > 0 else 0.0,
+        "intents" : intents,
+    }
+
 # ── Executor ─────────────────────────────────────────────
 def execute(intent, text, state):
     """
@@ -100,9 +284,15 @@ def execute(intent, text, state):
         if not body:
             D.err("Isi catatan tidak boleh kosong.")
             return
+        from core.dedup import similar
+        dupes = similar(mem, body)
         note = M.add_note(mem, body)
         M.update_context(ctx, intent, note_text=body)
         D.ok(f"Catatan #{note['id']} disimpan.")
+        if dupes:
+            other, sim = dupes[0]
+            D.warn(f"Mirip catatan #{other['id']} ({sim:.0%}): {other['v'][:50]}")
+            D.dim("Ketik 'rapikan' untuk membersihkan catatan yang mirip.")
 
     elif intent == "VIEW_NOTES":
         notes = mem.get("notes", [])
@@ -110,12 +300,20 @@ def execute(intent, text, state):
             D.dim("Belum ada catatan.")
             return
         D.header("CATATAN", D.CYAN)
-        for n in notes:
+        shown, num, pages = membudget.page(notes, _page_arg(t.lower(), "lihat catatan"))
+        if pages > 1:
+            more = f" · 'lihat catatan {num + 1}' untuk yang lebih lama" if num < pages else ""
+            D.dim(f"Halaman {num}/{pages} ({len(shown)} dari {len(notes)} catatan){more}")
+        for n in shown:
             ts = D.c(f" {n['t'][:10]}", D.GRAY) if cfg.get("show_timestamps") else ""
             nid = D.c(f"#{n['id']}", D.MAGENTA, D.BOLD)
             print(f"  {nid}  {n['v']}{ts}")
         D.sep()
 
+    elif intent == "TIDY_NOTES":
+        from core.dedup import show_tidy
+        show_tidy(mem)
+
     elif intent == "DEL_NOTE":
         try:
             num = int(t.split()[-1])
@@ -132,12 +330,14 @@ def execute(intent, text, state):
 
     # ── Tugas ─────────────────────────────────────────────
     elif intent == "TASK_ADD":
-        body = t[6:].strip()
+        from core.deadline import parse_due, label
+        body, due, pri = parse_due(t[6:].strip())
         if not body:
             D.err("Isi tugas tidak boleh kosong.")
             return
-        task = M.add_task(mem, body)
-        D.ok(f"Tugas #{task['id']} ditambahkan.")
+        task = M.add_task(mem, body, due=due, pri=pri)
+        extra = f" (jatuh tempo {label(due)})" if due else ""
+        D.ok(f"Tugas #{task['id']} ditambahkan{extra}.")
 
     elif intent == "VIEW_TASKS":
         tasks = mem.get("tasks", [])
@@ -147,17 +347,32 @@ def execute(intent, text, state):
         D.header("TUGAS", D.CYAN)
         pending  = [t for t in tasks if not t.get("done")]
         done_lst = [t for t in tasks if t.get("done")]
+        n_pending, n_done = len(pending), len(done_lst)
+        number            = _page_arg(t.lower(), "lihat tugas")
+        pending, num, pp  = membudget.page(pending, number)
+        done_lst, _, pd   = membudget.page(done_lst, number)
+        pages             = max(pp, pd)
+        if pages > 1:
+            num  = min(max(number or 1, 1), pages)
+            # Daftar yang lebih pendek sudah habis di halaman ini
+            if num > pp: pending  = []
+            if num > pd: done_lst = []
+            more = f" · 'lihat tugas {num + 1}' untuk yang lebih lama" if num < pages else ""
+            D.dim(f"Halaman {num}/{pages}{more}")
         for tk in pending:
             ts  = D.c(f" {tk['t'][:10]}", D.GRAY) if cfg.get("show_timestamps") else ""
             tid = D.c(f"#{tk['id']}", D.YELLOW, D.BOLD)
-            print(f"  {tid} {D.c('[ ]', D.GRAY)} {tk['v']}{ts}")
+            print(f"  {tid} {D.c('[ ]', D.GRAY)} {tk['v']}{_due_tag(tk)}{ts}")
         for tk in done_lst:
             tid = D.c(f"#{tk['id']}", D.GRAY)
             print(f"  {tid} {D.c('[✓]', D.GREEN)} {D.c(tk['v'], D.GRAY)}")
         D.blank()
-        D.dim(f"{len(pending)} aktif · {len(done_lst)} selesai")
+        D.dim(f"{n_pending} aktif · {n_done} selesai")
         D.sep()
 
+    elif intent == "VIEW_DUE":
+        _show_due(mem)
+
     elif intent == "TASK_DONE":
         try:
             num = int(t.split()[1])
@@ -191,7 +406,13 @@ def execute(intent, text, state):
 
     elif intent == "VIEW_MOOD":
         from core.mood import view_mood
-        view_mood()
+        arg = t.split()[2:]
+        try:
+            n = int(arg[0]) if arg else 7
+        except ValueError:
+            D.err("Format: lihat mood <jumlah>")
+            return
+        view_mood(max(n, 1))
 
     # ── Summary ───────────────────────────────────────────
     elif intent == "SUMMARY_DAY":
@@ -211,6 +432,7 @@ def execute(intent, text, state):
     elif intent == "STATUS":
         from core.analyzer import productivity_score
         from core.mood import mood_stats
+        from core import tags
         ps    = productivity_score(mem)
         ms    = mood_stats()
         tasks = mem.get("tasks", [])
@@ -222,12 +444,27 @@ def execute(intent, text, state):
         D.info("Catatan total",   str(len(mem.get("notes", []))))
         D.info("Tugas aktif",     str(len([t for t in tasks if not t.get("done")])))
         D.info("Tugas selesai",   str(len([t for t in tasks if t.get("done")])))
+        top = tags.top_tags(mem, 5)
+        if top:
+            D.info("Tag teratas",     "  ".join(f"#{tag} {n}" for tag, n in top))
+        due_line = _due_status(mem)
+        if due_line:
+            D.info("Jatuh tempo",     due_line)
+        D.info("Memori",          membudget.status_line(cfg))
         D.blank()
         score = ps["score"]
         sc    = D.GREEN if score >= 70 else (D.YELLOW if score >= 40 else D.RED)
         D.info("Produktivitas",   D.c(f"{score}/100", sc, D.BOLD))
         if ms:
             D.info("Mood terakhir",   f"{ms['last_mood']}/5  Energi {ms['last_energy']}/5")
+            w7, w30 = ms["windows"][7], ms["windows"][30]
+            if w30:
+                trend = ""
+                if ms["trend"] is not None:
+                    arrow = "↑" if ms["trend"] > 0 else ("↓" if ms["trend"] < 0 else "→")
+                    trend = f"  {arrow} {ms['trend']:+.1f}"
+                w7_str = f"{w7['avg_mood']}" if w7 else "-"
+                D.info("Mood 7/30 hari", f"{w7_str} / {w30['avg_mood']}{trend}")
         if ctx.get("last_note"):
             D.blank()
             D.info("Catatan terakhir", D.c(ctx['last_note'][:40], D.GRAY))
@@ -246,6 +483,9 @@ def execute(intent, text, state):
             print(f"  {D.c(e['t'], D.GRAY)}  [{s}]  {D.c(e.get('i','?'), D.YELLOW)}")
         D.sep()
 
+    elif intent == "VIEW_PERF":
+        perf.show_perf()
+
     elif intent == "DOCTRINE":
         D.header("DOKTRIN AKARU", D.MAGENTA)
         for i, d in enumerate(DOCTRINE, 1):
@@ -282,35 +522,37 @@ def execute(intent, text, state):
         D.sep()
 
     elif intent == "SEARCH":
-        query = t[5:].strip().lower()
+        from core.query import show_search
+        query = t[5:].strip()
         if not query:
             D.err("Masukkan kata kunci.")
             return
-        found = 0
-        D.header(f"PENCARIAN: '{query}'", D.CYAN)
-        for n in mem.get("notes", []):
-            if query in n["v"].lower():
-                print(f"  {D.c('Catatan', D.MAGENTA)} #{n['id']}: {n['v']}")
-                found += 1
-        for tk in mem.get("tasks", []):
-            if query in tk["v"].lower():
-                status = D.c("[✓]", D.GREEN) if tk.get("done") else D.c("[ ]", D.GRAY)
-                print(f"  {D.c('Tugas', D.YELLOW)} #{tk['id']} {status}: {tk['v']}")
-                found += 1
-        D.sep()
-        if found == 0:
-            D.dim(f"Tidak ada hasil untuk '{query}'.")
-        else:
-            D.ok(f"{found} hasil ditemukan.")
+        show_search(state, query)
 
     elif intent == "CLEAR":
-        os.system("clear")
+        D.clear_screen()
         from core.display import print_banner
         print_banner(cfg)
 
     elif intent == "EXPORT":
         _export(mem, cfg)
 
+    elif intent == "IMPORT":
+        from core.importer import show_import
+        show_import(t[6:].strip(), mem)
+
+    elif intent == "SYNC":
+        from core.sync import sync_dir
+        sync_dir(t[5:].strip(), mem)
+
+    elif intent == "BACKUP":
+        from core.backup import show_create
+        show_create()
+
+    elif intent == "VIEW_BACKUP":
+        from core.backup import show_list
+        show_list()
+
     elif intent == "RESET_LOG":
         if D.confirm("Reset semua log? (y/N): "):
             logs.clear()
@@ -325,6 +567,54 @@ def execute(intent, text, state):
     else:
         D.dim("Perintah tidak dikenal. Ketik 'help'.")
 
+# ── Deadline ─────────────────────────────────────────────
+def _due_tag(tk):
+    """' !1 · besok' untuk tugas aktif yang punya prioritas / jatuh tempo."""
+    from core.deadline import label
+    out = ""
+    if tk.get("pri"):
+        out += " " + D.c(f"!{tk['pri']}", D.RED if tk["pri"] == 1 else D.YELLOW, D.BOLD)
+    if tk.get("due") and not tk.get("done"):
+        when = label(tk["due"])
+        out += " " + D.c(f"· {when}", D.RED if when.startswith("terlambat") else D.CYAN)
+    return out
+
+def _due_status(mem):
+    """Satu baris untuk status: jumlah terlambat + tugas berikutnya (dari index)."""
+    from core import deadline
+    late = deadline.overdue(mem)
+    nxt  = deadline.next_due(mem, len(late) + 1)[len(late):]
+    parts = []
+    if late:
+        parts.append(D.c(f"{len(late)} terlambat", D.RED, D.BOLD))
+    if nxt:
+        parts.append(f"berikutnya #{nxt[0]['id']} {deadline.label(nxt[0]['due'])}")
+    return "  ·  ".join(parts)
+
+def _show_due(mem):
+    from core import deadline
+    late  = deadline.overdue(mem)
+    today = deadline.due_today(mem)
+    week  = deadline.due_within(mem, 7)[len(today):]
+    D.header("JATUH TEMPO", D.CYAN)
+    if not (late or today or week):
+        nxt = deadline.next_due(mem)
+        D.dim("Tidak ada tugas jatuh tempo dalam 7 hari.")
+        if nxt:
+            D.dim(f"Berikutnya: #{nxt[0]['id']} {nxt[0]['v']} ({nxt[0]['due']})")
+        D.sep()
+        return
+    for title, rows, color in (("Terlambat", late, D.RED), ("Hari ini", today, D.YELLOW),
+                               ("7 hari ke depan", week, D.CYAN)):
+        if not rows:
+            continue
+        print(f"  {D.c(title + ':', D.WHITE, D.BOLD)}  {D.c(f'({len(rows)})', color)}")
+        for tk in rows:
+            tid = D.c(f"#{tk['id']}", color, D.BOLD)
+            print(f"  {tid} {tk['v']}{_due_tag(tk)}")
+        D.blank()
+    D.sep()
+
 # ── Export ───────────────────────────────────────────────
 def _export(mem, cfg):
     from datetime import datetime
@@ -0,0 +1,108 @@
+# core/events.py
+# AKARU – Event Bus (in-process)
+# core/memory, core/mood dan core/engine mengumumkan perubahan data; index &
+# rollup (tag, query, dedup, deadline, topik, log biner) berlangganan dan
+# merawat dirinya sendiri — tidak ada lagi daftar hook di tiap fungsi memory.
+#
+#   publish(NOTE_ADDED, memory=m, rec=note)
+#   subscribe(NOTE_ADDED, fn)                 → fn(memory=m, rec=note), langsung
+#   subscribe(NOTE_ADDED, fn, deferred=True)  → diantrekan, jalan di drain()
+#   subscribe(..., deferred=True, coalesce=True) → paling banyak sekali per drain()
+#
+# Handler sinkron dipakai index yang dibaca perintah berikutnya (harus sudah
+# benar begitu publish kembali). Handler deferred (mis. sidecar yang menulis
+# file) dijalankan engine.handle setelah perintah selesai, sebelum perf dicatat.
+# Waktu tiap handler dikumpulkan di `stats`; total per perintah masuk perf ("ev").
+
+import time
+from importlib import import_module
+
+# ── Tipe event (payload: keyword) ─────────────────────────
+NOTE_ADDED     = "note.added"       # memory, rec
+NOTE_DELETED   = "note.deleted"     # memory, rec  (sudah keluar dari list)
+TASK_ADDED     = "task.added"       # memory, rec
+TASK_CHANGING  = "task.changing"    # memory, rec  (sebelum diubah, selalu sinkron)
+TASK_CHANGED   = "task.changed"     # memory, rec  (sesudah diubah)
+TASK_DELETED   = "task.deleted"     # memory, rec
+MOOD_LOGGED    = "mood.logged"      # rec
+COMMAND_LOGGED = "command.logged"   # rec, cfg
+STORE_CHANGED  = "store.changed"    # path  (diubah proses lain, lihat core/locks)
+
+# Modul yang mendaftarkan handler saat di-import. Di-import malas saat
+# publish pertama, jadi pengirim event tidak perlu tahu siapa pendengarnya.
+SUBSCRIBERS = ("core.deadline", "core.tags", "core.query", "core.dedup", "core.topics",
+               "core.synctree")
+
+_subs    = {}     # event → [(nama, fn, deferred, coalesce)]
+_queue   = []     # (nama, fn, payload) menunggu drain()
+_queued  = set()  # handler coalesce yang sudah ada di antrean
+_loaded  = False
+stats    = {}     # nama handler → [panggilan, detik total, detik maks]
+_spent   = 0.0    # detik handler sejak take_ms() terakhir
+
+def subscribe(event, fn, deferred=False, name=None, coalesce=False):
+    """
+    coalesce: handler deferred yang membaca state terkini sendiri (payload
+    diabaikan selain yang pertama) — import massal cukup satu entri antrean.
+    """
+    name = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+    subs = _subs.setdefault(event, [])
+    if all(f is not fn for _, f, _, _ in subs):
+        subs.append((name, fn, deferred, coalesce))
+    return fn
+
+def _load():
+    global _loaded
+    _loaded = True
+    for mod in SUBSCRIBERS:
+        import_module(mod)
+
+def _run(name, fn, payload):
+    global _spent
+    t0 = time.perf_counter()
+    try:
+        fn(**payload)
+    finally:
+        dt = time.perf_counter() - t0
+        st = stats.get(name)
+        if st is None:
+            st = stats[name] = [0, 0.0, 0.0]
+        st[0] += 1
+        st[1] += dt
+        if dt > st[2]:
+            st[2] = dt
+        _spent += dt
+
+def publish(event, **payload):
+    if not _loaded:
+        _load()
+    for name, fn, deferred, coalesce in _subs.get(event, ()):
+        if not deferred:
+            _run(name, fn, payload)
+        elif not coalesce:
+            _queue.append((name, fn, payload))
+        elif fn not in _queued:
+            _queued.add(fn)
+            _queue.append((name, fn, payload))
+
+def drain():
+    """Jalankan handler deferred yang mengantre (urutan publish). Return jumlahnya."""
+    n = 0
+    while _queue:
+        name, fn, payload = _queue.pop(0)
+        _queued.discard(fn)
+        _run(name, fn, payload)
+        n += 1
+    return n
+
+def take_ms():
+    """Total waktu handler sejak panggilan terakhir (ms) — untuk record perf per perintah."""
+    global _spent
+    ms, _spent = _spent * 1000, 0.0
+    return round(ms, 3)
+
+def handlers(top=5):
+    """[(nama, panggilan, total ms, rata-rata µs, maks ms)] terlama dulu."""
+    rows = [(name, n, s * 1000, s / n * 1e6 if n else 0.0, mx * 1000)
+            for name, (n, s, mx) in stats.items()]
+    return sorted(rows, key=lambda r: -r[2])[:top]
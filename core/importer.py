@@ -0,0 +1,213 @@
+# core/importer.py
+# AKARU – Bulk Import
+# Stream catatan & tugas dari TXT / CSV / JSONL ke memory.json
+# Validasi → dedup → id massal → commit per chunk (RAM input tetap kecil)
+
+import csv
+import json
+import os
+import time
+import hashlib
+from datetime import datetime
+from core import display as D
+from core import memory as M
+from core.engine import violates_goal
+
+CHUNK_SIZE   = 20000  # record per commit
+MAX_TEXT_LEN = 2000   # teks lebih panjang dianggap tidak valid
+
+NOTE_TYPES = ("note", "catatan", "catat", "n")
+TASK_TYPES = ("task", "tugas", "t")
+
+# ── Parser per format ─────────────────────────────────────
+# Semua parser yield dict {"kind", "v", "t", "done", "done_at"} (mentah, belum divalidasi)
+
+def _parse_txt(f):
+    """
+    Satu baris = satu record.
+      'tugas ...', '- [ ] ...', '- [x] ...' → tugas
+      'catat ...' / baris lain            → catatan
+    """
+    for line in f:
+        s  = line.strip()
+        lo = s.lower()
+        if not s:
+            continue
+        if lo.startswith(("- [ ] ", "[ ] ")):
+            yield {"kind": "task", "v": s.split("] ", 1)[1]}
+        elif lo.startswith(("- [x] ", "[x] ")):
+            yield {"kind": "task", "v": s.split("] ", 1)[1], "done": True}
+        elif lo.startswith("tugas "):
+            yield {"kind": "task", "v": s[6:]}
+        elif lo.startswith("catat "):
+            yield {"kind": "note", "v": s[6:]}
+        else:
+            yield {"kind": "note", "v": s}
+
+def _parse_csv(f):
+    """Kolom dikenali: tipe/type, teks/text/v, waktu/t, selesai/done. Tanpa header → kolom 1 = teks."""
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    cols = [h.strip().lower() for h in header]
+
+    def col(*names):
+        for n in names:
+            if n in cols:
+                return cols.index(n)
+        return None
+
+    i_text = col("teks", "text", "v", "isi")
+    if i_text is None:  # tidak ada header, baris pertama juga data
+        i_text, i_kind, i_t, i_done = 0, None, None, None
+        rows = [header]
+    else:
+        i_kind, i_t, i_done = col("tipe", "type", "kind"), col("waktu", "t", "time"), col("selesai", "done")
+        rows = []
+
+    def rec(row):
+        get = lambda i: row[i].strip() if i is not None and i < len(row) else ""
+        return {
+            "kind": get(i_kind) or "note",
+            "v"   : get(i_text),
+            "t"   : get(i_t),
+            "done": get(i_done).lower() in ("1", "true", "ya", "y", "x", "selesai"),
+        }
+
+    for row in rows:
+        yield rec(row)
+    for row in reader:
+        if row:
+            yield rec(row)
+
+def _parse_jsonl(f):
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            obj = json.loads(line)
+        except ValueError:
+            yield {"kind": "?", "v": ""}  # dihitung sebagai invalid
+            continue
+        if not isinstance(obj, dict):
+            yield {"kind": "?", "v": ""}
+            continue
+        yield {
+            "kind"   : obj.get("type") or obj.get("tipe") or "note",
+            "v"      : obj.get("v") or obj.get("text") or obj.get("teks") or "",
+            "t"      : obj.get("t") or obj.get("time") or "",
+            "done"   : bool(obj.get("done")),
+            "done_at": obj.get("done_at") or "",
+        }
+
+PARSERS = {".txt": _parse_txt, ".csv": _parse_csv, ".jsonl": _parse_jsonl, ".ndjson": _parse_jsonl}
+
+# ── Validasi & dedup ──────────────────────────────────────
+def _norm_ts(ts):
+    if not ts:
+        return None
+    try:
+        return datetime.fromisoformat(str(ts)).isoformat(timespec="seconds")
+    except ValueError:
+        return False
+
+def _key(text):
+    """Hash 8 byte dari teks ternormalisasi — set dedup tetap kecil walau 100k baris."""
+    norm = " ".join(text.lower().split())
+    return int.from_bytes(hashlib.blake2b(norm.encode("utf-8"), digest_size=8).digest(), "big")
+
+def _validate(rec):
+    """Return (kind, teks, waktu, done, done_at) atau None kalau invalid."""
+    kind = str(rec.get("kind", "")).strip().lower()
+    kind = "note" if kind in NOTE_TYPES else ("task" if kind in TASK_TYPES else None)
+    text = str(rec.get("v") or "").strip()
+    if kind is None or not text or len(text) > MAX_TEXT_LEN:
+        return None
+    t       = _norm_ts(rec.get("t"))
+    done_at = _norm_ts(rec.get("done_at"))
+    if t is False or done_at is False:
+        return None
+    return kind, text, t, bool(rec.get("done")), done_at
+
+# ── Pipeline ──────────────────────────────────────────────
+def import_file(path, memory, chunk_size=CHUNK_SIZE, progress=True):
+    """
+    Import file ke `memory`. Return dict statistik.
+    Record yang sudah ada (teks sama, tipe sama) atau duplikat di input dilewati.
+    """
+    ext    = os.path.splitext(path)[1].lower()
+    parser = PARSERS.get(ext)
+    if parser is None:
+        raise ValueError(f"Format tidak didukung: '{ext}' (pakai .txt, .csv, .jsonl)")
+
+    seen = {
+        "note": {_key(n["v"]) for n in memory["notes"]},
+        "task": {_key(t["v"]) for t in memory["tasks"]},
+    }
+    stats = {"read": 0, "notes": 0, "tasks": 0, "dup": 0, "invalid": 0, "goal": 0}
+    notes, tasks = [], []
+    start = time.perf_counter()
+
+    def commit():
+        n, t = M.add_many(memory, notes, tasks)
+        stats["notes"] += n
+        stats["tasks"] += t
+        notes.clear()
+        tasks.clear()
+        if progress:
+            elapsed = time.perf_counter() - start
+            rate    = stats["read"] / elapsed if elapsed > 0 else 0
+            D.dim(f"{stats['read']} baris · {stats['notes'] + stats['tasks']} masuk · {rate:.0f} rec/detik")
+
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for raw in parser(f):
+            stats["read"] += 1
+            rec = _validate(raw)
+            if rec is None:
+                stats["invalid"] += 1
+                continue
+            kind, text, t, done, done_at = rec
+            if violates_goal(text):
+                stats["goal"] += 1
+                continue
+            k = _key(text)
+            if k in seen[kind]:
+                stats["dup"] += 1
+                continue
+            seen[kind].add(k)
+            if kind == "note":
+                notes.append((text, t))
+            else:
+                tasks.append((text, t, done, done_at))
+            if len(notes) + len(tasks) >= chunk_size:
+                commit()
+    commit()  # sisa chunk terakhir
+
+    stats["elapsed"] = time.perf_counter() - start
+    stats["rate"]    = stats["read"] / stats["elapsed"] if stats["elapsed"] > 0 else 0.0
+    return stats
+
+def show_import(path, memory):
+    """Dipanggil engine untuk perintah `impor <file>`."""
+    path = os.path.expanduser(path)
+    if not os.path.isfile(path):
+        D.err(f"File tidak ditemukan: {path}")
+        return
+    D.header(f"IMPOR: {os.path.basename(path)}", D.CYAN)
+    try:
+        st = import_file(path, memory)
+    except (ValueError, UnicodeDecodeError) as e:
+        D.err(str(e))
+        return
+    D.blank()
+    D.info("Baris dibaca",      str(st["read"]))
+    D.info("Catatan masuk",     str(st["notes"]))
+    D.info("Tugas masuk",       str(st["tasks"]))
+    D.info("Duplikat dilewati", str(st["dup"]))
+    D.info("Tidak valid",       str(st["invalid"]))
+    if st["goal"]:
+        D.info("Ditahan (goal)", str(st["goal"]))
+    D.info("Kecepatan",         f"{st['rate']:.0f} rec/detik ({st['elapsed']:.2f} detik)")
+    D.sep()
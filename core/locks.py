@@ -0,0 +1,216 @@
+# core/locks.py
+# AKARU – Lock Antar Proses & Generation Counter
+# CLI interaktif, server, `akaru -c` dan brain.py bisa jalan bersamaan di sesi
+# Termux berbeda. Tanpa koordinasi, read-modify-write di dua proses saling
+# menimpa. Tiga lapis:
+#
+#   1. Lock per store (fcntl.flock) di <dir>/.locks/<file>.lock — shared
+#      untuk baca, exclusive untuk tulis. File lock terpisah karena file data
+#      sendiri diganti lewat rename (inode baru tiap save).
+#   2. Transaksi per folder (<dir>/.locks/txn.lock, exclusive): satu perintah
+#      = baca state → ubah → save, tidak diselingi proses lain.
+#   3. Generation counter <dir>/.generation ({file: n}) naik tiap save.
+#      Proses yang lama hidup cukup stat satu file kecil per perintah; hanya
+#      store yang n-nya berubah oleh proses lain yang dimuat ulang.
+#
+# Semua lock reentrant per thread (hitungan). flock memang per proses, jadi
+# antar thread di satu proses (writer latar, server) ada lock baca/tulis
+# sendiri di atasnya. shared → exclusive di lock yang sama = LockUpgradeError.
+# Tanpa fcntl (non-POSIX) lock jadi no-op; generation counter tetap jalan.
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:   # pragma: no cover — Windows
+    fcntl = None
+
+LOCK_DIR = ".locks"
+GEN_FILE = ".generation"
+
+# ── Lock file ─────────────────────────────────────────────
+class LockUpgradeError(RuntimeError):
+    """Thread yang memegang lock shared minta exclusive di lock yang sama."""
+
+class FileLock:
+    """
+    flock untuk proses + lock baca/tulis antar thread di proses ini. Reentrant
+    per thread (hitungan per thread): thread lain tetap menunggu, walau flock
+    sudah dipegang prosesnya. Naik shared → exclusive tidak didukung (flock
+    melepas lalu mengambil ulang — tidak atomik) → LockUpgradeError.
+    """
+    __slots__ = ("path", "fd", "_cv", "_depth", "_writer")
+
+    def __init__(self, path):
+        self.path    = path
+        self.fd      = None
+        self._cv     = threading.Condition(threading.Lock())
+        self._depth  = {}     # thread id → hitungan reentrant
+        self._writer = None   # thread id pemegang exclusive
+
+    def held(self):
+        """Hitungan lock ini di thread pemanggil (0 = tidak dipegang)."""
+        return self._depth.get(threading.get_ident(), 0)
+
+    def acquire(self, exclusive=True):
+        me = threading.get_ident()
+        with self._cv:
+            n = self._depth.get(me)
+            if n:
+                if exclusive and self._writer != me:
+                    raise LockUpgradeError(f"lock shared tidak bisa dinaikkan: {self.path}")
+                self._depth[me] = n + 1
+                return
+            while self._writer is not None or (exclusive and self._depth):
+                self._cv.wait()
+            if not self._depth:
+                self._flock(exclusive)   # thread pertama di proses ini
+            self._depth[me] = 1
+            if exclusive:
+                self._writer = me
+
+    def release(self):
+        me = threading.get_ident()
+        with self._cv:
+            n = self._depth.get(me, 0)
+            if n > 1:
+                self._depth[me] = n - 1
+            elif n:
+                self._drop(me)
+
+    def _flock(self, exclusive):
+        if self.fd is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+    def _drop(self, me):
+        del self._depth[me]
+        if self._writer == me:
+            self._writer = None
+        if not self._depth and fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        self._cv.notify_all()
+
+    @contextmanager
+    def hold(self, exclusive=True):
+        self.acquire(exclusive)
+        try:
+            yield self
+        finally:
+            self.release()
+
+    @contextmanager
+    def suspended(self):
+        """
+        Lepas semua tingkat lock milik thread ini selama blok (menunggu jawaban
+        manusia), lalu ambil lagi dengan mode & hitungan yang sama.
+        """
+        me = threading.get_ident()
+        with self._cv:
+            n    = self._depth.get(me, 0)
+            excl = self._writer == me
+            if n:
+                self._drop(me)
+        try:
+            yield
+        finally:
+            if n:
+                self.acquire(excl)
+                with self._cv:
+                    self._depth[me] = n
+
+_locks = {}
+_mu    = threading.Lock()
+
+def lock_for(path):
+    """FileLock untuk store `path` (satu objek per lock file per proses)."""
+    lpath = os.path.join(os.path.dirname(os.path.abspath(path)), LOCK_DIR,
+                         os.path.basename(path) + ".lock")
+    with _mu:
+        lk = _locks.get(lpath)
+        if lk is None:
+            lk = _locks[lpath] = FileLock(lpath)
+    return lk
+
+def shared(path):
+    return lock_for(path).hold(exclusive=False)
+
+def exclusive(path):
+    return lock_for(path).hold(exclusive=True)
+
+def txn_lock(folder):
+    return lock_for(os.path.join(folder, "txn"))
+
+def transaction(folder):
+    """Exclusive untuk seluruh folder: satu read-modify-write utuh."""
+    return txn_lock(folder).hold(exclusive=True)
+
+# ── Generation counter ────────────────────────────────────
+_seen = {}   # folder → (stat_key file generation, {file: n} yang sudah dilihat)
+
+def _gen_path(folder):
+    return os.path.join(folder, GEN_FILE)
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+def _read(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def generations(folder):
+    """{file: n} saat ini untuk folder."""
+    with shared(_gen_path(folder)):
+        return _read(_gen_path(folder))
+
+def bump(path):
+    """Store `path` baru saja ditulis proses ini → naikkan n-nya. Return n baru."""
+    folder, name = os.path.split(os.path.abspath(path))
+    gpath = _gen_path(folder)
+    with exclusive(gpath):
+        gens = _read(gpath)
+        gens[name] = n = gens.get(name, 0) + 1
+        tmp = gpath + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(gens, f, separators=(",", ":"))
+        os.replace(tmp, gpath)
+        key = _stat(gpath)
+    seen = _seen.get(folder)
+    if seen is not None:
+        # Tulisan sendiri tidak perlu dimuat ulang
+        seen[1][name] = n
+        if seen[1] == gens:
+            _seen[folder] = (key, seen[1])
+    return n
+
+def changed(folder):
+    """
+    File di folder yang diubah proses lain sejak panggilan terakhir.
+    Panggilan pertama hanya mencatat posisi awal dan return []. Biaya normal:
+    satu stat — file generation hanya dibaca kalau stat-nya berubah.
+    """
+    folder = os.path.abspath(folder)
+    gpath  = _gen_path(folder)
+    key    = _stat(gpath)
+    seen   = _seen.get(folder)
+    if seen is not None and seen[0] == key:
+        return []
+    gens = generations(folder)
+    _seen[folder] = (key, gens)
+    if seen is None:
+        return []
+    old = seen[1]
+    return sorted(name for name, n in gens.items() if old.get(name) != n)
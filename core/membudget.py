@@ -0,0 +1,108 @@
+# core/membudget.py
+# AKARU – Memory Budget Monitor
+# Pantau RSS (dan opsional peak tracemalloc) per perintah.
+# Mendekati batas `mem_budget_mb` → mode hemat RAM:
+# cache dilepas, view di-paging, analyzer baca JSON secara streaming.
+
+import gc
+import os
+
+MB          = 1024 * 1024
+WARN_RATIO  = 0.85   # RSS ≥ 85% budget → masuk mode hemat
+CLEAR_RATIO = 0.70   # RSS < 70% budget → keluar mode hemat (histeresis)
+PAGE_SIZE   = 20     # baris per halaman saat mode hemat
+
+_state = {
+    "low"       : False,
+    "rss"       : 0,
+    "peak_rss"  : 0,
+    "trace_peak": 0,
+}
+_releasers = []
+
+# ── Pengukuran ────────────────────────────────────────────
+def rss_bytes():
+    """RSS saat ini. /proc/self/statm di Linux/Android, fallback ru_maxrss (peak)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except (ImportError, OSError):
+        return 0
+
+def budget_bytes(cfg):
+    return int(cfg.get("mem_budget_mb", 96) * MB)
+
+# ── Mode hemat ────────────────────────────────────────────
+def register_release(fn):
+    """Daftarkan fungsi pelepas cache, dipanggil saat masuk mode hemat."""
+    if fn not in _releasers:
+        _releasers.append(fn)
+
+def low_mem():
+    return _state["low"]
+
+def _enter_low():
+    _state["low"] = True
+    for fn in _releasers:
+        try:
+            fn()
+        except Exception:
+            pass
+    gc.collect()
+
+# ── Hook per perintah (dipanggil engine.handle) ───────────
+def begin(cfg):
+    if cfg.get("mem_trace"):
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+
+def end(cfg):
+    """Ukur memori setelah perintah, update mode hemat. Return dict untuk perf."""
+    rss = rss_bytes()
+    _state["rss"]      = rss
+    _state["peak_rss"] = max(_state["peak_rss"], rss)
+    out = {"rss_kb": rss // 1024}
+
+    if cfg.get("mem_trace"):
+        import tracemalloc
+        if tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1]
+            _state["trace_peak"] = max(_state["trace_peak"], peak)
+            out["tm_kb"] = peak // 1024
+
+    budget = budget_bytes(cfg)
+    if budget and rss:
+        if not _state["low"] and rss >= budget * WARN_RATIO:
+            _enter_low()
+        elif _state["low"] and rss < budget * CLEAR_RATIO:
+            _state["low"] = False
+    return out
+
+def status_line(cfg):
+    """Teks ringkas untuk `status`: pemakaian, budget, sisa."""
+    rss    = _state["rss"] or rss_bytes()
+    budget = budget_bytes(cfg)
+    line   = f"{rss / MB:.1f} MB / {budget / MB:.0f} MB (sisa {max(budget - rss, 0) / MB:.1f} MB)"
+    if _state["low"]:
+        line += " · mode hemat"
+    return line
+
+def page(items, number=None):
+    """
+    Halaman `number` dari items (1 = PAGE_SIZE item terbaru, 2 = sebelumnya, ...).
+    Tanpa nomor: mode hemat → halaman 1, selain itu semua item sekaligus.
+    Return (items, halaman, jumlah_halaman).
+    """
+    if (number is None and not _state["low"]) or len(items) <= PAGE_SIZE:
+        return items, 1, 1
+    pages  = -(-len(items) // PAGE_SIZE)
+    number = min(max(number or 1, 1), pages)
+    end    = len(items) - (number - 1) * PAGE_SIZE
+    return items[max(end - PAGE_SIZE, 0):end], number, pages
@@ -3,11 +3,185 @@
 # Cold memory  = catatan & tugas (persisten ke disk)
 # Context      = sesi terakhir (siapa, apa, kapan terakhir aktif)
 
+import sys
 from datetime import datetime
 from core.config import (
     MEMORY_FILE, CONTEXT_FILE, LOG_FILE,
-    load_json, save_json,
+    load_json, load_json_view, save_json, thaw, plain,
+    register_snapshot_codec,
 )
+from core import events
+from core.deadline import parse_due
+
+# ── Record ringkas ────────────────────────────────────────
+# Catatan, tugas, log (dan mood di core/mood.py) disimpan di RAM sebagai objek
+# __slots__, bukan dict — jauh lebih hemat per record. Akses gaya dict
+# (r["v"], r.get("done"), r["done"] = True) tetap jalan, dan to_json()
+# mengembalikan dict dengan schema JSON yang sama persis (lossless).
+
+_MISSING = object()
+
+class Record:
+    __slots__ = ("_x",)   # _x: kunci tak dikenal dari JSON (biasanya None)
+    FIELDS = ()           # kunci JSON = nama slot, urutan = urutan output
+    INTERN = ()           # field string berulang (intent, tanggal) → sys.intern
+
+    def __init_subclass__(cls, **kw):
+        # Generate konverter dict → record khusus per kelas (teknik yang sama
+        # dengan collections.namedtuple): load 100k record tanpa dispatch per field.
+        super().__init_subclass__(**kw)
+        src = ["def _from(d):", " o = new(cls)", " o._x = None", " g = d.get"]
+        for k in cls.FIELDS:
+            val = "intern(v) if type(v) is str else v" if k in cls.INTERN else "v"
+            src += [f" v = g({k!r}, M)", f" if v is not M: o.{k} = {val}"]
+        src += [" if not d.keys() <= fset:",
+                "  o._x = {k: v for k, v in d.items() if k not in fset}",
+                " return o"]
+        # Baris tuple (snapshot biner): nilai field terurut. Field kosong di ujung
+        # (mis. done_at tugas belum selesai) → tuple lebih pendek; kosong di
+        # tengah → Ellipsis (marshal mendukungnya). Ada ekstra → None (dict biasa).
+        # String INTERN tidak perlu di-intern ulang: marshal menyimpan referensi
+        # objek yang sama, jadi setelah load tetap satu objek per nilai.
+        attrs = [f"o.{k}" for k in cls.FIELDS]
+        src += ["def _from_row(r):", " o = new(cls)", " o._x = None",
+                " if ... in r:",
+                "  for k, v in zip(fields, r):",
+                "   if v is not ...: setattr(o, k, v)",
+                "  return o",
+                " n = len(r)"]
+        for n in range(len(attrs), 0, -1):
+            src.append(f" {'if' if n == len(attrs) else 'elif'} n == {n}: {', '.join(attrs[:n])}, = r")
+        src += [" return o",
+                "def _row(o):", " if o._x is not None: return None",
+                f" try: return ({', '.join(attrs)},)", " except AttributeError: pass",
+                " r = [getattr(o, k, ...) for k in fields]",
+                " while r and r[-1] is ...: r.pop()",
+                " return tuple(r)"]
+        ns = {"new": cls.__new__, "cls": cls, "M": _MISSING,
+              "intern": sys.intern, "fset": frozenset(cls.FIELDS), "fields": cls.FIELDS}
+        exec("\n".join(src), ns)
+        cls._from     = staticmethod(ns["_from"])
+        cls._from_row = staticmethod(ns["_from_row"])
+        cls._row      = staticmethod(ns["_row"])
+
+    def __init__(self, **kw):
+        self._x = None
+        for k, v in kw.items():
+            self[k] = v
+
+    @classmethod
+    def from_json(cls, d):
+        return d if isinstance(d, cls) else cls._from(d)
+
+    @classmethod
+    def to_rows(cls, items):
+        """List record/dict → list baris tuple (fallback dict) untuk snapshot biner."""
+        row, out = cls._row, []
+        for it in items:
+            if isinstance(it, Record):
+                r = row(it)
+                out.append(r if r is not None else it.to_json())
+            else:
+                r = row(cls._from(it))
+                out.append(r if r is not None else dict(it))
+        return out
+
+    @classmethod
+    def from_rows(cls, rows):
+        from_row, from_json = cls._from_row, cls._from
+        return [from_row(r) if type(r) is tuple else from_json(r) for r in rows]
+
+    def to_json(self):
+        out = {}
+        for k in self.FIELDS:
+            v = getattr(self, k, _MISSING)
+            if v is not _MISSING:
+                out[k] = v
+        if self._x:
+            out.update(self._x)
+        return out
+
+    # ── Akses gaya dict ───────────────────────────────────
+    def __getitem__(self, k):
+        v = getattr(self, k, _MISSING) if k in self.FIELDS else (self._x or {}).get(k, _MISSING)
+        if v is _MISSING:
+            raise KeyError(k)
+        return v
+
+    def __setitem__(self, k, v):
+        if k in self.FIELDS:
+            if k in self.INTERN and type(v) is str:
+                v = sys.intern(v)
+            setattr(self, k, v)
+        else:
+            if self._x is None:
+                self._x = {}
+            self._x[k] = v
+
+    def __delitem__(self, k):
+        if k in self.FIELDS and hasattr(self, k):
+            delattr(self, k)
+        elif self._x and k in self._x:
+            del self._x[k]
+        else:
+            raise KeyError(k)
+
+    def __contains__(self, k):
+        try:
+            self[k]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, k, default=None):
+        try:
+            return self[k]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.to_json().keys()
+
+    def items(self):
+        return self.to_json().items()
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            other = other.to_json()
+        return isinstance(other, dict) and self.to_json() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_json()!r})"
+
+class Note(Record):
+    __slots__ = ("id", "t", "v")
+    FIELDS    = __slots__
+
+class Task(Record):
+    __slots__ = ("id", "t", "v", "done", "done_at", "due", "pri")
+    FIELDS    = __slots__
+
+class LogEntry(Record):
+    __slots__ = ("t", "i", "ok", "n")
+    FIELDS    = __slots__
+    INTERN    = ("i", "n")
+
+# ── Snapshot biner: catatan/tugas/log sebagai baris tuple ─
+def _memory_rows(m):
+    out = {k: plain(v) for k, v in m.items() if k not in ("notes", "tasks")}
+    out["notes"] = Note.to_rows(m.get("notes", ()))
+    out["tasks"] = Task.to_rows(m.get("tasks", ()))
+    return out
+
+def _memory_from_rows(d):
+    d["notes"] = Note.from_rows(d["notes"])
+    d["tasks"] = Task.from_rows(d["tasks"])
+    return d
+
+register_snapshot_codec(MEMORY_FILE, (Note.FIELDS, Task.FIELDS), _memory_rows, _memory_from_rows)
+register_snapshot_codec(LOG_FILE, LogEntry.FIELDS, LogEntry.to_rows, LogEntry.from_rows)
 
 # ── Schema default ────────────────────────────────────────
 def _default_memory():
@@ -24,10 +198,18 @@ def _default_context():
     }
 
 # ── Load ──────────────────────────────────────────────────
+def _records(cls, items):
+    # List record dari snapshot biner sudah milik kita — tidak perlu dikonversi lagi
+    if type(items) is list and items and isinstance(items[0], cls):
+        return items
+    return [cls.from_json(d) for d in items]
+
 def load_memory():
-    m = load_json(MEMORY_FILE, _default_memory)
-    m.setdefault("notes", [])
-    m.setdefault("tasks", [])
+    # View cukup: catatan & tugas langsung dikonversi ke record baru
+    src = load_json_view(MEMORY_FILE, _default_memory)
+    m   = {k: thaw(v) for k, v in src.items() if k not in ("notes", "tasks")}
+    m["notes"] = _records(Note, src.get("notes", ()))
+    m["tasks"] = _records(Task, src.get("tasks", ()))
     return m
 
 def load_context():
@@ -37,7 +219,7 @@ def load_context():
     return ctx
 
 def load_logs():
-    return load_json(LOG_FILE, [])
+    return _records(LogEntry, load_json_view(LOG_FILE, ()))
 
 # ── Save ──────────────────────────────────────────────────
 def save_memory(m):
@@ -76,54 +258,118 @@ def start_session(ctx):
 
 # ── Note helpers ──────────────────────────────────────────
 def add_note(memory, text):
-    nid = (memory["notes"][-1]["id"] + 1) if memory["notes"] else 1
-    note = {"id": nid, "t": _now(), "v": text}
+    nid = next_id(memory["notes"])
+    note = Note(id=nid, t=_now(), v=text)
     memory["notes"].append(note)
+    events.publish(events.NOTE_ADDED, memory=memory, rec=note)
     save_memory(memory)
     return note
 
 def delete_note(memory, nid):
-    before = len(memory["notes"])
-    memory["notes"] = [n for n in memory["notes"] if n["id"] != nid]
-    if len(memory["notes"]) < before:
-        save_memory(memory)
-        return True
-    return False
+    return delete_notes(memory, {nid}) > 0
+
+def delete_notes(memory, ids):
+    """Hapus banyak catatan sekaligus, satu kali save. Return jumlah yang dihapus."""
+    gone = [n for n in memory["notes"] if n["id"] in ids]
+    if not gone:
+        return 0
+    # Di tempat (bukan list baru) supaya index di RAM tidak dibangun ulang
+    memory["notes"][:] = [n for n in memory["notes"] if n["id"] not in ids]
+    for n in gone:
+        events.publish(events.NOTE_DELETED, memory=memory, rec=n)
+    save_memory(memory)
+    return len(gone)
 
 # ── Task helpers ──────────────────────────────────────────
-def add_task(memory, text):
-    tid = (memory["tasks"][-1]["id"] + 1) if memory["tasks"] else 1
-    task = {"id": tid, "t": _now(), "v": text, "done": False}
+def add_task(memory, text, due=None, pri=None):
+    """due: 'YYYY-MM-DD' (opsional), pri: 1-3 (opsional, 1 = paling penting)."""
+    tid = next_id(memory["tasks"])
+    task = Task(id=tid, t=_now(), v=text, done=False)
+    if due:
+        task["due"] = due
+    if pri:
+        task["pri"] = pri
     memory["tasks"].append(task)
+    events.publish(events.TASK_ADDED, memory=memory, rec=task)
     save_memory(memory)
     return task
 
 def complete_task(memory, tid):
     for tk in memory["tasks"]:
         if tk["id"] == tid:
+            events.publish(events.TASK_CHANGING, memory=memory, rec=tk)
             tk["done"] = True
             tk["done_at"] = _now()
+            events.publish(events.TASK_CHANGED, memory=memory, rec=tk)
             save_memory(memory)
             return tk
     return None
 
 def delete_task(memory, tid):
     before = len(memory["tasks"])
-    memory["tasks"] = [t for t in memory["tasks"] if t["id"] != tid]
+    gone   = [t for t in memory["tasks"] if t["id"] == tid]
+    # Di tempat (bukan list baru) supaya index di RAM tidak dibangun ulang
+    memory["tasks"][:] = [t for t in memory["tasks"] if t["id"] != tid]
     if len(memory["tasks"]) < before:
+        for t in gone:
+            events.publish(events.TASK_DELETED, memory=memory, rec=t)
         save_memory(memory)
         return True
     return False
 
+# ── Bulk helpers ──────────────────────────────────────────
+def next_id(items):
+    return (items[-1]["id"] + 1) if items else 1
+
+def add_many(memory, notes=(), tasks=()):
+    """
+    Tambah banyak record sekaligus, id dibagikan berurutan, satu kali save.
+    notes: iterable (teks, waktu)   tasks: iterable (teks, waktu, done, done_at)
+    Teks tugas diurai seperti perintah `tugas` (@tanggal, !prioritas).
+    Tiap record diumumkan lewat event seperti add_note/add_task.
+    Return (jumlah_catatan, jumlah_tugas).
+    """
+    nid = next_id(memory["notes"])
+    n_added = 0
+    for text, t in notes:
+        note = Note(id=nid, t=t or _now(), v=text)
+        memory["notes"].append(note)
+        events.publish(events.NOTE_ADDED, memory=memory, rec=note)
+        nid += 1
+        n_added += 1
+
+    tid = next_id(memory["tasks"])
+    t_added = 0
+    for text, t, done, done_at in tasks:
+        body, due, pri = parse_due(text)
+        if not body:   # isinya cuma token (mis. "@besok") → simpan apa adanya
+            body, due, pri = text, None, None
+        task = Task(id=tid, t=t or _now(), v=body, done=bool(done))
+        if done:
+            task["done_at"] = done_at or task["t"]
+        if due:
+            task["due"] = due
+        if pri:
+            task["pri"] = pri
+        memory["tasks"].append(task)
+        events.publish(events.TASK_ADDED, memory=memory, rec=task)
+        tid += 1
+        t_added += 1
+
+    if n_added or t_added:
+        save_memory(memory)
+    return n_added, t_added
+
 # ── Log helpers ───────────────────────────────────────────
 def append_log(logs, intent, ok=True, note="", max_logs=80):
-    entry = {"t": _now(), "i": intent, "ok": ok}
+    entry = LogEntry(t=_now(), i=intent, ok=ok)
     if note:
         entry["n"] = note
     logs.append(entry)
     if len(logs) > max_logs:
         logs[:] = logs[-(max_logs // 2):]
     save_logs(logs)
+    return entry
 
 # ── Util ──────────────────────────────────────────────────
 def _now():
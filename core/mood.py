@@ -2,9 +2,16 @@
 # AKARU – Mood & Energy Tracker
 # Pure manual input, zero library eksternal
 
-from datetime import datetime
-from core.config import MOOD_FILE, load_json, save_json
+from datetime import datetime, timedelta
+from core.config import (
+    MOOD_FILE, MOOD_RING_FILE,
+    load_json, load_json_view, save_json, register_snapshot_codec,
+    append_json, tail_json_array, iter_json_array, stat_key, plain, load_config,
+    in_batch, after_commit,
+)
 from core import display as D
+from core import events
+from core.memory import Record
 
 # ── Schema ────────────────────────────────────────────────
 MOOD_LABELS = {
@@ -23,6 +30,13 @@ ENERGY_LABELS = {
     "5": ("🚀", "Full gas",   D.CYAN),
 }
 
+class MoodEntry(Record):
+    __slots__ = ("t", "date", "mood", "energy", "note")
+    FIELDS    = __slots__
+    INTERN    = ("date",)
+
+register_snapshot_codec(MOOD_FILE, MoodEntry.FIELDS, MoodEntry.to_rows, MoodEntry.from_rows)
+
 def _now():
     return datetime.now().isoformat(timespec="seconds")
 
@@ -30,11 +44,91 @@ def _today():
     return datetime.now().strftime("%Y-%m-%d")
 
 def _load():
-    return load_json(MOOD_FILE, [])
+    return [MoodEntry.from_json(e) for e in load_json_view(MOOD_FILE, ())]
 
 def _save(data):
     save_json(MOOD_FILE, data)
 
+def _days_ago(n):
+    return (datetime.now() - timedelta(days=n)).strftime("%Y-%m-%d")
+
+# ── Ring buffer + jumlah per hari (data/mood_ring.json) ───
+# Sidecar kecil supaya status/summary/lihat mood tidak membaca mood.json:
+#   recent : RING_SIZE entry terakhir (ring buffer)
+#   days   : tanggal → [jumlah mood, jumlah energi, n], hanya RING_DAYS hari terakhir
+#   src    : stat_key mood.json saat sidecar terakhir diperbarui
+# mood.json berubah di luar jalur ini (edit manual, impor) → src beda → dibangun ulang.
+RING_VERSION = 1
+RING_SIZE    = 90
+RING_DAYS    = 90
+WINDOWS      = (7, 30, 90)
+
+def _ring_empty():
+    return {"v": RING_VERSION, "src": None, "count": 0, "recent": [], "days": {}}
+
+def _ring_add(ring, entry):
+    e = plain(entry)
+    ring["recent"].append(e)
+    if len(ring["recent"]) > RING_SIZE:
+        del ring["recent"][0]
+    day = ring["days"].setdefault(e.get("date", ""), [0, 0, 0])
+    day[0] += e.get("mood", 0)
+    day[1] += e.get("energy", 0)
+    day[2] += 1
+    ring["count"] += 1
+
+def _ring_trim(ring):
+    cutoff = _days_ago(RING_DAYS - 1)
+    for d in [d for d in ring["days"] if d < cutoff]:
+        del ring["days"][d]
+
+def _ring_save(ring, key=None):
+    """key: stat_key mood.json yang sudah memuat isi ring (default: stat sekarang)."""
+    key = key or stat_key(MOOD_FILE)
+    ring["src"] = list(key) if key else None
+    save_json(MOOD_RING_FILE, ring)
+
+def _ring():
+    """Sidecar yang sinkron dengan mood.json; dibangun ulang (satu pass streaming) kalau basi."""
+    ring = load_json(MOOD_RING_FILE, None)
+    key  = stat_key(MOOD_FILE)
+    if (isinstance(ring, dict) and ring.get("v") == RING_VERSION
+            and ring.get("src") == (list(key) if key else None)):
+        return ring
+    ring = _ring_empty()
+    for e in iter_json_array(MOOD_FILE):
+        _ring_add(ring, e)
+    _ring_trim(ring)
+    _ring_save(ring)
+    return ring
+
+def recent_mood(n):
+    """
+    n entry terakhir: dari ring kalau cukup, selain itu dari store biner
+    (binary_logs) atau baca mundur dari ujung mood.json.
+    """
+    ring = _ring()
+    if n <= len(ring["recent"]) or len(ring["recent"]) >= ring["count"]:
+        return ring["recent"][-n:] if n > 0 else []
+    from core import binlog
+    if binlog.enabled(load_config()) and binlog.mood_store().count() >= ring["count"]:
+        return binlog.mood_store().tail(n)
+    return tail_json_array(MOOD_FILE, n)
+
+def _sums(ring, since):
+    m = e = n = 0
+    for day, (sm, se, sn) in ring["days"].items():
+        if day >= since:
+            m, e, n = m + sm, e + se, n + sn
+    return m, e, n
+
+def mood_window(since, ring=None):
+    """Rata-rata mood & energi untuk tanggal ≥ since (maks RING_DAYS hari ke belakang)."""
+    m, e, n = _sums(ring or _ring(), since)
+    if not n:
+        return None
+    return {"n": n, "avg_mood": round(m / n, 1), "avg_energy": round(e / n, 1)}
+
 # ── Input mood ────────────────────────────────────────────
 def prompt_mood():
     """Interaktif input mood + energy. Return dict entry atau None."""
@@ -44,7 +138,7 @@ def prompt_mood():
         print(f"    {D.c(k, col, D.BOLD)}  {ico}  {D.c(label, col)}")
     D.blank()
 
-    mood_raw = input(D.c("  Pilih mood [1-5]: ", D.CYAN)).strip()
+    mood_raw = D.ask(D.c("  Pilih mood [1-5]: ", D.CYAN)).strip()
     if mood_raw not in MOOD_LABELS:
         D.err("Input tidak valid, mood check-in dibatalkan.")
         return None
@@ -55,24 +149,41 @@ def prompt_mood():
         print(f"    {D.c(k, col, D.BOLD)}  {ico}  {D.c(label, col)}")
     D.blank()
 
-    energy_raw = input(D.c("  Pilih energi [1-5]: ", D.CYAN)).strip()
+    energy_raw = D.ask(D.c("  Pilih energi [1-5]: ", D.CYAN)).strip()
     if energy_raw not in ENERGY_LABELS:
         D.err("Input tidak valid, mood check-in dibatalkan.")
         return None
 
-    note_raw = input(D.c("  Catatan singkat (opsional, Enter skip): ", D.GRAY)).strip()
-
-    entry = {
-        "t"      : _now(),
-        "date"   : _today(),
-        "mood"   : int(mood_raw),
-        "energy" : int(energy_raw),
-        "note"   : note_raw or "",
-    }
-
-    data = _load()
-    data.append(entry)
-    _save(data)
+    note_raw = D.ask(D.c("  Catatan singkat (opsional, Enter skip): ", D.GRAY)).strip()
+
+    entry = MoodEntry(
+        t      = _now(),
+        date   = _today(),
+        mood   = int(mood_raw),
+        energy = int(energy_raw),
+        note   = note_raw or "",
+    )
+
+    ring = _ring()
+    key  = append_json(MOOD_FILE, entry)
+    if key is None:
+        data = _load()
+        data.append(entry)
+        _save(data)
+    _ring_add(ring, entry)
+    _ring_trim(ring)
+    if key is None and in_batch():
+        # mood.json baru sampai disk saat commit: ring (dan src-nya) ikut saat itu
+        after_commit(lambda: _ring_save(ring))
+    else:
+        if key is None:
+            # Save penuh bisa masih antre di write-behind: tunggu sampai di disk,
+            # kalau tidak src sidecar = versi lama dan ring dibangun ulang tiap load
+            from core import writer
+            writer.flush()
+            key = stat_key(MOOD_FILE)
+        _ring_save(ring, key)
+    events.publish(events.MOOD_LOGGED, rec=entry)
 
     m_ico, m_lbl, m_col = MOOD_LABELS[mood_raw]
     e_ico, e_lbl, e_col = ENERGY_LABELS[energy_raw]
@@ -82,12 +193,11 @@ def prompt_mood():
 
 # ── View riwayat ──────────────────────────────────────────
 def view_mood(n=7):
-    data = _load()
-    if not data:
+    recent = recent_mood(n)
+    if not recent:
         D.dim("Belum ada data mood.")
         return
 
-    recent = data[-n:]
     D.header(f"MOOD LOG ({len(recent)} terakhir)", D.MAGENTA)
     for e in recent:
         mood_ico  = MOOD_LABELS.get(str(e["mood"]),  ("?", "?", D.GRAY))[0]
@@ -99,16 +209,26 @@ def view_mood(n=7):
 
 # ── Stats ringkas ─────────────────────────────────────────
 def mood_stats():
-    data = _load()
-    if not data:
+    """
+    Dari sidecar ring, tanpa membaca mood.json:
+      count / avg_mood / avg_energy : 30 entry terakhir (arti lama, tetap)
+      windows                       : rata-rata 7/30/90 hari kalender
+      trend                         : rata-rata mood 7 hari terakhir − hari ke-8..30
+    """
+    ring = _ring()
+    if not ring["recent"]:
         return None
-    recent = data[-30:]  # 30 entry terakhir
-    avg_mood   = sum(e["mood"]   for e in recent) / len(recent)
-    avg_energy = sum(e["energy"] for e in recent) / len(recent)
+    recent  = ring["recent"][-30:]  # 30 entry terakhir
+    windows = {w: mood_window(_days_ago(w - 1), ring) for w in WINDOWS}
+    m7, _, n7   = _sums(ring, _days_ago(6))
+    m30, _, n30 = _sums(ring, _days_ago(29))
+    trend   = round(m7 / n7 - (m30 - m7) / (n30 - n7), 1) if n7 and n30 > n7 else None
     return {
         "count"      : len(recent),
-        "avg_mood"   : round(avg_mood, 1),
-        "avg_energy" : round(avg_energy, 1),
+        "avg_mood"   : round(sum(e["mood"]   for e in recent) / len(recent), 1),
+        "avg_energy" : round(sum(e["energy"] for e in recent) / len(recent), 1),
         "last_mood"  : recent[-1]["mood"],
         "last_energy": recent[-1]["energy"],
+        "windows"    : windows,
+        "trend"      : trend,
     }
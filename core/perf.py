@@ -0,0 +1,171 @@
+# core/perf.py
+# AKARU – Instrumentasi Performa
+# Per perintah: wall time, waktu I/O file, byte baca/tulis, jumlah load/save JSON
+# Disimpan di ring buffer (RAM) + data/perf.jsonl (dibatasi PERF_FILE_MAX baris)
+
+import os
+import json
+import math
+import time
+import atexit
+from collections import deque
+from datetime import datetime
+from core.config import DATA_DIR, in_batch, io_stats as _io
+from core import membudget
+
+PERF_FILE      = os.path.join(DATA_DIR, "perf.jsonl")
+PERF_RING_SIZE = 200    # record terakhir yang ditahan di RAM
+PERF_FILE_MAX  = 2000   # lewat dari ini, file dipangkas ke PERF_FILE_MAX // 2
+FLUSH_EVERY    = 20     # record tertunda sebelum di-append ke disk
+
+# ── Ring buffer ───────────────────────────────────────────
+ring     = deque(maxlen=PERF_RING_SIZE)
+_pending = []
+
+def begin():
+    """Snapshot counter sebelum perintah jalan."""
+    return time.perf_counter(), dict(_io)
+
+def end(snap, intent, **extra):
+    """Hitung selisih counter sejak begin(), simpan ke ring + antrian disk."""
+    t0, before = snap
+    rec = {
+        "t"   : datetime.now().isoformat(timespec="seconds"),
+        "i"   : intent,
+        "ms"  : round((time.perf_counter() - t0) * 1000, 3),
+        "io"  : round((_io["io_s"] - before["io_s"]) * 1000, 3),
+        "rb"  : _io["read_b"]  - before["read_b"],
+        "wb"  : _io["write_b"] - before["write_b"],
+        "ld"  : _io["loads"]   - before["loads"],
+        "sv"  : _io["saves"]   - before["saves"],
+        "ch"  : _io["cache_hit"]  - before["cache_hit"],
+        "cm"  : _io["cache_miss"] - before["cache_miss"],
+    }
+    rec.update(extra)
+    ring.append(rec)
+    _pending.append(rec)
+    if len(_pending) >= FLUSH_EVERY:
+        flush()
+    return rec
+
+def flush():
+    """
+    Append record tertunda ke perf.jsonl, pangkas kalau kepanjangan.
+    Selama batch tidak menulis apa-apa (satu commit di akhir); record
+    ditulis pada flush berikutnya. perf.jsonl telemetri, bukan turunan store:
+    perintah batch yang dibatalkan tetap tercatat karena memang sudah jalan.
+    """
+    if not _pending or in_batch():
+        return
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(PERF_FILE, "a", encoding="utf-8") as f:
+            for rec in _pending:
+                f.write(json.dumps(rec) + "\n")
+        _pending.clear()
+        if os.path.getsize(PERF_FILE) > PERF_FILE_MAX * 160:  # ~160 byte/record
+            hist = history()
+            if len(hist) > PERF_FILE_MAX:
+                tmp = PERF_FILE + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    for rec in hist[-(PERF_FILE_MAX // 2):]:
+                        f.write(json.dumps(rec) + "\n")
+                os.replace(tmp, PERF_FILE)
+    except OSError:
+        pass
+
+atexit.register(flush)
+
+def release():
+    """Lepas ring buffer (mode hemat RAM). Riwayat tetap ada di disk."""
+    flush()
+    ring.clear()
+
+membudget.register_release(release)
+
+def history():
+    """Semua record di disk + yang belum di-flush."""
+    recs = []
+    try:
+        with open(PERF_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    recs.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return recs + list(_pending)
+
+# ── Statistik ─────────────────────────────────────────────
+def percentile(sorted_vals, p):
+    """Persentil nearest-rank dari list yang sudah terurut."""
+    if not sorted_vals:
+        return 0.0
+    k = max(math.ceil(p / 100 * len(sorted_vals)) - 1, 0)
+    return sorted_vals[min(k, len(sorted_vals) - 1)]
+
+def per_intent(records):
+    """intent → {count, p50, p95, p99} (ms)."""
+    by_intent = {}
+    for r in records:
+        by_intent.setdefault(r.get("i", "?"), []).append(r.get("ms", 0.0))
+    out = {}
+    for intent, vals in by_intent.items():
+        vals.sort()
+        out[intent] = {
+            "count": len(vals),
+            "p50"  : percentile(vals, 50),
+            "p95"  : percentile(vals, 95),
+            "p99"  : percentile(vals, 99),
+        }
+    return out
+
+# ── Display ───────────────────────────────────────────────
+def show_perf(top=5):
+    from core import display as D
+    recs = history()
+    if not recs:
+        D.dim("Belum ada data performa.")
+        return
+
+    D.header(f"PERFORMA PERINTAH ({len(recs)} tercatat)", D.CYAN)
+    print(f"  {D.c('intent'.ljust(14), D.GRAY)} {D.c('n'.rjust(5), D.GRAY)}"
+          f" {D.c('p50'.rjust(8), D.GRAY)} {D.c('p95'.rjust(8), D.GRAY)} {D.c('p99'.rjust(8), D.GRAY)}")
+    stats = per_intent(recs)
+    for intent, st in sorted(stats.items(), key=lambda x: -x[1]["p95"]):
+        p95     = st["p95"]
+        p95_col = D.RED if p95 >= 500 else (D.YELLOW if p95 >= 100 else D.GREEN)
+        print(f"  {intent[:14].ljust(14)} {str(st['count']).rjust(5)}"
+              f" {st['p50']:8.1f} {D.c(f'{p95:8.1f}', p95_col)} {st['p99']:8.1f}")
+
+    hits   = sum(r.get("ch", 0) for r in recs)
+    misses = sum(r.get("cm", 0) for r in recs)
+    if hits or misses:
+        D.blank()
+        D.info("Cache parse JSON", f"{hits} hit / {misses} miss ({hits / (hits + misses):.0%} hit)")
+
+    ev_ms = sum(r.get("ev", 0) for r in recs)
+    if ev_ms:
+        total = sum(r.get("ms", 0) for r in recs)
+        D.info("Handler event", f"{ev_ms:.1f} ms ({ev_ms / total:.1%} dari total waktu perintah)")
+    from core import events
+    rows = events.handlers()
+    if rows:
+        D.blank()
+        print(f"  {D.c('Handler event (sesi ini):', D.WHITE, D.BOLD)}")
+        for name, n, total_ms, avg_us, max_ms in rows:
+            print(f"  {name[:22].ljust(22)} {str(n).rjust(6)}x {total_ms:8.1f} ms"
+                  f"  {D.c(f'rata {avg_us:.0f} µs · maks {max_ms:.1f} ms', D.GRAY)}")
+
+    recent = list(ring) or recs[-PERF_RING_SIZE:]
+    D.blank()
+    print(f"  {D.c(f'Paling lambat ({len(recent)} terakhir):', D.WHITE, D.BOLD)}")
+    for r in sorted(recent, key=lambda r: -r.get("ms", 0))[:top]:
+        io_str = (f"io {r.get('io', 0):.1f} ms · {r.get('ld', 0)}L/{r.get('sv', 0)}S"
+                  f" · {_kb(r.get('rb', 0))}↓ {_kb(r.get('wb', 0))}↑")
+        print(f"  {D.c(r['t'][5:16].replace('T', ' '), D.GRAY)}  {r['i'][:14].ljust(14)} {r['ms']:8.1f} ms  {D.c(io_str, D.GRAY)}")
+    D.sep()
+
+def _kb(n):
+    return f"{n / 1024:.1f}K" if n >= 1024 else f"{n}B"
@@ -0,0 +1,383 @@
+# core/query.py
+# AKARU – Query Language & Planner
+# `cari` memakai sintaks kecil di atas catatan, tugas, log dan mood:
+#
+#   cari tipe:tugas status:aktif dari:2026-09-01 #kerja "kata kunci"
+#   cari tipe:log status:gagal dari:-7 --explain
+#
+#   tipe:catatan|tugas|log|mood   (boleh dipisah koma; default catatan,tugas)
+#   status:aktif|selesai (tugas)  status:ok|gagal (log)
+#   dari:/sampai: YYYY-MM-DD, hariini, kemarin, -N (N hari lalu) — inklusif
+#   #tag / -#tag, "frasa persis", kata biasa (semua harus ada, substring)
+#   --explain                     tampilkan rencana & jumlah baris yang diperiksa
+#
+# Planner: tiap syarat yang punya index memberi estimasi jumlah kandidat
+# (tanggal → bisect, tag/status → hitungan bitset O(1), teks → posting list).
+# Index paling selektif jadi penggerak, sisanya diiris berurutan dari yang
+# paling kecil, baru record kandidat diambil & dicek penuh. Tanpa index yang
+# cocok → scan (tetap tercatat di explain).
+
+import re
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from core import display as D
+from core import membudget
+from core import tags
+from core import events
+
+KINDS = {
+    "catatan": "notes", "note": "notes", "notes": "notes",
+    "tugas"  : "tasks", "task": "tasks", "tasks": "tasks",
+    "log"    : "logs",  "logs": "logs",
+    "mood"   : "mood",
+}
+LABELS  = {"notes": "Catatan", "tasks": "Tugas", "logs": "Log", "mood": "Mood"}
+STATUS  = {"aktif": "tasks", "selesai": "tasks", "ok": "logs", "gagal": "logs"}
+WORD_RE = re.compile(r"\w+")
+SCAN_RATIO = 4   # index dipakai kalau kandidatnya < 1/4 koleksi
+
+class QueryError(ValueError):
+    pass
+
+# ── Parse ─────────────────────────────────────────────────
+class Query:
+    __slots__ = ("kinds", "status", "since", "until", "inc", "exc", "texts", "explain")
+
+    def __init__(self):
+        self.kinds   = []
+        self.status  = None
+        self.since   = None   # 'YYYY-MM-DD' inklusif
+        self.until   = None   # 'YYYY-MM-DD' EKSKLUSIF (sudah +1 hari)
+        self.inc     = []
+        self.exc     = []
+        self.texts   = []     # substring huruf kecil, semua wajib ada
+        self.explain = False
+
+def _day(tok):
+    tok   = tok.lower()
+    today = datetime.now().date()
+    if tok in ("hariini", "today"):
+        return today
+    if tok == "kemarin":
+        return today - timedelta(days=1)
+    if tok.startswith("-") and tok[1:].isdigit():
+        return today - timedelta(days=int(tok[1:]))
+    try:
+        return datetime.strptime(tok, "%Y-%m-%d").date()
+    except ValueError:
+        raise QueryError(f"Tanggal tidak dikenal: '{tok}' (pakai YYYY-MM-DD, hariini, kemarin, -N)")
+
+def parse(text):
+    q = Query()
+    for quoted, word in re.findall(r'"([^"]*)"|(\S+)', text):
+        if quoted:
+            if quoted.strip():
+                q.texts.append(quoted.lower())
+            continue
+        low = word.lower()
+        key, sep, val = low.partition(":")
+        if low == "--explain":
+            q.explain = True
+        elif sep and key == "tipe":
+            for v in val.split(","):
+                if v not in KINDS:
+                    raise QueryError(f"Tipe tidak dikenal: '{v}' (catatan, tugas, log, mood)")
+                if KINDS[v] not in q.kinds:
+                    q.kinds.append(KINDS[v])
+        elif sep and key == "status":
+            if val not in STATUS:
+                raise QueryError(f"Status tidak dikenal: '{val}' (aktif, selesai, ok, gagal)")
+            q.status = val
+        elif sep and key == "dari":
+            q.since = _day(val).isoformat()
+        elif sep and key == "sampai":
+            q.until = (_day(val) + timedelta(days=1)).isoformat()
+        elif low.startswith("-#") and len(low) > 2:
+            q.exc.append(low[2:])
+        elif low.startswith("#") and len(low) > 1:
+            q.inc.append(low[1:])
+        else:
+            q.texts.append(low)
+    if not q.kinds:
+        q.kinds = [STATUS[q.status]] if q.status else ["notes", "tasks"]
+    return q
+
+# ── Index tanggal + teks untuk catatan/tugas ─────────────
+class DocIndex:
+    """
+    Waktu dibuat (list terurut + id paralel) dan posting list kata → array id.
+    Dirawat seperti index tag: bangun sekali per list, susul record baru,
+    entry record yang dihapus dibuang malas (dicek saat ambil record).
+    """
+    __slots__ = ("items", "n", "times", "ids", "words", "stale")
+
+    def __init__(self):
+        self.items = None
+
+    def rebuild(self, items):
+        self.items, self.n, self.stale = items, 0, 0
+        self.times, self.ids, self.words = [], [], {}
+        for rec in items:
+            self.add(rec)
+
+    def add(self, rec):
+        rid, t = rec["id"], rec.get("t", "")
+        if not self.times or t >= self.times[-1]:
+            self.times.append(t)
+            self.ids.append(rid)
+        else:
+            # Import dengan waktu lama: sisipkan di posisinya (jarang)
+            i = bisect_left(self.times, t)
+            self.times.insert(i, t)
+            self.ids.insert(i, rid)
+        for w in set(WORD_RE.findall(rec["v"].lower())):
+            post = self.words.get(w)
+            if post is None:
+                post = self.words[w] = array("I")
+            post.append(rid)
+        self.n += 1
+
+    def discard(self, rec):
+        self.n     -= 1
+        self.stale += 1
+
+    def sync(self, items):
+        if self.items is not items or self.stale > len(items) or self.n > len(items):
+            self.rebuild(items)
+            return self
+        new = len(items) - self.n
+        if new:
+            for rec in items[-new:]:
+                self.add(rec)
+        return self
+
+    def date_span(self, since, until):
+        lo = bisect_left(self.times, since) if since else 0
+        hi = bisect_left(self.times, until) if until else len(self.times)
+        return lo, max(lo, hi)
+
+    def text_ids(self, text):
+        """
+        Id yang MUNGKIN mengandung substring `text`: tiap potongan kata di query
+        harus ada di dalam satu kata record → gabungan posting semua kosakata
+        yang memuatnya, diiris antar potongan. Hasil superset; dicek ulang.
+        """
+        out = None
+        for part in WORD_RE.findall(text):
+            ids = set()
+            for w, post in self.words.items():
+                if part in w:
+                    ids.update(post)
+            out = ids if out is None else out & ids
+            if not out:
+                break
+        return out
+
+_docs = {"notes": DocIndex(), "tasks": DocIndex()}
+
+def doc_index(memory, kind):
+    return _docs[kind].sync(memory.get(kind, []))
+
+# ── Hook (event dari core/memory) ─────────────────────────
+def add(memory, kind, rec):
+    idx = _docs[kind]
+    if idx.items is memory.get(kind):
+        idx.add(rec)
+
+def discard(memory, kind, rec):
+    idx = _docs[kind]
+    if idx.items is memory.get(kind):
+        idx.discard(rec)
+
+for _event, _kind, _fn in (
+    (events.NOTE_ADDED,   "notes", add),
+    (events.NOTE_DELETED, "notes", discard),
+    (events.TASK_ADDED,   "tasks", add),
+    (events.TASK_DELETED, "tasks", discard),
+):
+    events.subscribe(_event, lambda memory, rec, k=_kind, f=_fn: f(memory, k, rec),
+                     name=f"query.{_fn.__name__}")
+
+# ── Planner ───────────────────────────────────────────────
+class Plan:
+    """Langkah yang dipilih + statistik eksekusi untuk satu koleksi."""
+    __slots__ = ("kind", "total", "sources", "driver", "candidates", "examined", "rows")
+
+    def __init__(self, kind, total):
+        self.kind, self.total = kind, total
+        self.sources    = []   # (nama, estimasi)
+        self.driver     = "scan"
+        self.candidates = total
+        self.examined   = 0
+        self.rows       = []
+
+def _text_of(kind, rec):
+    if kind == "logs":
+        return f"{rec.get('i', '')} {rec.get('n', '')}".lower()
+    if kind == "mood":
+        return (rec.get("note") or "").lower()
+    return rec["v"].lower()
+
+def _check(kind, rec, q):
+    """Cek penuh satu record (semua syarat, termasuk yang sudah lewat index)."""
+    t = rec.get("t", "")
+    if q.since and t < q.since or q.until and t >= q.until:
+        return False
+    if q.status:
+        if kind == "tasks" and bool(rec.get("done")) != (q.status == "selesai"):
+            return False
+        if kind == "logs" and bool(rec.get("ok")) != (q.status == "ok"):
+            return False
+    if kind in ("notes", "tasks") and (q.inc or q.exc):
+        have = set(tags.parse_tags(rec["v"]))
+        if not have.issuperset(q.inc) or have & set(q.exc):
+            return False
+    elif q.inc:
+        return False   # log & mood tidak punya tag
+    text = _text_of(kind, rec) if q.texts else ""
+    return all(s in text for s in q.texts)
+
+def _plan_docs(memory, kind, q):
+    items = memory.get(kind, [])
+    plan  = Plan(kind, len(items))
+    # (nama, estimasi, fungsi → set/iterable id). Estimasi dihitung murah dulu.
+    sources = []
+    if q.since or q.until:
+        idx = doc_index(memory, kind)
+        lo, hi = idx.date_span(q.since, q.until)
+        sources.append(("tanggal", hi - lo, lambda: idx.ids[lo:hi]))
+    if q.inc:
+        tix  = tags.index(memory, kind)
+        est  = min(tix.counts.get(tag, 0) for tag in q.inc)
+        bits = tags.match_bits(memory, kind, q.inc, q.exc)
+        sources.append(("tag", est, lambda: tags.ids(bits)))
+    if q.status in ("aktif", "selesai") and kind == "tasks":
+        six  = tags.index(memory, kind, "status")
+        sbit = six.bits.get(q.status, 0)
+        sources.append(("status", six.counts.get(q.status, 0), lambda: tags.ids(sbit)))
+    if q.texts:
+        idx  = doc_index(memory, kind)
+        for s in q.texts:
+            ids = idx.text_ids(s)
+            if ids is not None:
+                sources.append((f'teks "{s}"', len(ids), lambda ids=ids: ids))
+    plan.sources = [(name, est) for name, est, _ in sources]
+    if not sources:
+        plan.examined = len(items)
+        plan.rows = [r for r in items if _check(kind, r, q)]
+        return plan
+
+    sources.sort(key=lambda s: s[1])
+    if sources[0][1] * SCAN_RATIO > len(items):
+        # Index terbaik pun mengembalikan sebagian besar koleksi → scan lebih murah
+        plan.examined = len(items)
+        plan.rows = [r for r in items if _check(kind, r, q)]
+        return plan
+    plan.driver = sources[0][0]
+    cand = set(sources[0][2]())
+    for _, est, fetch in sources[1:]:
+        if not cand:
+            break
+        cand &= set(fetch())
+    plan.candidates = len(cand)
+    for rid in sorted(cand):
+        rec = tags.by_id(items, rid)
+        if rec is None:
+            continue   # sudah dihapus (entry index basi)
+        plan.examined += 1
+        if _check(kind, rec, q):
+            plan.rows.append(rec)
+    return plan
+
+def _stream_rows(kind, state, q):
+    """
+    Log & mood: urut waktu. Index yang ada = rentang waktu (store biner kalau
+    aktif, selain itu bisect di list). Return (rows, total, sumber).
+    """
+    from core import binlog
+    from core.config import MOOD_FILE, load_json_view
+    cfg = state["cfg"]
+    if binlog.enabled(cfg):
+        store = binlog.log_store() if kind == "logs" else binlog.mood_store()
+        if store.count():
+            if q.since or q.until:
+                return store.range(q.since, q.until), store.count(), "tanggal (biner)"
+            return store.tail(store.count()), store.count(), "scan (biner)"
+    rows = state["logs"] if kind == "logs" else load_json_view(MOOD_FILE, ())
+    if q.since or q.until:
+        key = lambda r: r.get("t", "")
+        lo  = bisect_left(rows, q.since, key=key) if q.since else 0
+        hi  = bisect_left(rows, q.until, key=key) if q.until else len(rows)
+        return rows[lo:hi], len(rows), "tanggal"
+    return rows, len(rows), "scan"
+
+def _plan_stream(state, kind, q):
+    rows, total, driver = _stream_rows(kind, state, q)
+    plan = Plan(kind, total)
+    plan.driver = driver
+    if driver.startswith("tanggal"):
+        plan.sources = [(driver, len(rows))]
+    plan.candidates = plan.examined = len(rows)
+    plan.rows = [r for r in rows if _check(kind, r, q)]
+    return plan
+
+def run(state, q):
+    """Eksekusi query → list Plan (satu per koleksi)."""
+    plans = []
+    for kind in q.kinds:
+        if kind in ("notes", "tasks"):
+            plans.append(_plan_docs(state["memory"], kind, q))
+        else:
+            plans.append(_plan_stream(state, kind, q))
+    return plans
+
+# ── Tampilan ──────────────────────────────────────────────
+def _line(kind, rec):
+    if kind == "notes":
+        return f"  {D.c('Catatan', D.MAGENTA)} #{rec['id']}: {rec['v']}"
+    if kind == "tasks":
+        status = D.c("[✓]", D.GREEN) if rec.get("done") else D.c("[ ]", D.GRAY)
+        return f"  {D.c('Tugas', D.YELLOW)} #{rec['id']} {status}: {rec['v']}"
+    if kind == "logs":
+        s = D.c("OK", D.GREEN) if rec.get("ok") else D.c("ERR", D.RED)
+        note = f"  {D.c(rec['n'], D.GRAY)}" if rec.get("n") else ""
+        return f"  {D.c('Log', D.CYAN)} {D.c(rec['t'], D.GRAY)} [{s}] {rec.get('i', '?')}{note}"
+    note = f"  {D.c(rec['note'], D.GRAY)}" if rec.get("note") else ""
+    return f"  {D.c('Mood', D.BLUE)} {D.c(rec['t'], D.GRAY)} mood {rec['mood']} energi {rec['energy']}{note}"
+
+def show_explain(plans):
+    D.header("RENCANA QUERY", D.GRAY)
+    for p in plans:
+        src = ", ".join(f"{n}≈{e}" for n, e in p.sources) or "-"
+        print(f"  {D.c(LABELS[p.kind].ljust(8), D.WHITE, D.BOLD)} "
+              f"penggerak {D.c(p.driver, D.CYAN)}  index: {src}")
+        print(f"  {' ' * 8} total {p.total} · kandidat {p.candidates} · "
+              f"diperiksa {p.examined} · cocok {len(p.rows)}")
+    D.sep()
+
+def show_search(state, text):
+    try:
+        q = parse(text)
+    except QueryError as e:
+        D.err(str(e))
+        return
+    plans = run(state, q)
+    if q.explain:
+        show_explain(plans)
+
+    found = 0
+    limit = membudget.PAGE_SIZE if membudget.low_mem() else None
+    D.header(f"PENCARIAN: '{text}'", D.CYAN)
+    for p in plans:
+        for rec in p.rows:
+            if limit is None or found < limit:
+                print(_line(p.kind, rec))
+            found += 1
+    if limit is not None and found > limit:
+        D.dim(f"Mode hemat RAM: {found - limit} hasil lain tidak ditampilkan.")
+    D.sep()
+    if found == 0:
+        D.dim(f"Tidak ada hasil untuk '{text}'.")
+    else:
+        D.ok(f"{found} hasil ditemukan.")
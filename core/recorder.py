@@ -0,0 +1,63 @@
+# core/recorder.py
+# AKARU – Session Recorder
+# Rekam stream perintah mentah + jawaban prompt, dengan timestamp
+# Format: JSONL, satu event per baris
+#   {"ts": 1760000000.12, "cmd": "catat ..."}
+#   {"ts": 1760000001.50, "ans": "y"}        ← jawaban confirm / mood check-in
+
+import os
+import json
+import time
+from datetime import datetime
+from core.config import DATA_DIR
+
+SESSION_DIR = os.path.join(DATA_DIR, "sessions")
+
+def default_path():
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(SESSION_DIR, f"session_{stamp}.jsonl")
+
+class Recorder:
+    def __init__(self, path=None):
+        self.path = path or default_path()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._f = open(self.path, "a", encoding="utf-8", buffering=1)  # line-buffered
+
+    def _write(self, key, value):
+        self._f.write(json.dumps({"ts": round(time.time(), 3), key: value}, ensure_ascii=False) + "\n")
+
+    def command(self, text):
+        self._write("cmd", text)
+
+    def answer(self, text):
+        self._write("ans", text)
+
+    def input_hook(self, prompt):
+        """Pengganti input() untuk D.set_input: jawaban prompt ikut terekam."""
+        ans = input(prompt)
+        self.answer(ans)
+        return ans
+
+    def close(self):
+        self._f.close()
+
+def load_recording(path):
+    """
+    Baca rekaman → list (ts, perintah, [jawaban...]).
+    Jawaban dikelompokkan ke perintah sebelumnya.
+    """
+    steps = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                ev = json.loads(line)
+            except ValueError:
+                continue
+            if "cmd" in ev:
+                steps.append((ev.get("ts", 0.0), ev["cmd"], []))
+            elif "ans" in ev and steps:
+                steps[-1][2].append(ev["ans"])
+    return steps
@@ -0,0 +1,196 @@
+# core/server.py
+# AKARU – Local Server & Thin Client
+# Server: state engine tetap hangat di RAM, listen di Unix socket (asyncio)
+# Client: kirim perintah, stream balik output yang sudah dirender
+#
+# Protokol: satu objek JSON per baris
+#   client → server : {"cmd": "<teks>"} | {"op": "greet"} | {"answer": "<teks>"}
+#   server → client : {"out": "<teks>"} | {"ask": "<prompt>"} | {"done": "<intent>", "user": "<nama>"}
+
+import json
+import os
+import socket
+import sys
+import threading
+from contextlib import redirect_stdout
+
+from core.config import SOCKET_FILE
+from core import display as D
+
+# ====================================================
+# A. SERVER
+# ====================================================
+
+class _Stream:
+    """Pengganti stdout: buffer per baris, kirim ke client sebagai 'out'."""
+    def __init__(self, send):
+        self._send = send
+        self._buf  = []
+
+    def write(self, s):
+        self._buf.append(s)
+        if "\n" in s:
+            self.flush()
+        return len(s)
+
+    def flush(self):
+        if self._buf:
+            self._send({"out": "".join(self._buf)})
+            self._buf = []
+
+class Server:
+    """
+    Satu proses, satu state. Semua client berbagi state yang sama;
+    perintah dieksekusi satu per satu (lock) supaya state tetap konsisten.
+    """
+    def __init__(self, state, greet=None):
+        self.state = state
+        self.greet = greet
+        self._lock = threading.Lock()
+
+    def _run(self, msg, send, next_answer):
+        from core.engine import handle
+        out    = _Stream(send)
+        intent = None
+
+        def ask(prompt):
+            out.flush()
+            send({"ask": prompt})
+            ans = next_answer()
+            if ans is None:  # client putus di tengah prompt
+                raise EOFError
+            return ans
+
+        with self._lock:
+            D.set_input(ask)
+            try:
+                with redirect_stdout(out):
+                    if msg.get("op") == "greet":
+                        D.print_banner(self.state["cfg"])
+                        if self.greet:
+                            self.greet(self.state["context"], self.state["cfg"], self.state["memory"])
+                        intent = "GREET"
+                    else:
+                        intent = handle(msg.get("cmd", ""), self.state)
+            except EOFError:
+                pass
+            except Exception as e:
+                with redirect_stdout(out):
+                    D.err(f"Server error: {e}")
+            finally:
+                D.set_input(None)
+                out.flush()
+        return intent
+
+    async def _client(self, reader, writer):
+        import asyncio
+        loop    = asyncio.get_running_loop()
+        answers = asyncio.Queue()
+
+        def _write(msg):
+            if not writer.is_closing():
+                writer.write((json.dumps(msg, ensure_ascii=False) + "\n").encode("utf-8"))
+
+        def send(msg):  # dipanggil dari thread worker
+            loop.call_soon_threadsafe(_write, msg)
+
+        def next_answer():  # blocking, dipanggil dari thread worker
+            return asyncio.run_coroutine_threadsafe(answers.get(), loop).result()
+
+        def _done(fut):
+            _write({"done": fut.result(), "user": self.state["cfg"].get("username", "User")})
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    msg = json.loads(line)
+                except ValueError:
+                    continue
+                if "answer" in msg:
+                    await answers.put(str(msg["answer"]))
+                    continue
+                job = loop.run_in_executor(None, self._run, msg, send, next_answer)
+                job.add_done_callback(_done)
+        finally:
+            await answers.put(None)
+            writer.close()
+
+    async def _serve(self, path):
+        import asyncio
+        import signal
+        server = await asyncio.start_unix_server(self._client, path=path)
+        stop   = asyncio.Event()
+        loop   = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+        async with server:
+            await stop.wait()
+
+    def serve(self, path=SOCKET_FILE):
+        import asyncio
+        if connect(path):
+            D.err(f"Server lain sudah aktif di {path}.")
+            return
+        if os.path.exists(path):
+            os.remove(path)  # socket basi dari server yang mati
+        D.ok(f"AKARU server aktif di {path} (pid {os.getpid()}). Ctrl+C untuk berhenti.")
+        try:
+            asyncio.run(self._serve(path))
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+            D.dim("Server berhenti.")
+
+# ====================================================
+# B. CLIENT
+# ====================================================
+
+def connect(path=SOCKET_FILE):
+    """Return socket terhubung ke server, atau None kalau server tidak aktif."""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return None
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        s.connect(path)
+    except OSError:
+        s.close()
+        return None
+    return s
+
+class Client:
+    def __init__(self, sock):
+        self.sock = sock
+        self.f    = sock.makefile("rwb")
+        self.user = "User"
+
+    def _send(self, msg):
+        self.f.write((json.dumps(msg, ensure_ascii=False) + "\n").encode("utf-8"))
+        self.f.flush()
+
+    def request(self, cmd=None, op=None):
+        """Kirim satu perintah, stream output ke stdout. Return intent."""
+        self._send({"op": op} if op else {"cmd": cmd})
+        for line in self.f:
+            msg = json.loads(line)
+            if "out" in msg:
+                sys.stdout.write(msg["out"])
+                sys.stdout.flush()
+            elif "ask" in msg:
+                try:
+                    ans = input(msg["ask"])
+                except (EOFError, KeyboardInterrupt):
+                    ans = ""
+                self._send({"answer": ans})
+            elif "done" in msg:
+                self.user = msg.get("user", self.user)
+                return msg["done"]
+        raise ConnectionError("Server menutup koneksi.")
+
+    def close(self):
+        try:
+            self.f.close()
+        finally:
+            self.sock.close()
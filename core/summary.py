@@ -3,8 +3,20 @@
 # Harian & mingguan — generate dari data lokal, pure logic
 
 from datetime import datetime, timedelta
-from core.config import load_json, MOOD_FILE
+from core.config import load_json_view, iter_json_array, LOG_FILE
 from core import display as D
+from core import membudget
+
+def _rows(path):
+    """List penuh, atau iterator streaming saat mode hemat RAM."""
+    return iter_json_array(path) if membudget.low_mem() else load_json_view(path, ())
+
+def _week_logs(since):
+    from core.config import load_config
+    from core import binlog
+    if binlog.enabled(load_config()) and binlog.log_store().count():
+        return binlog.log_store().range(since)
+    return _rows(LOG_FILE)
 
 def _today():
     return datetime.now().strftime("%Y-%m-%d")
@@ -34,8 +46,8 @@ def daily_summary(memory, context, target_date=None):
     added_today = [t for t in tasks if _date_of(t.get("t","")) == today]
     pending     = [t for t in tasks if not t.get("done")]
 
-    mood_data = load_json(MOOD_FILE, [])
-    mood_today = [e for e in mood_data if e.get("date") == today]
+    from core.mood import recent_mood
+    mood_today = [e for e in recent_mood(1) if e.get("date") == today]
 
     D.header(f"SUMMARY HARIAN – {today}", D.YELLOW)
 
@@ -84,6 +96,17 @@ def daily_summary(memory, context, target_date=None):
     if len(pending) > 5:
         print(f"  {D.c(f'  ... dan {len(pending)-5} lainnya', D.GRAY)}")
 
+    # Jatuh tempo — langsung dari index deadline (tanpa scan semua tugas)
+    from core import deadline
+    late    = deadline.overdue(memory)
+    due_now = deadline.due_today(memory)
+    if late or due_now:
+        D.blank()
+        print(f"  {D.c('Jatuh tempo:', D.WHITE, D.BOLD)}  {D.c(f'({len(late)} terlambat · {len(due_now)} hari ini)', D.RED if late else D.YELLOW)}")
+        rows = [(t, D.RED) for t in late] + [(t, D.YELLOW) for t in due_now]
+        for t, color in rows[:5]:
+            print(f"  {D.c('!', color)}  {t['v']}  {D.c(deadline.label(t['due']), color)}")
+
     # Sesi & streak
     D.blank()
     streak = context.get("streak_days", 0)
@@ -102,16 +125,15 @@ def weekly_summary(memory, context):
     added_week  = [t for t in tasks if _date_of(t.get("t","")) >= week_ago]
     pending     = [t for t in tasks if not t.get("done")]
 
-    mood_data  = load_json(MOOD_FILE, [])
-    mood_week  = [e for e in mood_data if e.get("date","") >= week_ago]
-    avg_mood   = round(sum(e["mood"] for e in mood_week) / len(mood_week), 1) if mood_week else None
-    avg_energy = round(sum(e["energy"] for e in mood_week) / len(mood_week), 1) if mood_week else None
+    from core.mood import mood_window
+    mood_week  = mood_window(week_ago) or {}
+    avg_mood   = mood_week.get("avg_mood")
+    avg_energy = mood_week.get("avg_energy")
 
-    # Hari aktif minggu ini
-    from core.config import LOG_FILE
-    logs = load_json(LOG_FILE, [])
+    # Hari aktif minggu ini — store biner menyimpan riwayat penuh,
+    # log.json hanya max_logs entry terakhir
     active_days = set()
-    for e in logs:
+    for e in _week_logs(week_ago):
         d = _date_of(e.get("t",""))
         if d >= week_ago:
             active_days.add(d)
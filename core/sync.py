@@ -0,0 +1,496 @@
+# core/sync.py
+# AKARU – Delta Sync antar Device
+# Catatan, tugas dan mood di-hash per record; tiap koleksi diringkas jadi
+# pohon Merkle dua tingkat (akar → bucket → record). Dua sisi hanya bertukar:
+#   1. akar per koleksi           → sama? selesai, tidak ada yang dikirim
+#   2. hash bucket yang berbeda   → ratusan hash kecil, bukan seluruh data
+#   3. (kunci, hash) di bucket itu → baru record yang memang hilang/beda
+# Data yang dikirim sebanding dengan perubahan, bukan ukuran dataset.
+#
+# Transport:
+#   akaru sync <folder-data-lain>              langsung (SD card, folder bersama)
+#   akaru sync --serve [host:port|socket]      layani data dir ini (token acak)
+#   akaru sync --connect <host:port|socket> <token>
+#   akaru sync --summary <file>                ringkasan device ini (bundle offline)
+#   akaru sync --bundle <ringkasan> <file>     record yang tidak dimiliki pemilik ringkasan
+#   akaru sync --apply <file>                  gabungkan bundle
+#
+# Konflik (kunci sama, isi beda) diselesaikan deterministik — dua sisi memilih
+# pemenang yang sama tanpa koordinasi:
+#   • catatan beda / tugas dengan t atau teks beda → dua record berbeda yang
+#     kebetulan dapat id sama: yang lebih tua tetap di id itu, yang lain
+#     ditambahkan di id baru (catatan tidak pernah diedit, tugas hanya done*)
+#   • tugas yang sama → selesai > belum, done_at lebih baru menang
+#   • mood di waktu yang sama → hash isi terbesar menang
+# Penghapusan tidak ikut tersinkron (tidak ada tombstone): record yang dihapus
+# di satu sisi akan kembali dari sisi lain.
+
+import json
+import os
+import secrets
+import socket
+import zlib
+from bisect import bisect_left
+from core.config import load_json, save_json, plain, ensure_data_dir, stat_key, DATA_DIR
+from core import synctree
+# Hash & pembagian bucket tinggal di core/synctree (sidecar pohon hash)
+from core.synctree import (
+    BUCKET_IDS, COLLECTIONS, record_hash, key_of, bucket_of, root_hash,
+)
+
+SYNC_VERSION = 1
+DEFAULT_PORT = 7878
+
+# ── Hash ──────────────────────────────────────────────────
+def content_hash(rec):
+    """Hash isi tanpa id — record yang sama walau sudah pindah id."""
+    return record_hash({k: v for k, v in plain(rec).items() if k != "id"})
+
+# ── Peer lokal (satu data dir) ────────────────────────────
+class LocalPeer:
+    """
+    Satu data dir. memory: dict memory yang sedang dipakai engine (record di
+    RAM) — kalau None, memory.json dibaca/ditulis langsung sebagai dict.
+    """
+    def __init__(self, data_dir=DATA_DIR, memory=None):
+        self.dir     = os.path.abspath(data_dir)
+        self._memory = memory
+        self._live   = memory is not None   # record engine (Note/Task), bukan dict
+        self._trees  = {}   # coll → synctree.Tree (sekali per sync)
+
+    def _path(self, name):
+        return os.path.join(self.dir, name)
+
+    def memory(self):
+        if self._memory is None:
+            self._memory = load_json(self._path("memory.json"), {"notes": [], "tasks": []})
+        return self._memory
+
+    def items(self, coll):
+        if coll == "mood":
+            return load_json(self._path("mood.json"), [])
+        return self.memory().get(coll, [])
+
+    def _tree(self, coll):
+        # Sidecar pohon hash (core/synctree): dibangun ulang hanya kalau basi
+        if coll not in self._trees:
+            self._trees[coll] = synctree.tree(self.dir, coll, lambda: self.items(coll))
+        return self._trees[coll]
+
+    # ── API peer (sama untuk lokal, socket, bundle) ──────
+    def summary(self, coll):
+        """Dari header pohon: O(jumlah bucket), record tidak disentuh."""
+        tree = self._tree(coll)
+        return {
+            "root"   : root_hash(tree.buckets),
+            "buckets": dict(tree.buckets),
+            "max_id" : tree.max_id,
+        }
+
+    def leaves(self, coll, buckets):
+        tree = self._tree(coll).leaves()
+        return {k: h for b in buckets for k, h in tree.get(b, {}).items()}
+
+    def records(self, coll, keys):
+        """Record per kunci lewat bisect (list urut kunci) — bukan scan seluruh koleksi."""
+        items, out, miss = self.items(coll), [], set()
+        for k in keys:
+            rec = _find(items, coll, k)
+            if rec is None:
+                miss.add(str(k))
+            else:
+                out.append(plain(rec))
+        if miss:   # list tidak urut (edit manual) → cari sisanya dengan scan
+            out += [plain(r) for r in items if str(key_of(coll, r)) in miss]
+        return out
+
+    def put(self, coll, recs):
+        """Tulis record: ganti yang kuncinya sama, sisipkan yang baru (urut kunci)."""
+        if not recs:
+            return 0
+        from core import writer
+        tree = self._tree(coll)
+        path = synctree.source(self.dir, coll)
+        old  = stat_key(path)
+        if coll == "mood":
+            rows = _merge(load_json(path, []), recs, coll)
+            save_json(path, rows)
+        else:
+            mem = self.memory()
+            if self._live:
+                from core import memory as M
+                cls  = M.Note if coll == "notes" else M.Task
+                recs = [cls.from_json(r) for r in recs]
+            # List baru (bukan di tempat): index di RAM (tag, query, dedup, deadline)
+            # melihat identitas list berubah dan membangun ulang sendiri
+            mem[coll] = _merge(mem.get(coll, []), recs, coll)
+            save_json(path, mem)
+        # Pohon ikut versi baru: hanya bucket record yang masuk dihitung ulang
+        writer.flush()
+        for r in recs:
+            tree.set(key_of(coll, r), record_hash(r))
+        synctree.landed(self.dir, path, old, stat_key(path), self._trees)
+        return len(recs)
+
+def _find(items, coll, key):
+    k = key if coll == "mood" else int(key)
+    i = bisect_left(items, k, key=lambda r: key_of(coll, r))
+    return items[i] if i < len(items) and key_of(coll, items[i]) == k else None
+
+def _merge(items, recs, coll):
+    index = {str(key_of(coll, r)): r for r in recs}
+    out   = [r for r in items if str(key_of(coll, r)) not in index]
+    keys  = [key_of(coll, r) for r in out]
+    for r in sorted(recs, key=lambda r: key_of(coll, r)):
+        k = key_of(coll, r)
+        i = bisect_left(keys, k)
+        keys.insert(i, k)
+        out.insert(i, r)
+    return out
+
+# ── Resolusi konflik ──────────────────────────────────────
+def _rank(coll, rec):
+    h = record_hash(rec)
+    if coll == "tasks":
+        return (bool(rec.get("done")), rec.get("done_at") or "", h)
+    return (h,)
+
+def resolve(coll, a, b):
+    """
+    Return (pemenang, pindahan): pindahan = record yang harus dapat id baru
+    (dua record berbeda dengan id sama), atau None. Simetris: resolve(a, b)
+    dan resolve(b, a) memberi hasil yang sama.
+    """
+    if coll == "notes" or (coll == "tasks" and (a.get("t"), a.get("v")) != (b.get("t"), b.get("v"))):
+        older, newer = sorted((a, b), key=lambda r: (r.get("t") or "", record_hash(r)))
+        return older, newer
+    return max((a, b), key=lambda r: _rank(coll, r)), None
+
+# ── Algoritma sync dua arah ───────────────────────────────
+def sync(local, remote, progress=None):
+    """Samakan dua peer. Return {koleksi: {"sent": n, "received": n, "conflicts": n}}."""
+    stats = {}
+    for coll in COLLECTIONS:
+        st = stats[coll] = {"sent": 0, "received": 0, "conflicts": 0, "buckets": 0}
+        ls, rs = local.summary(coll), remote.summary(coll)
+        if ls["root"] == rs["root"]:
+            continue
+        diff = sorted(b for b in set(ls["buckets"]) | set(rs["buckets"])
+                      if ls["buckets"].get(b) != rs["buckets"].get(b))
+        st["buckets"] = len(diff)
+        ll, rl = local.leaves(coll, diff), remote.leaves(coll, diff)
+        need_l = [k for k, h in rl.items() if ll.get(k) != h]   # local butuh dari remote
+        need_r = [k for k, h in ll.items() if rl.get(k) != h]   # remote butuh dari local
+        got_r  = {str(key_of(coll, r)): r for r in remote.records(coll, need_l)}
+        got_l  = {str(key_of(coll, r)): r for r in local.records(coll, need_r)}
+
+        to_local, to_remote, moved = [], [], []
+        for k, r in got_r.items():
+            if k not in got_l:
+                to_local.append(r)
+        for k, l in got_l.items():
+            if k not in got_r:
+                to_remote.append(l)
+                continue
+            st["conflicts"] += 1
+            win, move = resolve(coll, l, got_r[k])
+            if win is not l:
+                to_local.append(win)
+            if win is not got_r[k]:
+                to_remote.append(win)
+            if move is not None:
+                moved.append(move)
+        # Record yang kalah id: id baru di atas max kedua sisi → sama di dua sisi.
+        # Sudah pernah dipindah (bundle balasan membawanya di id baru)? lewati.
+        next_id = max(ls["max_id"], rs["max_id"]) + 1
+        known   = {content_hash(r) for r in to_local + to_remote}
+        for rec in sorted(moved, key=lambda r: (r.get("t") or "", record_hash(r))):
+            if content_hash(rec) in known:
+                continue
+            rec = dict(plain(rec), id=next_id)
+            next_id += 1
+            to_local.append(rec)
+            to_remote.append(rec)
+        st["received"] = local.put(coll, to_local)
+        st["sent"]     = remote.put(coll, to_remote)
+        if progress:
+            progress(coll, st)
+    return stats
+
+# ── Transport: socket (TCP atau Unix) ─────────────────────
+def _address(addr):
+    """'host:port' / ':port' / 'port' → (AF_INET, (host, port)); selain itu path Unix socket."""
+    addr = addr or f"127.0.0.1:{DEFAULT_PORT}"
+    host, sep, port = addr.rpartition(":")
+    if port.isdigit() and (sep or addr.isdigit()):
+        return socket.AF_INET, (host or "127.0.0.1", int(port))
+    return socket.AF_UNIX, addr
+
+def _send(f, msg):
+    f.write((json.dumps(msg, ensure_ascii=False) + "\n").encode("utf-8"))
+    f.flush()
+
+def _recv(f):
+    line = f.readline()
+    if not line:
+        raise ConnectionError("koneksi terputus")
+    return json.loads(line)
+
+class RemotePeer:
+    """Peer di ujung socket: tiap method = satu request/response JSON per baris."""
+    OPS = ("summary", "leaves", "records", "put")
+
+    def __init__(self, addr, token):
+        family, target = _address(addr)
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.connect(target)
+        self.f = self.sock.makefile("rwb")
+        _send(self.f, {"hello": SYNC_VERSION, "token": token})
+        reply = _recv(self.f)
+        if "error" in reply:
+            self.close()
+            raise PermissionError(reply["error"])
+
+    def _call(self, op, *args):
+        _send(self.f, {"op": op, "args": args})
+        reply = _recv(self.f)
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+        return reply["ok"]
+
+    def summary(self, coll):          return self._call("summary", coll)
+    def leaves(self, coll, buckets):  return self._call("leaves", coll, buckets)
+    def records(self, coll, keys):    return self._call("records", coll, keys)
+    def put(self, coll, recs):        return self._call("put", coll, recs)
+
+    def close(self):
+        try:
+            self.f.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+def serve(addr=None, peer=None, token=None, once=False, on_ready=None):
+    """Layani peer lokal lewat socket. Satu koneksi per waktu; token wajib cocok."""
+    peer   = peer or LocalPeer()
+    token  = token or secrets.token_hex(8)
+    family, target = _address(addr)
+    srv = socket.socket(family, socket.SOCK_STREAM)
+    if family == socket.AF_UNIX and os.path.exists(target):
+        os.remove(target)
+    if family == socket.AF_INET:
+        srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    srv.bind(target)
+    srv.listen(1)
+    if on_ready:
+        on_ready(srv.getsockname(), token)
+    try:
+        while True:
+            conn, _ = srv.accept()
+            with conn, conn.makefile("rwb") as f:
+                _serve_conn(f, peer, token)
+            peer._trees.clear()
+            if once:
+                break
+    finally:
+        srv.close()
+        if family == socket.AF_UNIX and os.path.exists(target):
+            os.remove(target)
+
+def _serve_conn(f, peer, token):
+    try:
+        hello = _recv(f)
+        if not secrets.compare_digest(str(hello.get("token", "")), token):
+            _send(f, {"error": "token salah"})
+            return
+        _send(f, {"ok": SYNC_VERSION})
+        while True:
+            try:
+                msg = _recv(f)
+            except ConnectionError:
+                return
+            op = msg.get("op")
+            if op not in RemotePeer.OPS:
+                _send(f, {"error": f"op tidak dikenal: {op}"})
+                continue
+            try:
+                _send(f, {"ok": getattr(peer, op)(*msg.get("args", ()))})
+            except Exception as e:
+                _send(f, {"error": str(e)})
+    except (ConnectionError, ValueError, OSError):
+        return
+
+# ── Transport: bundle file (offline) ──────────────────────
+# Alur: B → `--summary b.sum` → dibawa ke A → A `--bundle b.sum ab.akb`
+#       → dibawa ke B → B `--apply ab.akb`. Bundle juga memuat ringkasan A,
+#       jadi B bisa langsung membuat bundle balasan untuk A.
+def _write_blob(path, obj):
+    raw = zlib.compress(json.dumps(obj, ensure_ascii=False).encode("utf-8"), 6)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(raw)
+    os.replace(tmp, path)
+    return len(raw)
+
+def _read_blob(path):
+    with open(path, "rb") as f:
+        obj = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+    if obj.get("v") != SYNC_VERSION:
+        raise ValueError(f"{path}: versi sync tidak cocok")
+    return obj
+
+def write_summary(peer, path):
+    return _write_blob(path, {"v": SYNC_VERSION, "summary": {c: peer.summary(c) for c in COLLECTIONS}})
+
+def write_bundle(peer, summary_path, path):
+    """Semua record lokal di bucket yang berbeda dari ringkasan peer lain."""
+    other = _read_blob(summary_path)["summary"]
+    recs, n = {}, 0
+    mine = {}
+    for coll in COLLECTIONS:
+        s = mine[coll] = peer.summary(coll)
+        theirs = other.get(coll, {"buckets": {}})["buckets"]
+        diff = [b for b, h in s["buckets"].items() if theirs.get(b) != h]
+        keys = list(peer.leaves(coll, diff))
+        recs[coll] = peer.records(coll, keys) if keys else []
+        n += len(recs[coll])
+    size = _write_blob(path, {"v": SYNC_VERSION, "summary": mine, "records": recs})
+    return n, size
+
+class BundlePeer:
+    """Bundle sebagai peer read-only: hanya record yang dibawanya yang terlihat."""
+    def __init__(self, path):
+        obj = _read_blob(path)
+        self.recs = obj.get("records", {})
+        self.sums = obj["summary"]
+
+    def summary(self, coll):
+        # Root dibedakan supaya sync selalu membandingkan isi bundle
+        s = self.sums.get(coll, {"buckets": {}, "max_id": 0})
+        return {"root": None, "buckets": self._buckets(coll), "max_id": s.get("max_id", 0)}
+
+    def _buckets(self, coll):
+        out = {}
+        for r in self.recs.get(coll, ()):
+            out.setdefault(bucket_of(coll, key_of(coll, r)), "bundle")
+        return out
+
+    def leaves(self, coll, buckets):
+        want = set(buckets)
+        return {str(key_of(coll, r)): record_hash(r) for r in self.recs.get(coll, ())
+                if bucket_of(coll, key_of(coll, r)) in want}
+
+    def records(self, coll, keys):
+        want = set(keys)
+        return [r for r in self.recs.get(coll, ()) if str(key_of(coll, r)) in want]
+
+    def put(self, coll, recs):
+        return 0   # arah balik lewat bundle balasan
+
+def apply_bundle(peer, path):
+    # Record lokal yang tidak ada di bundle bukan "kiriman": leaves lokal
+    # dibatasi ke kunci yang dibawa bundle supaya tidak dihitung sebagai beda.
+    bundle = BundlePeer(path)
+    scoped = _Scoped(peer, bundle)
+    return sync(scoped, bundle)
+
+class _Scoped:
+    """Peer lokal dilihat hanya sebatas kunci yang ada di bundle."""
+    def __init__(self, peer, bundle):
+        self.peer, self.bundle = peer, bundle
+
+    def summary(self, coll):
+        s    = self.peer.summary(coll)
+        mine = s["buckets"]
+        return {"root": s["root"], "max_id": s["max_id"],
+                "buckets": {b: mine[b] for b in self.bundle.summary(coll)["buckets"] if b in mine}}
+
+    def leaves(self, coll, buckets):
+        keys = set(self.bundle.leaves(coll, buckets))
+        return {k: h for k, h in self.peer.leaves(coll, buckets).items() if k in keys}
+
+    def records(self, coll, keys):
+        return self.peer.records(coll, keys)
+
+    def put(self, coll, recs):
+        return self.peer.put(coll, recs)
+
+# ── Tampilan & CLI ────────────────────────────────────────
+def _report(stats):
+    from core import display as D
+    labels = {"notes": "Catatan", "tasks": "Tugas", "mood": "Mood"}
+    for coll, st in stats.items():
+        if not (st["sent"] or st["received"] or st["conflicts"]):
+            D.info(labels[coll], "sudah sama")
+            continue
+        D.info(labels[coll], f"terima {st['received']} · kirim {st['sent']} · "
+                             f"konflik {st['conflicts']} · bucket beda {st['buckets']}")
+
+def sync_dir(other_dir, memory=None):
+    """Sync dua arah dengan folder data lain (dipakai CLI & perintah `sync`)."""
+    from core import display as D
+    if not os.path.isdir(other_dir):
+        D.err(f"Folder tidak ditemukan: {other_dir}")
+        return None
+    if os.path.abspath(other_dir) == os.path.abspath(DATA_DIR):
+        D.err("Itu folder data ini sendiri.")
+        return None
+    ensure_data_dir()
+    stats = sync(LocalPeer(DATA_DIR, memory), LocalPeer(other_dir))
+    D.header(f"SYNC ↔ {other_dir}", D.CYAN)
+    _report(stats)
+    D.sep()
+    return stats
+
+def main(args):
+    from core import display as D
+    from core import writer
+
+    def usage():
+        print("Usage: akaru sync <folder-data-lain>")
+        print("       akaru sync --serve [host:port|socket]")
+        print("       akaru sync --connect <host:port|socket> <token>")
+        print("       akaru sync --summary <file>")
+        print("       akaru sync --bundle <ringkasan> <file>")
+        print("       akaru sync --apply <file>")
+        return 1
+
+    if not args:
+        return usage()
+    ensure_data_dir()
+    try:
+        if args[0] == "--serve":
+            def ready(where, token):
+                D.ok(f"Sync server aktif di {where}. Di device lain:")
+                print(f"  akaru sync --connect {args[1] if len(args) > 1 else where[0] + ':' + str(where[1])} {token}")
+            serve(args[1] if len(args) > 1 else None, on_ready=ready)
+        elif args[0] == "--connect" and len(args) >= 3:
+            remote = RemotePeer(args[1], args[2])
+            try:
+                stats = sync(LocalPeer(), remote)
+            finally:
+                remote.close()
+            D.header(f"SYNC ↔ {args[1]}", D.CYAN)
+            _report(stats)
+            D.sep()
+        elif args[0] == "--summary" and len(args) >= 2:
+            size = write_summary(LocalPeer(), args[1])
+            D.ok(f"Ringkasan → {args[1]} ({size} byte)")
+        elif args[0] == "--bundle" and len(args) >= 3:
+            n, size = write_bundle(LocalPeer(), args[1], args[2])
+            D.ok(f"{n} record → {args[2]} ({size} byte)")
+        elif args[0] == "--apply" and len(args) >= 2:
+            stats = apply_bundle(LocalPeer(), args[1])
+            D.header(f"SYNC ← {args[1]}", D.CYAN)
+            _report(stats)
+            D.sep()
+        elif not args[0].startswith("-"):
+            sync_dir(args[0])
+        else:
+            return usage()
+    except (OSError, ValueError, PermissionError, RuntimeError) as e:
+        D.err(f"Sync gagal: {e}")
+        return 1
+    finally:
+        writer.flush()
+    return 0
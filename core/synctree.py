@@ -0,0 +1,278 @@
+# core/synctree.py
+# AKARU – Pohon Hash Sync (sidecar)
+# Hash record, hash bucket dan akar untuk core/sync disimpan di data dir,
+# jadi ringkasan sync cukup membaca hash bucket — tidak json.dumps + hash
+# seluruh dataset tiap sync.
+#
+#   sync_tree.json          {koleksi: {src, max_id, buckets: {bucket: hash}}}  (kecil)
+#   sync_leaves_<kol>.json  {root, leaves: {bucket: {kunci: hash}}}   (dimuat malas)
+#
+# src = stat_key store sumber (memory.json / mood.json) yang isinya cocok
+# dengan pohon; beda → pohon basi, dibangun ulang sekali dari store. File
+# daun cocok dengan header kalau akar hash bucket-nya sama.
+#
+# Perubahan dari proses ini (event NOTE/TASK/MOOD) dicatat di jurnal RAM —
+# satu hash record per event — dan diterapkan ke sidecar saat proses keluar
+# atau sebelum sync, setelah antrian tulis kosong: hanya bucket yang disentuh
+# yang dihitung ulang. Store diubah proses lain (STORE_CHANGED), batch batal,
+# atau basis jurnal tidak pasti → jurnal dibuang, pohon dibangun ulang nanti.
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+from core.config import (
+    DATA_DIR, load_json, save_json, plain, stat_key, in_batch, last_write,
+    register_abort_hook,
+)
+from core import config
+from core import events
+
+TREE_VERSION = 1
+BUCKET_IDS   = 64          # catatan/tugas: id 0-63 → bucket 0, dst.
+TREE_FILE    = "sync_tree.json"
+COLLECTIONS  = ("notes", "tasks", "mood")
+
+# ── Hash ──────────────────────────────────────────────────
+def _h(data):
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=8).hexdigest()
+
+def record_hash(rec):
+    return _h(json.dumps(plain(rec), sort_keys=True, ensure_ascii=False))
+
+def key_of(coll, rec):
+    return rec["t"] if coll == "mood" else rec["id"]
+
+def bucket_of(coll, key):
+    # Mood: per bulan (YYYY-MM); catatan/tugas: rentang id. Dua-duanya naik
+    # seiring waktu, jadi record baru hanya mengubah bucket terakhir.
+    return key[:7] if coll == "mood" else str(int(key) // BUCKET_IDS)
+
+def bucket_hash(leaf):
+    return _h("\n".join(f"{k}:{v}" for k, v in sorted(leaf.items())))
+
+def root_hash(buckets):
+    return _h("\n".join(f"{b}:{h}" for b, h in sorted(buckets.items())))
+
+def source(folder, coll):
+    return os.path.join(folder, "mood.json" if coll == "mood" else "memory.json")
+
+def _src(key):
+    return list(key) if key else None
+
+# ── Pohon satu koleksi ────────────────────────────────────
+class Tree:
+    """Header (src, max_id, hash bucket) selalu di RAM; daun dimuat saat perlu."""
+    __slots__ = ("folder", "coll", "src", "max_id", "buckets", "_leaves", "_items")
+
+    def __init__(self, folder, coll, items, head=None):
+        self.folder  = folder
+        self.coll    = coll
+        self._items  = items   # fn → list record (untuk bangun ulang)
+        self._leaves = None
+        head = head or {}
+        self.src     = head.get("src")
+        self.max_id  = head.get("max_id", 0)
+        self.buckets = head.get("buckets", {})
+
+    def _leaves_path(self):
+        return os.path.join(self.folder, f"sync_leaves_{self.coll}.json")
+
+    def rebuild(self):
+        """Dari store (pemanggil memastikan isi RAM = disk). O(dataset), sekali."""
+        leaves = {}
+        for rec in self._items():
+            key = key_of(self.coll, rec)
+            leaves.setdefault(bucket_of(self.coll, key), {})[str(key)] = record_hash(rec)
+        self._leaves = leaves
+        self.buckets = {b: bucket_hash(leaf) for b, leaf in leaves.items()}
+        self.max_id  = self._max_id()
+        self.src     = _src(stat_key(source(self.folder, self.coll)))
+        self.save()
+
+    def load_leaves(self):
+        """Daun dari sidecar; False kalau file daun tidak cocok dengan header."""
+        if self._leaves is None:
+            data = load_json(self._leaves_path(), None)
+            if not isinstance(data, dict) or data.get("root") != root_hash(self.buckets):
+                return False
+            self._leaves = data["leaves"]
+        return True
+
+    def leaves(self):
+        if not self.load_leaves():
+            self.rebuild()
+        return self._leaves
+
+    def _max_id(self):
+        if self.coll == "mood" or not self._leaves:
+            return 0
+        last = self._leaves[max(self._leaves, key=int)]
+        return max(int(k) for k in last)
+
+    def set(self, key, h):
+        """Daun `key` = hash h (None = record dihapus); hanya bucket-nya dihitung ulang."""
+        leaves = self.leaves()
+        b      = bucket_of(self.coll, key)
+        leaf   = leaves.setdefault(b, {})
+        if h is None:
+            leaf.pop(str(key), None)
+        else:
+            leaf[str(key)] = h
+        if leaf:
+            self.buckets[b] = bucket_hash(leaf)
+        else:
+            del leaves[b]
+            self.buckets.pop(b, None)
+        if self.coll != "mood":
+            if h is not None:
+                self.max_id = max(self.max_id, int(key))
+            elif int(key) >= self.max_id:
+                self.max_id = self._max_id()
+
+    def save(self):
+        # Daun dulu, baru header: crash di tengah → akar tidak cocok → bangun ulang
+        if self._leaves is not None:
+            save_json(self._leaves_path(), {"root": root_hash(self.buckets), "leaves": self._leaves})
+        _save_head(self.folder, self.coll, {"v": TREE_VERSION, "src": self.src,
+                                            "max_id": self.max_id, "buckets": self.buckets})
+
+def _heads(folder):
+    data = load_json(os.path.join(folder, TREE_FILE), {})
+    return data if isinstance(data, dict) else {}
+
+def _save_head(folder, coll, head):
+    heads = _heads(folder)
+    heads[coll] = head
+    save_json(os.path.join(folder, TREE_FILE), heads)
+
+def tree(folder, coll, items):
+    """
+    Pohon koleksi yang cocok dengan store saat ini (dipakai core/sync).
+    Antrian tulis di-flush dan jurnal proses ini diterapkan dulu.
+    """
+    from core import writer
+    folder = os.path.abspath(folder)
+    if folder == os.path.abspath(DATA_DIR):
+        flush()
+    writer.flush()
+    head = _heads(folder).get(coll)
+    key  = _src(stat_key(source(folder, coll)))
+    if isinstance(head, dict) and head.get("v") == TREE_VERSION and head.get("src") == key:
+        return Tree(folder, coll, items, head)
+    t = Tree(folder, coll, items)
+    t.rebuild()
+    return t
+
+def landed(folder, path, old, new, trees=()):
+    """
+    Store `path` berpindah dari versi old ke new dan pohon di `trees` (coll → Tree,
+    sudah diperbarui; None = berubah tapi tidak bisa diikuti, biarkan basi).
+    Koleksi lain di store yang sama yang masih cocok dengan versi old cukup
+    ganti src. Return koleksi yang tersimpan.
+    """
+    old, new, done = _src(old), _src(new), []
+    for coll in COLLECTIONS:
+        if source(folder, coll) != path:
+            continue
+        if coll in trees:
+            t = trees[coll]
+            if t is None or t.src != old:
+                continue
+        else:
+            head = _heads(folder).get(coll)
+            if not isinstance(head, dict) or head.get("src") != old:
+                continue
+            t = Tree(folder, coll, None, head)
+        t.src = new
+        t.save()
+        done.append(coll)
+    return done
+
+# ── Jurnal perubahan proses ini ───────────────────────────
+# path store → {"ok": basis pasti?, "base": stat_key sebelum perubahan pertama,
+#               "changes": {coll: {kunci: hash | None}}}
+_journal = {}
+_mu      = threading.Lock()
+
+def _base(path):
+    """
+    (pasti?, versi store sebelum perubahan yang sedang diumumkan). Event
+    catatan/tugas terbit sebelum save → stat sekarang, asal tidak ada save
+    yang masih antre. Mood terbit sesudah append → versi sebelum tulisan
+    terakhir proses ini (di dalam batch tidak pasti).
+    """
+    key = stat_key(path)
+    if path.endswith("mood.json"):
+        last = last_write.get(path)
+        if not in_batch() and last and last[1] == key:
+            return True, last[0]
+        return False, None
+    return config._pending(path) is None, key
+
+def _record(coll, rec, gone=False):
+    path = source(DATA_DIR, coll)
+    h    = None if gone else record_hash(rec)
+    with _mu:
+        j = _journal.get(path)
+        if j is None:
+            ok, base = _base(path)
+            j = _journal[path] = {"ok": ok, "base": base, "changes": {}}
+        if j["ok"]:
+            j["changes"].setdefault(coll, {})[str(key_of(coll, rec))] = h
+
+def _forget(path=None):
+    with _mu:
+        for p in ([path] if path else list(_journal)):
+            if p in _journal:
+                _journal[p]["ok"] = False
+
+def flush():
+    """Terapkan jurnal ke sidecar (saat keluar / sebelum sync). Return koleksi tersimpan."""
+    from core import writer
+    writer.flush()
+    with _mu:
+        pending = list(_journal.items())
+        _journal.clear()
+    done = []
+    for path, j in pending:
+        last = last_write.get(path)
+        head = stat_key(path)
+        if not j["ok"] or not j["changes"] or last is None or head == j["base"]:
+            continue   # basis tidak pasti, atau perubahan tidak pernah sampai disk
+        if last[1] != head:
+            continue   # ada tulisan proses lain sesudah tulisan terakhir kita
+        folder = os.path.dirname(path)
+        trees  = {}
+        for coll, changes in j["changes"].items():
+            h = _heads(folder).get(coll)
+            t = trees[coll] = Tree(folder, coll, None, h) if isinstance(h, dict) else None
+            if t is None or t.src != _src(j["base"]) or not t.load_leaves():
+                trees[coll] = None   # sidecar sudah basi sebelum sesi ini
+                continue
+            for key, rh in changes.items():
+                t.set(key, rh)
+        done += landed(folder, path, j["base"], head, trees)
+    return done
+
+for _event, _coll, _gone in (
+    (events.NOTE_ADDED,   "notes", False),
+    (events.NOTE_DELETED, "notes", True),
+    (events.TASK_ADDED,   "tasks", False),
+    (events.TASK_CHANGED, "tasks", False),
+    (events.TASK_DELETED, "tasks", True),
+):
+    events.subscribe(_event, lambda memory, rec, c=_coll, g=_gone: _record(c, rec, g),
+                     name=f"synctree.{_event}")
+events.subscribe(events.MOOD_LOGGED, lambda rec: _record("mood", rec), name="synctree.mood")
+events.subscribe(events.STORE_CHANGED, lambda path: _forget(path), name="synctree.forget")
+register_abort_hook(_forget)
+
+def _at_exit():
+    try:
+        flush()
+    except OSError:
+        pass   # sidecar cuma percepatan; sync berikutnya membangun ulang
+
+atexit.register(_at_exit)
@@ -0,0 +1,162 @@
+# core/tags.py
+# AKARU – Hashtag Index
+# Token #tag di catatan & tugas diindex sebagai bitset int per tag:
+# bit ke-i menyala ↔ record dengan id i punya tag itu.
+#
+#   cari #kerja -#pribadi rapat
+#     → bits(#kerja) & ~bits(#pribadi), lalu filter teks "rapat" di hasilnya saja
+#
+# Index hidup di RAM (tidak ada file baru): dibangun sekali per list record,
+# lalu dirawat inkremental oleh add_note/add_task/complete_task/delete_*.
+# Jumlah record per tag disimpan terpisah, jadi hitungan untuk status/analisis
+# O(1) per tag. Struktur yang sama dipakai untuk status tugas (aktif/selesai),
+# yang dibaca planner query (core/query.py).
+
+import re
+from bisect import bisect_left
+from core import events
+
+TAG_RE = re.compile(r"(?<![\w#])#(\w[\w-]*)")
+KINDS  = ("notes", "tasks")
+
+def parse_tags(text):
+    """'rapat #Kerja #kerja #q4' → ['kerja', 'q4'] (huruf kecil, unik, urut muncul)."""
+    return list(dict.fromkeys(m.lower() for m in TAG_RE.findall(text or "")))
+
+def _rec_tags(rec):
+    return parse_tags(rec["v"])
+
+def _rec_status(rec):
+    return ("selesai",) if rec.get("done") else ("aktif",)
+
+# ── Index per jenis record ────────────────────────────────
+class TagIndex:
+    __slots__ = ("keys", "items", "n", "bits", "counts")
+
+    def __init__(self, keys=_rec_tags):
+        self.keys    = keys   # record → kunci index (tag, status)
+        self.items   = None   # list record yang di-index (identitas objek)
+        self.n       = 0      # jumlah record di list yang sudah di-index
+        self.bits    = {}     # tag → int bitset id
+        self.counts  = {}     # tag → jumlah record
+
+    def rebuild(self, items):
+        self.items, self.bits, self.counts = items, {}, {}
+        self.n = 0
+        for rec in items:
+            self.add(rec)
+
+    def add(self, rec):
+        rid = rec["id"]
+        for tag in self.keys(rec):
+            self.bits[tag]   = self.bits.get(tag, 0) | (1 << rid)
+            self.counts[tag] = self.counts.get(tag, 0) + 1
+        self.n += 1
+
+    def discard(self, rec):
+        self.n -= 1
+        mask = 1 << rec["id"]
+        for tag in self.keys(rec):
+            bits = self.bits.get(tag, 0)
+            if not bits & mask:
+                continue
+            if bits == mask:
+                del self.bits[tag], self.counts[tag]
+            else:
+                self.bits[tag]    = bits & ~mask
+                self.counts[tag] -= 1
+
+    def sync(self, items):
+        if self.items is not items:
+            self.rebuild(items)
+            return self
+        # Record yang masuk tanpa event ada di ujung list. Dihitung dari jumlah,
+        # bukan id terbesar: id record terakhir yang dihapus bisa dipakai lagi.
+        new = len(items) - self.n
+        if new < 0:
+            self.rebuild(items)
+        elif new:
+            for rec in items[-new:]:
+                self.add(rec)
+        return self
+
+_indexes = {
+    ("notes", "tag")   : TagIndex(),
+    ("tasks", "tag")   : TagIndex(),
+    ("tasks", "status"): TagIndex(_rec_status),
+}
+
+def index(memory, kind, field="tag"):
+    return _indexes[(kind, field)].sync(memory.get(kind, []))
+
+# ── Hook (event dari core/memory) ─────────────────────────
+# Record berubah (mis. tugas selesai): discard sebelum diubah, add sesudahnya.
+def add(memory, kind, rec):
+    for (k, _), idx in _indexes.items():
+        if k == kind and idx.items is memory.get(kind):
+            idx.add(rec)
+
+def discard(memory, kind, rec):
+    for (k, _), idx in _indexes.items():
+        if k == kind and idx.items is memory.get(kind):
+            idx.discard(rec)
+
+for _event, _kind, _fn in (
+    (events.NOTE_ADDED,    "notes", add),
+    (events.NOTE_DELETED,  "notes", discard),
+    (events.TASK_ADDED,    "tasks", add),
+    (events.TASK_CHANGING, "tasks", discard),
+    (events.TASK_CHANGED,  "tasks", add),
+    (events.TASK_DELETED,  "tasks", discard),
+):
+    events.subscribe(_event, lambda memory, rec, k=_kind, f=_fn: f(memory, k, rec),
+                     name=f"tags.{_fn.__name__}")
+
+# ── Query (dipakai core/query.py) ─────────────────────────
+def ids(bits):
+    """Posisi bit yang menyala, naik — scan byte nol di C, bukan per bit."""
+    raw = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for m in re.finditer(rb"[^\x00]", raw):
+        byte, base = m.group()[0], m.start() * 8
+        while byte:
+            low = byte & -byte
+            yield base + low.bit_length() - 1
+            byte ^= low
+
+def by_id(items, rid):
+    """Record dengan id rid (list terurut id) — O(1) kalau id rapat, O(log n) kalau tidak."""
+    if not items:
+        return None
+    i = rid - items[0]["id"]
+    if 0 <= i < len(items) and items[i]["id"] == rid:
+        return items[i]
+    i = bisect_left(items, rid, key=lambda r: r["id"])
+    return items[i] if i < len(items) and items[i]["id"] == rid else None
+
+def match_bits(memory, kind, inc, exc):
+    """AND semua tag inc, buang tag exc. Tanpa inc → semua record yang punya tag."""
+    idx = index(memory, kind)
+    if inc:
+        bits = idx.bits.get(inc[0], 0)
+        for tag in inc[1:]:
+            bits &= idx.bits.get(tag, 0)
+    else:
+        bits = 0
+        for b in idx.bits.values():
+            bits |= b
+    for tag in exc:
+        bits &= ~idx.bits.get(tag, 0)
+    return bits
+
+def count(memory, tag, kind=None):
+    """Jumlah record dengan tag — O(1) per jenis."""
+    kinds = (kind,) if kind else KINDS
+    return sum(index(memory, k).counts.get(tag.lower().lstrip("#"), 0) for k in kinds)
+
+def top_tags(memory, n=5):
+    """[(tag, jumlah catatan+tugas)] terbanyak."""
+    total = {}
+    for kind in KINDS:
+        for tag, c in index(memory, kind).counts.items():
+            total[tag] = total.get(tag, 0) + c
+    return sorted(total.items(), key=lambda kv: (-kv[1], kv[0]))[:n]
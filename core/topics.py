@@ -0,0 +1,189 @@
+# core/topics.py
+# AKARU – Topik Catatan & Tugas (TF-IDF inkremental)
+# Sidecar data/topics.json dirawat saat catatan/tugas ditambah atau dihapus,
+# jadi `analisis` tidak pernah menghitung ulang seluruh korpus:
+#   docs  : jumlah dokumen (catatan + tugas) yang terhitung
+#   df    : kata → jumlah dokumen yang memuatnya (document frequency)
+#   weeks : 'YYYY-Www' → {kata: frekuensi} untuk WEEKS_KEEP minggu terakhir
+#   seen  : jenis → [jumlah record, id terbesar] saat sidecar diperbarui
+#
+# Skor topik satu minggu = tf(minggu) × (log((1 + docs) / (1 + df)) + 1).
+# Cukup baca tabel minggu itu — O(kata unik minggu itu), bukan O(korpus).
+# `seen` beda dengan memory.json (edit manual, proses lain) → record baru di
+# ujung disusulkan; kalau ada yang hilang di tengah → dibangun ulang sekali.
+
+import math
+import re
+from datetime import datetime, timedelta
+from core.config import TOPICS_FILE, load_json, save_json, register_abort_hook
+from core import events
+
+TOPICS_VERSION = 1
+WEEKS_KEEP     = 12
+KINDS          = ("notes", "tasks")
+WORD_RE        = re.compile(r"[^\W\d_]{3,}")   # huruf saja, minimal 3
+
+STOPWORDS = frozenset("""
+yang dan di ke dari untuk dengan ini itu ada tidak akan juga sudah belum
+saya aku gue gua gw lo lu elo kamu anda dia ia kita kami mereka beliau
+pada dalam atau karena jadi bisa harus lagi masih sama buat biar kalau kalo
+aja saja nya pun lebih sangat banget udah mau gak nggak enggak tak jangan
+ya yah dong deh sih kok kan tuh nih nah oh eh wah
+hari besok kemarin lusa nanti tadi sekarang jam menit minggu bulan tahun pagi siang sore malam
+seperti agar supaya tapi tetapi namun serta bahwa oleh para tentang antara hingga sampai
+apa siapa mana kapan bagaimana kenapa mengapa berapa
+satu dua tiga empat lima banyak sedikit semua setiap
+sedang telah pernah baru segera langsung terus dulu
+bikin ambil kasih pakai lihat coba kerjakan selesai selesaikan
+the and for with this that from are was you your have has not but
+""".split())
+
+# ── Tokenisasi ────────────────────────────────────────────
+def terms(text):
+    """Kata bermakna dari teks: huruf kecil, ≥ 3 huruf, bukan stopword."""
+    return [w for w in WORD_RE.findall((text or "").lower()) if w not in STOPWORDS]
+
+def week_of(iso):
+    try:
+        y, w, _ = datetime.fromisoformat(iso).isocalendar()
+    except (TypeError, ValueError):
+        return None
+    return f"{y}-W{w:02d}"
+
+# ── State (sidecar) ───────────────────────────────────────
+_state = None
+
+def _empty():
+    return {"v": TOPICS_VERSION, "docs": 0, "df": {}, "weeks": {},
+            "seen": {k: [0, 0] for k in KINDS}}
+
+def _apply(st, rec, sign):
+    words = terms(rec.get("v"))
+    if not words:
+        return
+    st["docs"] += sign
+    df = st["df"]
+    for w in set(words):
+        n = df.get(w, 0) + sign
+        if n > 0:
+            df[w] = n
+        else:
+            df.pop(w, None)
+    week = week_of(rec.get("t"))
+    table = st["weeks"].get(week) if sign < 0 else st["weeks"].setdefault(week, {})
+    if table is None or week is None:
+        return
+    for w in words:
+        n = table.get(w, 0) + sign
+        if n > 0:
+            table[w] = n
+        else:
+            table.pop(w, None)
+
+def _trim(st):
+    cutoff = week_of((datetime.now() - timedelta(weeks=WEEKS_KEEP - 1)).isoformat())
+    for wk in [wk for wk in st["weeks"] if wk < cutoff]:
+        del st["weeks"][wk]
+
+def _rebuild(memory):
+    st = _empty()
+    for kind in KINDS:
+        items = memory.get(kind, [])
+        for rec in items:
+            _apply(st, rec, +1)
+        st["seen"][kind] = [len(items), items[-1]["id"] if items else 0]
+    _trim(st)
+    return st
+
+def _load():
+    global _state
+    if _state is None:
+        st = load_json(TOPICS_FILE, None)
+        _state = st if isinstance(st, dict) and st.get("v") == TOPICS_VERSION else _empty()
+    return _state
+
+def _save(st):
+    _trim(st)
+    save_json(TOPICS_FILE, st)
+
+def sync(memory):
+    """Sidecar yang cocok dengan memory di RAM: susul record baru, atau bangun ulang."""
+    global _state
+    st, dirty = _load(), False
+    for kind in KINDS:
+        items = memory.get(kind, [])
+        count, last = st["seen"].get(kind, [0, 0])
+        k = len(items)
+        while k and items[k - 1]["id"] > last:
+            k -= 1
+        if k != count:
+            _state = _rebuild(memory)
+            _save(_state)
+            return _state
+        for rec in items[k:]:
+            _apply(st, rec, +1)
+            dirty = True
+        st["seen"][kind] = [len(items), items[-1]["id"] if items else 0]
+    if dirty:
+        _save(st)
+    return st
+
+# ── Hook (event dari core/memory) ─────────────────────────
+def add(memory, kind, rec):
+    """Record baru sudah ada di ujung memory[kind] → cukup disusulkan."""
+    sync(memory)
+
+def discard(memory, kind, rec):
+    """Record sudah dikeluarkan dari memory[kind]: kurangi df & tabel minggunya."""
+    st = _load()
+    seen = st["seen"].get(kind, [0, 0])
+    if rec["id"] > seen[1]:
+        return   # belum pernah terhitung
+    _apply(st, rec, -1)
+    seen[0] -= 1
+    _save(st)
+
+def _reload(path):
+    """topics.json ditulis proses lain → buang state di RAM, baca ulang saat perlu."""
+    global _state
+    if path == TOPICS_FILE:
+        _state = None
+
+events.subscribe(events.STORE_CHANGED, _reload)
+# Batch batal: save sidecar ikut dibuang, state di RAM dibaca ulang dari disk
+register_abort_hook(lambda: _reload(TOPICS_FILE))
+
+# Deferred: sidecar ditulis ke file → dikerjakan setelah perintah selesai,
+# bukan di tengah perintah yang menunggu output. Tambah cukup sync() sekali
+# per drain (coalesce): import massal tidak mengantrekan satu entri per record.
+def _added(memory, rec):
+    sync(memory)
+
+for _event in (events.NOTE_ADDED, events.TASK_ADDED):
+    events.subscribe(_event, _added, deferred=True, coalesce=True, name="topics.add")
+for _event, _kind in ((events.NOTE_DELETED, "notes"), (events.TASK_DELETED, "tasks")):
+    events.subscribe(_event, lambda memory, rec, k=_kind: discard(memory, k, rec),
+                     deferred=True, name="topics.discard")
+
+# ── Query ─────────────────────────────────────────────────
+def _idf(st, w):
+    return math.log((1 + st["docs"]) / (1 + st["df"].get(w, 0))) + 1
+
+def week_topics(memory, week=None, n=5):
+    """[(kata, skor)] teratas untuk satu minggu ('YYYY-Www', default minggu ini)."""
+    st    = sync(memory)
+    table = st["weeks"].get(week or week_of(datetime.now().isoformat()), {})
+    scored = [(w, tf * _idf(st, w)) for w, tf in table.items()]
+    scored.sort(key=lambda kv: (-kv[1], kv[0]))
+    return [(w, round(s, 1)) for w, s in scored[:n]]
+
+def recent_weeks(memory, weeks=4, n=3):
+    """[(minggu, [(kata, skor)])] untuk `weeks` minggu terakhir, terbaru dulu."""
+    now = datetime.now()
+    out = []
+    for i in range(weeks):
+        wk = week_of((now - timedelta(weeks=i)).isoformat())
+        top = week_topics(memory, wk, n)
+        if top:
+            out.append((wk, top))
+    return out
@@ -0,0 +1,163 @@
+# core/writer.py
+# AKARU – Write-Behind Persistence
+# save_json tidak lagi menunggu json.dump + tulis file: snapshot data
+# dimasukkan antrian, thread latar yang serialisasi & menulis ke disk.
+#
+# Semantik durabilitas (aktif kalau config `write_behind: true`, default):
+#   • save_json return setelah snapshot diambil, SEBELUM data sampai di disk.
+#   • Save berulang ke file yang sama sebelum sempat ditulis → digabung,
+#     hanya snapshot terakhir yang ditulis (tidak ada versi lama menimpa baru).
+#   • Tiap file tetap ditulis atomik (.tmp + os.replace), jadi di disk selalu
+#     versi utuh: lama atau baru, tidak pernah setengah jadi.
+#   • load_json / iter_json_array melihat snapshot yang belum ditulis
+#     (read-your-writes di proses yang sama).
+#   • flush() menunggu antrian kosong. Dipanggil otomatis saat exit (atexit)
+#     dan SIGTERM/SIGHUP. Yang bisa hilang hanya save yang masih antri saat
+#     proses mati keras (SIGKILL, baterai habis) — biasanya hitungan milidetik.
+#   • Batch (begin_batch) tetap didahulukan: commit_batch menulis sinkron.
+#   • submit tidak memegang lock transaksi data/ (core/locks): thread latar
+#     menulis tiap file lewat write_file (lock eksklusif per file + bump
+#     generation), jadi sesi lain melihat versi baru begitu tulisan mendarat.
+
+import atexit
+import sys
+import threading
+from collections import deque
+
+# Salinan plain saat save dipanggil: pemanggil boleh lanjut mengubah state di RAM
+from core.config import plain as _snapshot, write_file
+
+MAX_PENDING = 8   # file berbeda yang boleh antri; lebih dari ini → save menunggu
+
+_writer = None
+
+class WriteBehind:
+    def __init__(self, max_pending=MAX_PENDING):
+        self.max_pending = max_pending
+        self._cond     = threading.Condition()
+        self._pending  = {}       # path → snapshot yang belum ditulis
+        self._order    = deque()  # urutan path di antrian (FIFO per file)
+        self._inflight = {}       # path → snapshot yang sedang ditulis
+        self._closed   = False
+        self.stats     = {"queued": 0, "coalesced": 0, "written": 0, "errors": 0}
+        self.last_error = None
+        self._thread = threading.Thread(target=self._run, name="akaru-writer", daemon=True)
+        self._thread.start()
+
+    # ── Sisi pemanggil ────────────────────────────────────
+    def submit(self, path, data):
+        snap = _snapshot(data)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("writer sudah ditutup")
+            if path in self._pending:
+                self._pending[path] = snap
+                self.stats["coalesced"] += 1
+                return
+            # Antrian penuh → tunggu (backpressure), jangan tumbuh tanpa batas
+            while len(self._pending) >= self.max_pending:
+                self._cond.wait()
+            self._pending[path] = snap
+            self._order.append(path)
+            self.stats["queued"] += 1
+            self._cond.notify_all()
+
+    def peek(self, path):
+        """Snapshot terbaru yang belum ada di disk, atau None."""
+        with self._cond:
+            snap = self._pending.get(path)
+            if snap is None:
+                snap = self._inflight.get(path)
+        return None if snap is None else _snapshot(snap)
+
+    def has_pending(self, path):
+        with self._cond:
+            return path in self._pending or path in self._inflight
+
+    def flush(self, timeout=None):
+        """Tunggu semua save tertulis. Return False kalau timeout."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._inflight, timeout)
+
+    def close(self, timeout=None):
+        """Flush lalu hentikan thread. Aman dipanggil berkali-kali."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return not self._pending and not self._inflight
+
+    def backlog(self):
+        with self._cond:
+            return len(self._pending) + len(self._inflight)
+
+    # ── Thread latar ──────────────────────────────────────
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._order and not self._closed:
+                    self._cond.wait()
+                if not self._order:
+                    return   # closed & antrian kosong
+                path = self._order.popleft()
+                snap = self._pending.pop(path)
+                self._inflight[path] = snap
+                self._cond.notify_all()
+            try:
+                write_file(path, snap, owned=True)
+                ok = True
+            except Exception as e:
+                ok = False
+                self.last_error = f"{path}: {e}"
+                print(f"[writer] gagal menulis {self.last_error}", file=sys.stderr)
+            with self._cond:
+                if self._inflight.get(path) is snap:
+                    del self._inflight[path]
+                self.stats["written" if ok else "errors"] += 1
+                self._cond.notify_all()
+
+# ── API modul ─────────────────────────────────────────────
+def start(max_pending=MAX_PENDING):
+    """Aktifkan write-behind untuk proses ini (idempoten)."""
+    global _writer
+    from core import config
+    if _writer is None:
+        _writer = WriteBehind(max_pending)
+        config.set_writer(_writer)
+        atexit.register(stop)
+        _install_signals()
+    return _writer
+
+def stop():
+    """Flush, join thread, kembali ke save sinkron."""
+    global _writer
+    from core import config
+    w, _writer = _writer, None
+    if w is not None:
+        w.flush()
+        config.set_writer(None)
+        w.close()
+    config.flush_snapshots()   # sidecar .snap ditulis sekali, bukan tiap save
+
+def flush(timeout=None):
+    return _writer.flush(timeout) if _writer is not None else True
+
+def active():
+    return _writer
+
+def _install_signals():
+    # Hanya ganti handler default; daemon/server punya handler sendiri
+    # (dan keluar lewat jalur normal → atexit tetap flush).
+    import signal
+    if threading.current_thread() is not threading.main_thread():
+        return
+
+    def _on_signal(signum, frame):
+        stop()
+        raise SystemExit(128 + signum)
+
+    for name in ("SIGTERM", "SIGHUP"):
+        sig = getattr(signal, name, None)
+        if sig is not None and signal.getsignal(sig) is signal.SIG_DFL:
+            signal.signal(sig, _on_signal)
@@ -6,6 +6,9 @@
 import os
 import json
 import datetime
+import functools
+
+from core import locks
 
 # ── Path ──────────────────────────────────────────────────
 MEMORY_DIR       = "memory"
@@ -23,15 +26,28 @@ def _ensure_dir():
 
 def _load(path, default):
     try:
-        with open(path, "r", encoding="utf-8") as f:
+        with locks.shared(path), open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
         return default() if callable(default) else default
 
 def _save(path, data):
+    """Atomik (.tmp + rename) di bawah lock store, lalu generation counter naik."""
     _ensure_dir()
-    with open(path, "w", encoding="utf-8") as f:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
+    with locks.exclusive(path):
+        os.replace(tmp, path)
+        locks.bump(path)
+
+def _txn(fn):
+    """Load → ubah → save short/long utuh, tidak diselingi proses lain (brain, daemon)."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with locks.transaction(MEMORY_DIR):
+            return fn(*args, **kwargs)
+    return wrapper
 
 def _now():
     return datetime.datetime.now().isoformat(timespec="seconds")
@@ -87,6 +103,7 @@ def save_long(data):
     _save(LONG_TERM_FILE, data)
 
 # ── Sync dari akaru_bot.py ────────────────────────────────
+@_txn
 def sync_from_main():
     """
     Tarik entry baru dari memory.json ke short_term.
@@ -111,6 +128,7 @@ def sync_from_main():
     return len(new_entries)
 
 # ── Promote short → long ──────────────────────────────────
+@_txn
 def promote_to_long():
     """
     Pindahkan short_term ke long_term jika sudah penuh.
@@ -158,6 +176,7 @@ def promote_to_long():
     return True
 
 # ── Streak tracker ────────────────────────────────────────
+@_txn
 def update_streak():
     """Update streak hari aktif berdasarkan last entry di short_term."""
     short   = load_short()
@@ -205,6 +224,7 @@ def memory_stats():
     }
 
 # ── Flush / trim manual ───────────────────────────────────
+@_txn
 def flush_old_long(keep_last=100):
     """Trim long_term, simpan hanya `keep_last` entry terbaru."""
     long = load_long()
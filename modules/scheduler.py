@@ -0,0 +1,101 @@
+# modules/scheduler.py
+# Shadow Bot – Scheduler
+# Timer berbasis heap untuk proses resident (brain --daemon)
+# Pure stdlib: heapq + time.sleep, tanpa cron, tanpa busy-loop
+
+import heapq
+import itertools
+import time
+import datetime
+
+class Job:
+    """
+    Satu job terjadwal. `next_run()` menentukan jadwal berikutnya.
+    Tanpa interval & daily_at → job adaptif: return value fn = detik ke run berikutnya.
+    """
+    __slots__ = ("name", "fn", "interval", "daily_at", "cancelled")
+
+    def __init__(self, name, fn, interval=None, daily_at=None):
+        self.name      = name
+        self.fn        = fn
+        self.interval  = interval   # detik, untuk job periodik
+        self.daily_at  = daily_at   # (jam, menit), untuk job harian
+        self.cancelled = False
+
+    def next_run(self, now, result=None):
+        if self.daily_at is not None:
+            return _next_daily(now, *self.daily_at)
+        if self.interval is None:
+            # fn gagal (tidak return apa-apa) → coba lagi semenit lagi, bukan busy-loop
+            return now + (max(result, 0) if result is not None else 60)
+        return now + self.interval
+
+def _next_daily(now, hour, minute):
+    dt     = datetime.datetime.fromtimestamp(now)
+    target = dt.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target.timestamp() <= now:
+        target += datetime.timedelta(days=1)
+    return target.timestamp()
+
+class Scheduler:
+    """
+    Min-heap berisi (waktu_jalan, seq, job).
+    Loop tidur persis sampai job terdekat → CPU idle ~0.
+    """
+    def __init__(self, clock=time.time, sleep=time.sleep):
+        self._heap    = []
+        self._seq     = itertools.count()
+        self._clock   = clock
+        self._sleep   = sleep
+        self._running = False
+
+    def _push(self, when, job):
+        heapq.heappush(self._heap, (when, next(self._seq), job))
+
+    def every(self, seconds, fn, name=None, delay=None):
+        """Jalankan `fn` tiap `seconds` detik (pertama kali setelah `delay`)."""
+        job = Job(name or fn.__name__, fn, interval=seconds)
+        self._push(self._clock() + (seconds if delay is None else delay), job)
+        return job
+
+    def daily(self, hour, minute, fn, name=None):
+        """Jalankan `fn` sekali sehari pada jam:menit lokal."""
+        job = Job(name or fn.__name__, fn, daily_at=(hour, minute))
+        self._push(job.next_run(self._clock()), job)
+        return job
+
+    def adaptive(self, fn, name=None, delay=0):
+        """Jalankan `fn`; jeda ke run berikutnya = detik yang di-return fn."""
+        job = Job(name or fn.__name__, fn)
+        self._push(self._clock() + delay, job)
+        return job
+
+    def cancel(self, job):
+        job.cancelled = True  # lazy delete, dibuang saat keluar heap
+
+    def pending(self):
+        """List (waktu_jalan, nama) terurut, untuk status/debug."""
+        return [(w, j.name) for w, _, j in sorted(self._heap) if not j.cancelled]
+
+    def stop(self):
+        self._running = False
+
+    def run(self):
+        self._running = True
+        while self._running and self._heap:
+            when, _, job = self._heap[0]
+            if job.cancelled:
+                heapq.heappop(self._heap)
+                continue
+            delay = when - self._clock()
+            if delay > 0:
+                self._sleep(delay)
+                continue
+            heapq.heappop(self._heap)
+            result = None
+            try:
+                result = job.fn()
+            except Exception as e:
+                print(f"[Scheduler] Job '{job.name}' gagal: {e}")
+            if not job.cancelled and self._running:
+                self._push(job.next_run(self._clock(), result), job)
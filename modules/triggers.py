@@ -0,0 +1,179 @@
+# modules/triggers.py
+# Shadow Bot – Trigger Engine (watchdog)
+# Rule analyzer jalan karena store yang dibacanya berubah, bukan karena jam.
+# Tanpa inotify: cukup os.stat tiap store, dengan interval poll yang melar
+# sendiri saat diam:
+#
+#   ada perubahan → poll lagi POLL_MIN detik kemudian
+#   diam          → interval ×2 tiap poll, mentok POLL_MAX
+#
+# Tiap Rule menyebut store yang dibacanya (deps). Store berubah → hanya rule
+# yang bergantung padanya ditandai kotor, lalu:
+#   debounce     : tunggu store diam `debounce` detik (burst tulis = 1 evaluasi)
+#   min_interval : rate limit per rule; perubahan saat cooldown ditunda, tidak hilang
+#   every        : evaluasi ulang berkala walau file diam (streak berubah karena
+#                  hari berganti); None = murni dipicu perubahan
+# Tulisan rule sendiri tidak membangunkan rule itu lagi, tapi tetap
+# membangunkan rule lain yang membaca store yang sama (promote → cek streak).
+
+import os
+import time
+
+POLL_MIN = 2.0      # detik, setelah ada perubahan
+POLL_MAX = 300.0    # detik, batas atas saat idle
+
+MOOD_DAYS = 7
+
+# ── Rule ──────────────────────────────────────────────────
+class Rule:
+    __slots__ = ("name", "deps", "fn", "debounce", "min_interval", "every",
+                 "dirty_at", "last_run", "runs", "deferred")
+
+    def __init__(self, name, deps, fn, debounce=5.0, min_interval=60.0, every=None):
+        self.name         = name
+        self.deps         = frozenset(deps)
+        self.fn           = fn
+        self.debounce     = debounce
+        self.min_interval = min_interval
+        self.every        = every
+        self.dirty_at     = None   # perubahan terakhir yang belum dievaluasi
+        self.last_run     = None
+        self.runs         = 0
+        self.deferred     = 0      # berapa kali evaluasi tertahan rate limit
+
+    def due_at(self):
+        """Waktu paling awal rule perlu jalan, None kalau tidak ada yang perlu."""
+        when = None
+        if self.dirty_at is not None:
+            when = self.dirty_at + self.debounce
+            if self.last_run is not None:
+                when = max(when, self.last_run + self.min_interval)
+        if self.every is not None and self.last_run is not None:
+            periodic = self.last_run + self.every
+            when = periodic if when is None else min(when, periodic)
+        return when
+
+def _sig(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+# ── Engine ────────────────────────────────────────────────
+class TriggerEngine:
+    """
+    Satu `tick()` = stat semua store + jalankan rule yang jatuh tempo.
+    Return detik sampai tick berikutnya — cocok untuk Scheduler.adaptive().
+    """
+    def __init__(self, rules, clock=time.monotonic, poll_min=POLL_MIN, poll_max=POLL_MAX):
+        self.rules    = list(rules)
+        self.paths    = sorted({p for r in self.rules for p in r.deps})
+        self.poll_min = poll_min
+        self.poll_max = poll_max
+        self.interval = poll_min
+        self.polls    = 0
+        self._clock   = clock
+        self._sigs    = {}
+
+    def _scan(self):
+        """Store yang stat-nya berubah sejak scan terakhir (scan pertama: semua)."""
+        changed = set()
+        for path in self.paths:
+            sig = _sig(path)
+            if self._sigs.get(path, "?") != sig:
+                self._sigs[path] = sig
+                changed.add(path)
+        return changed
+
+    def _mark(self, changed, now, skip=None):
+        for rule in self.rules:
+            if rule is skip or not rule.deps & changed:
+                continue
+            if rule.dirty_at is None and rule.last_run is not None \
+                    and now < rule.last_run + rule.min_interval:
+                rule.deferred += 1
+            rule.dirty_at = now
+
+    def _fire(self, rule, now):
+        rule.dirty_at = None
+        rule.last_run = now
+        rule.runs    += 1
+        try:
+            rule.fn()
+        except Exception as e:
+            print(f"[Trigger] Rule '{rule.name}' gagal: {e}")
+        changed = self._scan()
+        if changed:
+            self._mark(changed, self._clock(), skip=rule)
+
+    def tick(self):
+        now = self._clock()
+        self.polls += 1
+        changed = self._scan()
+        if changed:
+            self._mark(changed, now)
+            self.interval = self.poll_min
+        else:
+            self.interval = min(self.interval * 2, self.poll_max)
+
+        for rule in self.rules:
+            when = rule.due_at()
+            if when is not None and when <= now:
+                self._fire(rule, now)
+
+        wake = now + self.interval
+        for rule in self.rules:
+            when = rule.due_at()
+            if when is not None and when < wake:
+                wake = when
+        return max(wake - self._clock(), 0.0)
+
+    def status(self):
+        """List (nama, jalan, tertahan, detik ke jadwal berikutnya | None)."""
+        now = self._clock()
+        rows = []
+        for r in self.rules:
+            when = r.due_at()
+            rows.append((r.name, r.runs, r.deferred,
+                         None if when is None else max(when - now, 0.0)))
+        return rows
+
+# ── Rule bawaan brain ─────────────────────────────────────
+def brain_rules(streak_every=3 * 3600):
+    """streak_warning, promotion_check, mood_drop — dipakai brain.py --daemon."""
+    from modules import memory_manager as mm
+    from modules.analyzer import analisa_mood, analisa_streak
+
+    last = {"warning": None, "mood": None}
+
+    def streak_warning():
+        warning = analisa_streak()["warning"]
+        if warning and warning != last["warning"]:
+            print(f"[Brain] ⚠ {warning}")
+        last["warning"] = warning
+
+    def promotion_check():
+        mm.sync_from_main()
+        if mm.memory_stats().get("short_full"):
+            mm.promote_to_long()
+        mm.update_streak()
+
+    def mood_drop():
+        mood = analisa_mood(days=MOOD_DAYS)
+        drop = None
+        if mood["trend"] == "memburuk" or mood["dominant"] == "negatif":
+            drop = (mood["trend"], mood["dominant"])
+        if drop and drop != last["mood"]:
+            print(f"[Brain] ⚠ Mood {MOOD_DAYS} hari terakhir {mood['trend']} "
+                  f"(dominan: {mood['dominant'] or '-'}). Istirahat sebentar?")
+        last["mood"] = drop
+
+    return [
+        Rule("promotion_check", (mm.MAIN_MEMORY_FILE, mm.SHORT_TERM_FILE), promotion_check,
+             debounce=10, min_interval=60),
+        Rule("streak_warning", (mm.LONG_TERM_FILE,), streak_warning,
+             debounce=2, min_interval=60, every=streak_every),
+        Rule("mood_drop", (mm.SHORT_TERM_FILE, mm.LONG_TERM_FILE), mood_drop,
+             debounce=10, min_interval=300),
+    ]
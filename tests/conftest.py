@@ -0,0 +1,39 @@
+# tests/conftest.py
+# Tiap test dapat folder data sendiri. core/config membaca AKARU_DATA_DIR
+# saat di-import dan modul lain mengikat path-nya by name (MEMORY_FILE dst.),
+# jadi env di-set dulu lalu semua modul core.* dibuang dari sys.modules —
+# test meng-import core di dalam fungsi test, sesudah fixture jalan.
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+def _purge(monkeypatch, prefixes):
+    for name in list(sys.modules):
+        if name in prefixes or name.startswith(tuple(p + "." for p in prefixes)):
+            monkeypatch.delitem(sys.modules, name)
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Folder data kosong untuk test ini; `import core...` sesudahnya memakainya."""
+    path = tmp_path / "data"
+    path.mkdir()
+    monkeypatch.setenv("AKARU_DATA_DIR", str(path))
+    monkeypatch.setenv("AKARU_BACKUP_DIR", str(tmp_path / "backup"))
+    _purge(monkeypatch, ("core", "modules", "brain"))
+    yield path
+    writer = sys.modules.get("core.writer")
+    if writer is not None:
+        writer.stop()
+
+@pytest.fixture
+def brain_dir(tmp_path, monkeypatch):
+    """cwd sementara untuk brain.py & modules/ (path relatif memory/, logs/)."""
+    monkeypatch.chdir(tmp_path)
+    _purge(monkeypatch, ("core", "modules", "brain"))
+    return tmp_path
@@ -0,0 +1,61 @@
+# tests/test_backup.py
+# Backup → ubah → pulih mengembalikan isi file persis, dan pemulihan dari
+# proses lain terlihat oleh sesi yang sedang memegang state (generation naik)
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import sys
+from core import backup
+print(backup.restore(sys.argv[1], sys.argv[2:] or None))
+"""
+
+def _notes(data_dir):
+    mem = json.loads((data_dir / "memory.json").read_text(encoding="utf-8"))
+    return [n["v"] for n in mem["notes"]]
+
+def test_round_trip(data_dir):
+    from core import backup, engine, locks
+    state = engine.load_state()
+    engine.handle("catat satu", state)
+    engine.handle("tugas bayar listrik", state)
+    before = {p.name: p.read_bytes() for p in data_dir.iterdir() if p.is_file()}
+
+    sid = backup.create()["id"]
+    assert locks.GEN_FILE not in backup.manifest(sid)["files"]
+
+    engine.handle("catat dua", state)
+    (data_dir / "baru.txt").write_text("tidak ada di backup")
+    gen = locks.generations(str(data_dir))["memory.json"]
+
+    assert backup.restore(sid) == len(backup.manifest(sid)["files"])
+    for name, raw in before.items():
+        if name != locks.GEN_FILE:
+            assert (data_dir / name).read_bytes() == raw, name
+    assert (data_dir / "baru.txt").exists()                       # dibiarkan
+    assert locks.generations(str(data_dir))["memory.json"] > gen  # lewat bump
+    assert not list(data_dir.glob("*.tmp"))
+
+def test_restore_seen_by_loaded_state(data_dir, capsys):
+    from core import backup, engine
+    state = engine.load_state()
+    engine.handle("catat satu", state)
+    sid = backup.create()["id"]
+    engine.handle("catat dua", state)
+
+    env = dict(os.environ, AKARU_DATA_DIR=str(data_dir), PYTHONPATH=ROOT)
+    out = subprocess.run([sys.executable, "-c", CHILD, sid, "memory.json"], env=env,
+                         capture_output=True, text=True, timeout=30)
+    assert out.returncode == 0, out.stderr
+    assert _notes(data_dir) == ["satu"]
+
+    # Sesi ini masih memegang ["satu", "dua"] di RAM: perintah berikutnya harus
+    # memuat ulang hasil pulih, bukan menimpanya dengan state lama
+    engine.handle("catat tiga", state)
+    assert _notes(data_dir) == ["satu", "tiga"]
+    assert [n.v for n in state["memory"]["notes"]] == ["satu", "tiga"]
@@ -0,0 +1,54 @@
+# tests/test_batch.py
+# Batch = satu commit: sidecar (log biner, perf, topik, ring mood) tidak
+# ditulis di tengah batch dan tidak tersisa kalau batch dibatalkan
+
+import json
+import os
+
+import pytest
+
+def _state(data_dir, monkeypatch):
+    (data_dir / "config.json").write_text(json.dumps({"binary_logs": True}))
+    from core import engine, perf
+    monkeypatch.setattr(perf, "FLUSH_EVERY", 1)
+    seen = []
+    real = engine.execute
+
+    def spy(intent, text, state):
+        real(intent, text, state)
+        seen.append(sorted(os.listdir(data_dir)))
+    monkeypatch.setattr(engine, "execute", spy)
+    return engine, engine.load_state(), seen
+
+def test_sidecars_written_once_at_commit(data_dir, monkeypatch):
+    engine, state, seen = _state(data_dir, monkeypatch)
+    engine.run_batch(["catat rapat proyek", "catat rapat vendor", "tugas kirim laporan"], state)
+    for files in seen:   # di tengah batch belum ada yang ditulis
+        assert not {"memory.json", "log.bin", "perf.jsonl", "topics.json"} & set(files)
+
+    from core import binlog
+    from core.config import LOG_FILE, load_json
+    logs = load_json(LOG_FILE, [])
+    assert binlog.log_store().count() == len(logs) == 3
+    assert [e["i"] for e in binlog.log_store().tail(3)] == [e["i"] for e in logs]
+    assert (data_dir / "topics.json").exists()
+
+def test_aborted_batch_leaves_no_sidecars(data_dir, monkeypatch):
+    engine, state, _ = _state(data_dir, monkeypatch)
+    real_route = engine.route
+
+    def route(text):
+        if text == "boom":
+            raise RuntimeError("boom")
+        return real_route(text)
+    monkeypatch.setattr(engine, "route", route)
+
+    with pytest.raises(RuntimeError):
+        engine.run_batch(["catat rapat proyek", "tugas kirim laporan", "boom"], state)
+    engine.events.drain()
+    left = set(os.listdir(data_dir)) - {".locks", ".generation", "config.json"}
+    assert not {"memory.json", "log.json", "log.bin", "topics.json", "perf.jsonl"} & left
+
+    from core import binlog, topics
+    assert binlog.log_store().count() == 0
+    assert topics._state is None
@@ -0,0 +1,69 @@
+# tests/test_binlog.py
+# Store biner: record terpotong di ujung file (crash di tengah tulis)
+# tidak terbaca dan ditimpa rapi oleh append berikutnya
+
+import os
+
+def _mood(i, note=None):
+    e = {"t": f"2026-10-{i + 1:02d}T08:00:00", "mood": i % 5 + 1, "energy": 3}
+    if note is not None:
+        e["note"] = note
+    return e
+
+def _expected(e):
+    out = {"t": e["t"], "date": e["t"][:10], "mood": e["mood"], "energy": e["energy"]}
+    if "note" in e:
+        out["note"] = e["note"]
+    return out
+
+def test_round_trip(data_dir):
+    from core import binlog
+    store   = binlog.mood_store()
+    entries = [_mood(i, note=f"catatan {i}" if i % 2 else None) for i in range(6)]
+    store.extend(entries)
+    assert store.count() == 6
+    assert store.tail(6) == [_expected(e) for e in entries]
+    assert store.range("2026-10-03", "2026-10-05") == [_expected(e) for e in entries[2:4]]
+
+def test_torn_record_ignored_then_overwritten(data_dir):
+    from core import binlog
+    store   = binlog.mood_store()
+    entries = [_mood(i, note="ok") for i in range(3)]
+    store.extend(entries)
+    size = os.path.getsize(store.path)
+
+    # Crash di tengah tulis record ke-4: heap sudah berisi string, record baru separuh
+    with open(store.heap_path, "ab") as heap:
+        heap.write("yatim".encode())
+    with open(store.path, "ab") as f:
+        f.write(b"\xff" * (store.RECORD.size - 3))
+    assert store.count() == 3
+    assert store.tail(10) == [_expected(e) for e in entries]
+    assert store.range("2026-10-01") == [_expected(e) for e in entries]
+
+    store.append(_mood(9, note="sesudah crash"))
+    assert os.path.getsize(store.path) == size + store.RECORD.size
+    assert store.count() == 4
+    assert store.tail(4) == [_expected(e) for e in entries] + [_expected(_mood(9, "sesudah crash"))]
+
+def test_torn_header_rewritten(data_dir):
+    from core import binlog
+    store = binlog.mood_store()
+    with open(store.path, "wb") as f:
+        f.write(binlog.MAGIC)              # crash sebelum header lengkap
+    assert store.count() == 0
+    store.append(_mood(0))
+    assert store.count() == 1
+    assert store.tail(1) == [_expected(_mood(0))]
+
+def test_log_intent_dedup_survives_reopen(data_dir):
+    from core import binlog
+    store = binlog.log_store()
+    store.extend([{"t": "2026-10-19T08:00:00", "i": "NOTE", "ok": True, "n": "a"},
+                  {"t": "2026-10-19T08:01:00", "i": "NOTE", "ok": False}])
+    heap = os.path.getsize(store.heap_path)
+    fresh = binlog.LogStore(store.path)    # proses baru: peta string dibaca dari heap
+    fresh.append({"t": "2026-10-19T08:02:00", "i": "NOTE", "ok": True})
+    assert os.path.getsize(store.heap_path) == heap   # "NOTE" tidak ditulis ulang
+    assert [r["i"] for r in fresh.tail(3)] == ["NOTE"] * 3
+    assert fresh.tail(3)[0]["n"] == "a" and "n" not in fresh.tail(3)[1]
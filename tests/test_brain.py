@@ -0,0 +1,25 @@
+# tests/test_brain.py
+# Cache insight brain: isi di-cache per fingerprint input, jam header tidak
+
+import datetime as _dt
+import types
+
+def _clock(monkeypatch, brain, at):
+    class FakeDateTime(_dt.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return at
+    monkeypatch.setattr(brain, "datetime",
+                        types.SimpleNamespace(datetime=FakeDateTime, timedelta=_dt.timedelta))
+
+def test_cache_hit_renders_current_time(brain_dir, monkeypatch):
+    import brain
+    _clock(monkeypatch, brain, _dt.datetime(2026, 10, 19, 8, 0))
+    first, fresh = brain.cached_insight("short")
+    assert fresh and "19 Oct 2026, 08:00" in first
+
+    _clock(monkeypatch, brain, _dt.datetime(2026, 10, 19, 21, 30))
+    again, fresh = brain.cached_insight("short")
+    assert not fresh
+    assert "19 Oct 2026, 21:30" in again and "08:00" not in again
+    assert again.split("\n", 4)[4] == first.split("\n", 4)[4]   # isi sama
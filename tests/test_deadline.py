@@ -0,0 +1,37 @@
+# tests/test_deadline.py
+# Index deadline: entry heap tidak boleh hidup lagi saat id tugas dipakai ulang
+
+from datetime import date, timedelta
+
+TODAY = date(2026, 10, 19)
+
+def test_deleted_last_task_id_reused(data_dir):
+    from core import deadline
+    from core import memory as M
+    due = (TODAY + timedelta(days=1)).isoformat()
+    mem = {"notes": [], "tasks": []}
+    M.add_task(mem, "A", due=due)
+    assert [tk["v"] for tk in deadline.due_within(mem, today=TODAY)] == ["A"]
+
+    M.delete_task(mem, 1)
+    M.add_task(mem, "B", due=due)        # next_id → id 1 lagi
+    rows = deadline.due_within(mem, today=TODAY)
+    assert [(tk["id"], tk["v"]) for tk in rows] == [(1, "B")]
+
+def test_completed_then_reused(data_dir):
+    from core import deadline
+    from core import memory as M
+    due = TODAY.isoformat()
+    mem = {"notes": [], "tasks": []}
+    M.add_task(mem, "A", due=due)
+    deadline.next_due(mem)
+    M.complete_task(mem, 1)
+    assert deadline.due_today(mem, today=TODAY) == []
+    M.delete_task(mem, 1)
+    M.add_task(mem, "B", due=due)
+    assert [tk["v"] for tk in deadline.due_today(mem, today=TODAY)] == ["B"]
+
+def test_uses_own_data_dir(data_dir):
+    from core import config
+    assert config.DATA_DIR == str(data_dir)
+    assert config.MEMORY_FILE.startswith(str(data_dir))
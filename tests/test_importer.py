@@ -0,0 +1,68 @@
+# tests/test_importer.py
+# Import massal: validasi, dedup (input & data lama), commit per chunk
+
+import json
+
+def _write(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+def test_dedup_against_input_and_existing(data_dir, tmp_path):
+    from core import importer
+    from core import memory as M
+    mem = M.load_memory()
+    M.add_note(mem, "Sudah Ada")
+    src = _write(tmp_path / "in.txt", [
+        "sudah   ada",              # sama dengan catatan lama (spasi/kapital diabaikan)
+        "catat beli kopi",
+        "Beli Kopi",                # duplikat di input
+        "tugas beli kopi",          # tipe lain → bukan duplikat
+        "- [x] kirim laporan",
+        "nanti saja deh",           # melanggar goal
+        "",
+    ])
+    st = importer.import_file(src, mem, progress=False)
+    assert (st["read"], st["notes"], st["tasks"], st["dup"], st["goal"]) == (6, 1, 2, 2, 1)
+    assert [n["v"] for n in mem["notes"]] == ["Sudah Ada", "beli kopi"]
+    done = [t for t in mem["tasks"] if t["done"]]
+    assert [t["v"] for t in done] == ["kirim laporan"] and done[0]["done_at"]
+
+def test_invalid_rows_counted(data_dir, tmp_path):
+    from core import importer
+    from core import memory as M
+    mem = M.load_memory()
+    src = _write(tmp_path / "in.jsonl", [
+        json.dumps({"type": "note", "v": "oke"}),
+        "bukan json",
+        json.dumps({"type": "aneh", "v": "x"}),
+        json.dumps({"type": "task", "v": "tanggal rusak", "t": "kemarin"}),
+        json.dumps({"type": "task", "v": "y" * (importer.MAX_TEXT_LEN + 1)}),
+    ])
+    st = importer.import_file(src, mem, progress=False)
+    assert (st["notes"], st["tasks"], st["invalid"]) == (1, 0, 4)
+
+def test_chunked_commits(data_dir, tmp_path, monkeypatch):
+    from core import importer
+    from core import memory as M
+    from core.config import MEMORY_FILE, load_json
+    mem = M.load_memory()
+    calls = []
+    real = M.add_many
+
+    def spy(memory, notes=(), tasks=()):
+        calls.append((len(notes), len(tasks)))
+        return real(memory, notes, tasks)
+    monkeypatch.setattr(importer.M, "add_many", spy)
+
+    src = _write(tmp_path / "in.csv", ["tipe,teks,waktu,selesai"] + [
+        f"{'tugas' if i % 4 == 0 else 'catatan'},baris {i},2026-10-01T08:00:00,{i % 8 == 0}"
+        for i in range(25)])
+    st = importer.import_file(src, mem, chunk_size=10, progress=False)
+    assert calls == [(7, 3), (8, 2), (3, 2)]   # commit tiap 10 record + sisa
+    assert (st["notes"], st["tasks"]) == (18, 7)
+
+    disk = load_json(MEMORY_FILE, {})
+    assert [n["id"] for n in disk["notes"]] == list(range(1, 19))
+    assert [t["id"] for t in disk["tasks"]] == list(range(1, 8))
+    assert sum(t["done"] for t in disk["tasks"]) == 4
+    assert all(n["t"] == "2026-10-01T08:00:00" for n in disk["notes"])
@@ -0,0 +1,43 @@
+# tests/test_indexes.py
+# Index di RAM (tag, dedup, query) harus menyusul record yang masuk tanpa
+# event walau id record terakhir yang dihapus dipakai ulang
+
+import pytest
+
+@pytest.fixture
+def reused(data_dir):
+    from core import dedup, query, tags
+    from core import memory as M
+    mem = {"notes": [], "tasks": []}
+    M.add_note(mem, "halo #x")
+    M.add_note(mem, "kedua #x")
+    tags.index(mem, "notes")
+    dedup.index(mem)
+    query.doc_index(mem, "notes")
+    M.delete_notes(mem, {2})
+    # Ditambah langsung ke list, tanpa event → id 2 dipakai lagi
+    mem["notes"].append(M.Note(id=2, t="2026-10-19T08:00:00", v="beli #belanja"))
+    return mem
+
+def test_tags(reused):
+    from core import tags
+    assert tags.index(reused, "notes").bits == {"x": 1 << 1, "belanja": 1 << 2}
+
+def test_dedup(reused):
+    from core import dedup
+    assert [n["id"] for n, _ in dedup.similar(reused, "beli #belanja")] == [2]
+
+def test_query(reused):
+    from core import query
+    assert query.doc_index(reused, "notes").text_ids("beli") == {2}
+
+def test_add_many_reuses_id(data_dir):
+    from core import tags
+    from core import memory as M
+    mem = {"notes": [], "tasks": []}
+    M.add_note(mem, "halo #x")
+    M.add_note(mem, "kedua #x")
+    tags.index(mem, "notes")
+    M.delete_notes(mem, {2})
+    M.add_many(mem, notes=[("beli #belanja", None)])
+    assert tags.index(mem, "notes").bits == {"x": 1 << 1, "belanja": 1 << 2}
@@ -0,0 +1,121 @@
+# tests/test_locks.py
+# Lock antar proses & antar thread: dua proses berebut transaksi tidak saling
+# menimpa, thread lain di proses yang sama tetap menunggu, naik shared →
+# exclusive ditolak, dan prompt di tengah perintah tidak menahan sesi lain
+
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COUNTER = """
+import os, sys, time
+from core import locks
+folder = sys.argv[1]
+path   = os.path.join(folder, "counter")
+for _ in range(int(sys.argv[2])):
+    with locks.transaction(folder):
+        with open(path) as f:
+            n = int(f.read())
+        time.sleep(0.001)          # jendela read-modify-write
+        with open(path, "w") as f:
+            f.write(str(n + 1))
+"""
+
+NOTE = """
+import sys
+from core import engine
+engine.handle(sys.argv[1], engine.load_state())
+"""
+
+def _child(code, *args, data_dir=None, **kw):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    if data_dir is not None:
+        env["AKARU_DATA_DIR"] = str(data_dir)
+    return subprocess.Popen([sys.executable, "-c", code, *map(str, args)], env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, **kw)
+
+def test_two_processes_serialize(tmp_path):
+    (tmp_path / "counter").write_text("0")
+    procs = [_child(COUNTER, tmp_path, 200) for _ in range(2)]
+    for p in procs:
+        _, err = p.communicate(timeout=60)
+        assert p.returncode == 0, err
+    assert (tmp_path / "counter").read_text() == "400"
+
+def test_threads_wait_for_each_other(data_dir):
+    from core import locks
+    lk   = locks.txn_lock(str(data_dir))
+    got  = threading.Event()
+    def other():
+        with lk.hold():
+            got.set()
+    with lk.hold(), lk.hold(exclusive=False):   # reentrant di thread yang sama
+        assert lk.held() == 2
+        t = threading.Thread(target=other)
+        t.start()
+        assert not got.wait(0.2)                 # flock milik proses ini, tapi thread lain menunggu
+    assert got.wait(5)
+    t.join()
+    assert lk.held() == 0
+
+def test_upgrade_raises(data_dir):
+    from core import locks
+    lk = locks.lock_for(str(data_dir / "memory.json"))
+    with lk.hold(exclusive=False):
+        with pytest.raises(locks.LockUpgradeError):
+            lk.acquire(exclusive=True)
+        assert lk.held() == 1
+    with lk.hold():                              # lepas dulu → boleh exclusive
+        assert lk.held() == 1
+
+def test_prompt_releases_transaction(data_dir, capsys):
+    from core import display as D
+    from core import engine, locks
+    state = engine.load_state()
+    state["cfg"]["strict_mode"] = True
+    engine.handle("catat satu", state)
+    held = []
+
+    def answer_after_other_session(prompt):
+        held.append(locks.txn_lock(engine.DATA_DIR).held())
+        p = _child(NOTE, "catat dua", data_dir=data_dir)
+        _, err = p.communicate(timeout=30)       # lock masih dipegang → macet di sini
+        assert p.returncode == 0, err
+        return "y"
+
+    D.set_input(answer_after_other_session)
+    try:
+        engine.handle("hapus catatan 1", state)
+    finally:
+        D.set_input(None)
+    assert held == [0]
+    # Jawaban diberikan atas data lama → dibatalkan, state ikut dimuat ulang
+    assert [n.v for n in state["memory"]["notes"]] == ["satu", "dua"]
+    assert "dibatalkan" in capsys.readouterr().out
+
+    D.set_input(lambda prompt: "y")
+    try:
+        engine.handle("hapus catatan 1", state)
+    finally:
+        D.set_input(None)
+    assert [n.v for n in state["memory"]["notes"]] == ["dua"]
+
+def test_batch_keeps_transaction_during_prompt(data_dir):
+    from core import display as D
+    from core import engine, locks
+    state = engine.load_state()
+    held  = []
+    def answer(prompt):
+        held.append(locks.txn_lock(engine.DATA_DIR).held())
+        return "n"
+    D.set_input(answer)
+    try:
+        engine.run_batch(["reset log"], state)
+    finally:
+        D.set_input(None)
+    assert held == [2]
@@ -0,0 +1,53 @@
+# tests/test_membudget.py
+# Paging mode hemat: halaman lama tetap bisa dibuka, bukan dipotong
+
+def test_page_math(data_dir):
+    from core import membudget
+    items = list(range(45))
+    assert membudget.page(items) == (items, 1, 1)            # mode normal: semua
+    assert membudget.page(items, 1) == (items[25:], 1, 3)
+    assert membudget.page(items, 2) == (items[5:25], 2, 3)
+    assert membudget.page(items, 3) == (items[:5], 3, 3)
+    assert membudget.page(items, 9) == (items[:5], 3, 3)     # lewat batas → terakhir
+    membudget._state["low"] = True
+    assert membudget.page(items) == (items[25:], 1, 3)
+    assert membudget.page(items[:20]) == (items[:20], 1, 1)
+
+def test_view_notes_pages(data_dir, capsys):
+    from core import engine, membudget
+    from core import memory as M
+    state = engine.load_state()
+    for i in range(25):
+        M.add_note(state["memory"], f"catatan {i}")
+    membudget._state["low"] = True
+    assert engine.route("lihat catatan 2") == "VIEW_NOTES"
+    capsys.readouterr()
+
+    engine.handle("lihat catatan", state)
+    out = capsys.readouterr().out
+    assert "Halaman 1/2" in out and "'lihat catatan 2'" in out
+    assert "catatan 24" in out and "catatan 4\x1b" not in out
+
+    engine.handle("lihat catatan 2", state)
+    out = capsys.readouterr().out
+    assert "Halaman 2/2" in out
+    assert "catatan 4\x1b" in out and "catatan 5\x1b" not in out
+
+def test_view_tasks_shorter_list_ends(data_dir, capsys):
+    from core import engine, membudget
+    from core import memory as M
+    state = engine.load_state()
+    mem = state["memory"]
+    for i in range(30):
+        M.add_task(mem, f"kerja {i}")
+    M.add_task(mem, "masih jalan")
+    for i in range(1, 31):
+        M.complete_task(mem, i)
+    membudget._state["low"] = True
+    capsys.readouterr()
+
+    engine.handle("lihat tugas 2", state)
+    out = capsys.readouterr().out
+    assert "Halaman 2/2" in out
+    assert "masih jalan" not in out         # daftar aktif cuma 1 halaman
+    assert "kerja 0" in out
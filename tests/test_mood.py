@@ -0,0 +1,30 @@
+# tests/test_mood.py
+# mood_stats: count/avg_* tetap "30 entry terakhir", jendela hari ada di windows
+
+import json
+from datetime import datetime, timedelta
+
+def _day(n):
+    return (datetime.now() - timedelta(days=n)).strftime("%Y-%m-%d")
+
+def test_mood_stats_keeps_recent_entry_meaning(data_dir):
+    old   = [{"t": _day(60) + " 08:00", "date": _day(60), "mood": 1, "energy": 2, "note": ""}
+             for _ in range(40)]
+    fresh = [{"t": _day(0) + " 08:00", "date": _day(0), "mood": 5, "energy": 4, "note": ""}
+             for _ in range(5)]
+    (data_dir / "mood.json").write_text(json.dumps(old + fresh))
+    from core.mood import mood_stats
+    ms = mood_stats()
+
+    assert ms["count"] == 30                         # 30 entry terakhir, bukan 30 hari
+    assert ms["avg_mood"] == round((25 * 1 + 5 * 5) / 30, 1)
+    assert ms["avg_energy"] == round((25 * 2 + 5 * 4) / 30, 1)
+    assert (ms["last_mood"], ms["last_energy"]) == (5, 4)
+
+    assert ms["windows"][7]  == {"n": 5, "avg_mood": 5.0, "avg_energy": 4.0}
+    assert ms["windows"][30] == {"n": 5, "avg_mood": 5.0, "avg_energy": 4.0}
+    assert ms["windows"][90]["n"] == 45
+
+def test_mood_stats_empty(data_dir):
+    from core.mood import mood_stats
+    assert mood_stats() is None
@@ -0,0 +1,81 @@
+# tests/test_query.py
+# Planner `cari`: hasil lewat index (tanggal, tag, status, teks) harus sama
+# persis dengan scan penuh, juga setelah catatan/tugas dihapus & ditambah
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+WORDS = ["laporan", "bulanan", "rapat", "vendor", "belanja", "kode", "review", "jalan"]
+TAGS  = ["kerja", "rumah", "urgent", "ide"]
+
+QUERIES = [
+    "#kerja", "#kerja -#urgent", "#urgent #rumah", "-#ide",
+    "status:aktif", "status:selesai", "status:selesai #rumah", "tipe:tugas status:aktif #urgent",
+    "dari:2026-03-01 sampai:2026-03-10", "dari:2026-04-20", "sampai:2026-01-05",
+    '"laporan bulanan"', "lapor", "rapat vendor", "zzz",
+    "#kerja laporan dari:2026-02-01", "tipe:catatan #ide kode sampai:2026-03-31",
+]
+
+@pytest.fixture
+def memory(data_dir, monkeypatch):
+    from core import config
+    from core import memory as M
+    rnd   = random.Random(43)
+    clock = iter(datetime(2026, 1, 1) + timedelta(hours=6 * i) for i in range(10_000))
+    monkeypatch.setattr(M, "_now", lambda: next(clock).strftime("%Y-%m-%d %H:%M"))
+    config.begin_batch()          # tanpa tulis disk per record
+    mem = {"notes": [], "tasks": []}
+
+    def text():
+        words = rnd.sample(WORDS, rnd.randint(1, 3))
+        tags_ = [f"#{t}" for t in TAGS if rnd.random() < 0.2]
+        return " ".join(words + tags_)
+
+    for i in range(300):
+        M.add_note(mem, text())
+        task = M.add_task(mem, text())
+        if i % 5 == 0:
+            M.complete_task(mem, task["id"])
+    yield mem, M, rnd
+    config.abort_batch()
+
+def _scan(mem, q):
+    from core import query
+    return {k: [r["id"] for r in mem.get(k, []) if query._check(k, r, q)] for k in q.kinds}
+
+def _planned(mem, q):
+    from core import query
+    plans = query.run({"memory": mem, "cfg": {}, "logs": []}, q)
+    return {p.kind: [r["id"] for r in p.rows] for p in plans}, plans
+
+def test_planner_matches_full_scan(memory):
+    from core import query
+    mem, _, _ = memory
+    drivers = set()
+    for text in QUERIES:
+        q = query.parse(text)
+        rows, plans = _planned(mem, q)
+        assert rows == _scan(mem, q), text
+        drivers |= {p.driver for p in plans}
+    # Index benar-benar dipakai, bukan semua jatuh ke scan
+    assert {"tanggal", "tag", "status"} <= drivers
+    assert any(d.startswith("teks") for d in drivers)
+
+def test_planner_matches_after_changes(memory):
+    from core import query
+    mem, M, rnd = memory
+    for text in QUERIES:            # bangun index dulu
+        query.run({"memory": mem, "cfg": {}, "logs": []}, query.parse(text))
+    for nid in rnd.sample([n["id"] for n in mem["notes"]], 60):
+        M.delete_note(mem, nid)
+    for tid in rnd.sample([t["id"] for t in mem["tasks"]], 60):
+        M.delete_task(mem, tid)
+    for _ in range(40):
+        M.add_note(mem, "laporan baru #kerja")
+        t = M.add_task(mem, "rapat baru #urgent")
+        M.complete_task(mem, t["id"])
+    for text in QUERIES:
+        q = query.parse(text)
+        assert _planned(mem, q)[0] == _scan(mem, q), text
@@ -0,0 +1,103 @@
+# tests/test_snapshot.py
+# Snapshot biner (.snap): codec baris tuple bolak-balik tanpa kehilangan field,
+# dan sidecar ditulis malas — bukan tiap save
+
+import os
+
+NOTES = [{"id": i, "t": "2026-10-19 08:00", "v": f"catatan nomor {i} " + "x" * 40}
+         for i in range(1, 1500)]
+TASKS = [
+    {"id": 1, "t": "2026-10-19 08:00", "v": "lengkap", "done": True,
+     "done_at": "2026-10-19 09:00", "due": "2026-10-20", "pri": 1},
+    {"id": 2, "t": "2026-10-19 08:00", "v": "ekor kosong", "done": False},   # tuple pendek
+    {"id": 3, "t": "2026-10-19 08:00", "v": "bolong", "done": False, "pri": 2},  # Ellipsis
+    {"id": 4, "t": "2026-10-19 08:00", "v": "ekstra", "done": False, "tag": ["a"]},  # dict
+]
+
+def _mem():
+    return {"notes": [dict(n) for n in NOTES], "tasks": [dict(t) for t in TASKS],
+            "next_id": 1500}
+
+def _spy(monkeypatch, config):
+    calls = []
+    real = config._write_snapshot
+
+    def spy(path, key, data, owned=False):
+        calls.append(path)
+        real(path, key, data, owned)
+    monkeypatch.setattr(config, "_write_snapshot", spy)
+    return calls
+
+def _from_snapshot_only(monkeypatch, config):
+    """Load berikutnya wajib dari .snap: parse JSON dibuat gagal keras."""
+    def boom(*a, **kw):
+        raise AssertionError("JSON di-parse, snapshot tidak dipakai")
+    monkeypatch.setattr(config.json, "loads", boom)
+
+def test_codec_round_trip(data_dir, monkeypatch):
+    from core import config, memory
+    config.save_json(memory.MEMORY_FILE, _mem())
+    assert os.path.getsize(memory.MEMORY_FILE) >= config.SNAPSHOT_MIN_BYTES
+    assert config.flush_snapshots() == 1
+    assert os.path.exists(memory.MEMORY_FILE + config.SNAPSHOT_SUFFIX)
+
+    config.clear_cache()
+    _from_snapshot_only(monkeypatch, config)
+    data = config.load_json(memory.MEMORY_FILE, {})
+    assert config.plain(data) == _mem()
+    assert isinstance(data["tasks"][1], memory.Task)
+    assert not hasattr(data["tasks"][1], "done_at")
+    assert data["tasks"][3]["tag"] == ["a"]
+
+def test_schema_change_ignores_snapshot(data_dir, monkeypatch):
+    from core import config, memory
+    config.save_json(memory.MEMORY_FILE, _mem())
+    config.flush_snapshots()
+    config.clear_cache()
+    schema, enc, dec = config._codecs[memory.MEMORY_FILE]
+    monkeypatch.setitem(config._codecs, memory.MEMORY_FILE, (("lain",), enc, dec))
+    assert config.plain(config.load_json(memory.MEMORY_FILE, {})) == _mem()
+
+def test_saves_do_not_write_snapshot(data_dir, monkeypatch):
+    from core import config, memory
+    calls = _spy(monkeypatch, config)
+    mem = _mem()
+    for i in range(5):
+        mem["next_id"] += 1
+        config.save_json(memory.MEMORY_FILE, mem)
+    assert calls == []
+    assert config.flush_snapshots() == 1      # hanya versi terakhir
+    assert calls == [memory.MEMORY_FILE]
+    assert config.flush_snapshots() == 0
+
+def test_stale_snapshot_rebuilt_on_load(data_dir, monkeypatch):
+    from core import config, memory
+    config.save_json(memory.MEMORY_FILE, _mem())
+    config.flush_snapshots()
+    mem = _mem()
+    mem["next_id"] = 9999
+    config.save_json(memory.MEMORY_FILE, mem)   # .snap sekarang basi, belum ditulis
+    config._snap_due.clear()                    # proses mati sebelum flush
+    config.clear_cache()
+
+    calls = _spy(monkeypatch, config)
+    assert config.load_json(memory.MEMORY_FILE, {})["next_id"] == 9999   # dari JSON
+    assert calls == [memory.MEMORY_FILE]
+    config.clear_cache()
+    _from_snapshot_only(monkeypatch, config)
+    assert config.load_json(memory.MEMORY_FILE, {})["next_id"] == 9999
+
+def test_writer_stop_flushes_snapshot(data_dir):
+    from core import config, memory, writer
+    writer.start()
+    config.save_json(memory.MEMORY_FILE, _mem())
+    writer.flush()
+    assert not os.path.exists(memory.MEMORY_FILE + config.SNAPSHOT_SUFFIX)
+    writer.stop()
+    assert os.path.exists(memory.MEMORY_FILE + config.SNAPSHOT_SUFFIX)
+
+def test_small_store_has_no_snapshot(data_dir):
+    from core import config, memory
+    config.save_json(memory.MEMORY_FILE, {"notes": [], "tasks": []})
+    assert config.flush_snapshots() == 0
+    assert not os.path.exists(memory.MEMORY_FILE + config.SNAPSHOT_SUFFIX)
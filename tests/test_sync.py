@@ -0,0 +1,135 @@
+# tests/test_sync.py
+# Sync dua data dir: hasil akhir sama di dua sisi, sync kedua tidak mengirim
+# apa-apa, dan ringkasan dibaca dari sidecar pohon hash tanpa hash ulang record
+
+import json
+import os
+
+import pytest
+
+def _write(folder, notes, tasks, mood):
+    folder.mkdir(exist_ok=True)
+    (folder / "memory.json").write_text(json.dumps({"notes": notes, "tasks": tasks}))
+    (folder / "mood.json").write_text(json.dumps(mood))
+
+def _note(i, v, t="2026-10-01 08:00"):
+    return {"id": i, "t": t, "v": v}
+
+def _task(i, v, done=False, done_at=None):
+    tk = {"id": i, "t": "2026-10-01 09:00", "v": v, "done": done}
+    if done_at:
+        tk["done_at"] = done_at
+    return tk
+
+def _mood(t, m):
+    return {"t": t, "date": t[:10], "mood": m, "energy": 3, "note": ""}
+
+def _state(folder):
+    mem  = json.loads((folder / "memory.json").read_text())
+    mood = json.loads((folder / "mood.json").read_text())
+    return mem["notes"], mem["tasks"], mood
+
+@pytest.fixture
+def dirs(data_dir, tmp_path):
+    shared = [_note(i, f"catatan {i}") for i in range(1, 150)]
+    _write(data_dir,
+           shared + [_note(150, "hanya di A", "2026-10-02 08:00")],
+           [_task(1, "kirim laporan"), _task(2, "bayar listrik")],
+           [_mood("2026-09-01 08:00", 3), _mood("2026-10-01 08:00", 4)])
+    other = tmp_path / "b"
+    _write(other,
+           shared + [_note(150, "hanya di B", "2026-10-03 08:00")],
+           [_task(1, "kirim laporan", True, "2026-10-05 10:00"), _task(2, "bayar listrik")],
+           [_mood("2026-10-01 08:00", 4), _mood("2026-10-04 08:00", 2)])
+    return data_dir, other
+
+def test_two_dirs_converge(dirs):
+    from core import sync
+    a, b = dirs
+    stats = sync.sync(sync.LocalPeer(a), sync.LocalPeer(b))
+    assert _state(a) == _state(b)
+
+    notes, tasks, mood = _state(a)
+    assert [n["v"] for n in notes[-2:]] == ["hanya di A", "hanya di B"]   # bentrok id 150
+    assert tasks[0]["done"] is True                                        # selesai menang
+    assert [m["t"] for m in mood] == ["2026-09-01 08:00", "2026-10-01 08:00", "2026-10-04 08:00"]
+    assert stats["notes"]["conflicts"] == 1 and stats["notes"]["buckets"] == 1
+
+    again = sync.sync(sync.LocalPeer(a), sync.LocalPeer(b))
+    assert all(st == {"sent": 0, "received": 0, "conflicts": 0, "buckets": 0}
+               for st in again.values())
+
+def test_summary_reads_sidecar_only(dirs, monkeypatch):
+    from core import sync, synctree
+    a, b = dirs
+    sync.sync(sync.LocalPeer(a), sync.LocalPeer(b))
+
+    def boom(rec):
+        raise AssertionError("record di-hash ulang")
+    monkeypatch.setattr(synctree, "record_hash", boom)
+    for folder in (a, b):
+        peer = sync.LocalPeer(folder)
+        monkeypatch.setattr(peer, "items", lambda coll: pytest.fail("store dibaca"))
+        for coll in sync.COLLECTIONS:
+            assert peer.summary(coll)["buckets"]
+
+def test_events_keep_sidecar_fresh(dirs, monkeypatch):
+    from core import memory as M
+    from core import sync, synctree
+    a, b = dirs
+    sync.sync(sync.LocalPeer(a), sync.LocalPeer(b))
+
+    mem = M.load_memory()
+    M.add_note(mem, "catatan baru di A")
+    M.complete_task(mem, 2)
+    M.delete_note(mem, 3)
+    assert sorted(synctree.flush()) == ["notes", "tasks"]
+
+    st = os.stat(a / "memory.json")
+    for coll in ("notes", "tasks"):
+        assert synctree._heads(str(a))[coll]["src"] == [st.st_mtime_ns, st.st_size]
+    fresh = {c: sync.LocalPeer(a).summary(c) for c in ("notes", "tasks")}
+
+    # Sama persis dengan pohon yang dibangun ulang dari nol
+    for name in os.listdir(a):
+        if name.startswith("sync_"):
+            os.remove(a / name)
+    rebuilt = {c: sync.LocalPeer(a).summary(c) for c in ("notes", "tasks")}
+    assert fresh == rebuilt
+
+    stats = sync.sync(sync.LocalPeer(a), sync.LocalPeer(b))
+    assert stats["notes"]["buckets"] == 2       # bucket #3 (dihapus) & bucket catatan baru
+    assert stats["tasks"]["buckets"] == 1
+    # Penghapusan tidak tersinkron (tanpa tombstone): #3 kembali dari B
+    assert _state(a) == _state(b)
+    assert _state(a)[0][-1]["v"] == "catatan baru di A"
+
+def test_foreign_edit_rebuilds_tree(dirs):
+    from core import sync
+    a, b = dirs
+    sync.sync(sync.LocalPeer(a), sync.LocalPeer(b))
+    notes, tasks, mood = _state(b)
+    notes[0]["v"] = "diedit manual"
+    _write(b, notes, tasks, mood)           # stat berubah di luar AKARU
+    stats = sync.sync(sync.LocalPeer(a), sync.LocalPeer(b))
+    assert stats["notes"]["conflicts"] == 1
+    assert _state(a) == _state(b)
+
+def test_engine_commands_with_write_behind(dirs, monkeypatch):
+    from core import engine, sync, synctree, writer
+    from core import display as D
+    a, b = dirs
+    sync.sync(sync.LocalPeer(a), sync.LocalPeer(b))
+    writer.start()
+    state = engine.load_state()
+    answers = iter(["4", "5", ""])
+    monkeypatch.setattr(D, "ask", lambda prompt="": next(answers))
+    for cmd in ("catat rapat vendor", "tugas beli kabel", "mood"):
+        engine.handle(cmd, state)
+    assert sorted(synctree.flush()) == ["mood", "notes", "tasks"]
+
+    kept = {c: sync.LocalPeer(a).summary(c) for c in sync.COLLECTIONS}
+    for name in os.listdir(a):
+        if name.startswith("sync_"):
+            os.remove(a / name)
+    assert kept == {c: sync.LocalPeer(a).summary(c) for c in sync.COLLECTIONS}
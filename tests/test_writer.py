@@ -0,0 +1,113 @@
+# tests/test_writer.py
+# Write-behind: save digabung, load melihat snapshot yang belum ditulis,
+# dan antrian tidak hilang saat flush/close/exit/SIGTERM
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _gated(monkeypatch, writer):
+    """write_file yang menunggu gate dibuka — tulisan pertama tertahan di thread latar."""
+    gate, started, written = threading.Event(), threading.Event(), []
+    real = writer.write_file
+
+    def slow(path, data, owned=False):
+        started.set()
+        gate.wait(5)
+        written.append(data)
+        real(path, data, owned)
+    monkeypatch.setattr(writer, "write_file", slow)
+    return gate, started, written
+
+def test_coalesce_and_read_your_writes(data_dir, monkeypatch):
+    from core import config, writer
+    gate, started, written = _gated(monkeypatch, writer)
+    path = str(data_dir / "x.json")
+    w = writer.start()
+
+    config.save_json(path, {"v": 0})
+    assert started.wait(5)                  # v0 sedang ditulis, thread tertahan
+    for v in (1, 2, 3):
+        config.save_json(path, {"v": v})
+    assert w.stats["coalesced"] == 2        # v1..v3 → satu entri antrian
+    assert not os.path.exists(path)
+    assert config.load_json(path, {}) == {"v": 3}   # read-your-writes via peek
+    assert w.has_pending(path)
+
+    gate.set()
+    assert writer.flush(5)
+    assert written == [{"v": 0}, {"v": 3}]  # versi antara tidak pernah ditulis
+    assert json.loads(open(path).read()) == {"v": 3}
+    assert w.backlog() == 0
+
+def test_snapshot_taken_at_save(data_dir, monkeypatch):
+    from core import config, writer
+    gate, started, _ = _gated(monkeypatch, writer)
+    path = str(data_dir / "x.json")
+    writer.start()
+    data = {"items": [1]}
+    config.save_json(path, data)
+    data["items"].append(2)                 # diubah sesudah save
+    gate.set()
+    writer.flush(5)
+    assert json.loads(open(path).read()) == {"items": [1]}
+
+def test_stop_drains_queue(data_dir, monkeypatch):
+    from core import config, writer
+    gate, started, _ = _gated(monkeypatch, writer)
+    paths = [str(data_dir / f"f{i}.json") for i in range(3)]
+    w = writer.start()
+    for i, p in enumerate(paths):
+        config.save_json(p, {"i": i})
+    threading.Timer(0.05, gate.set).start()
+    writer.stop()                           # jalur atexit & handler sinyal
+    assert writer.active() is None and config._writer is None
+    assert [json.loads(open(p).read())["i"] for p in paths] == [0, 1, 2]
+    assert w.close() is True
+
+def test_close_rejects_new_saves(data_dir):
+    import pytest
+    from core import writer
+    w = writer.WriteBehind()
+    assert w.close(5)
+    with pytest.raises(RuntimeError):
+        w.submit(str(data_dir / "x.json"), {})
+
+# ── Proses sungguhan: atexit & SIGTERM ───────────────────
+CHILD = textwrap.dedent("""
+    import os, signal, sys, time
+    from core import config, writer
+    real = writer.write_file
+    def slow(path, data, owned=False):
+        time.sleep(0.2)
+        real(path, data, owned)
+    writer.write_file = slow
+    writer.start()
+    for i in range(3):
+        config.save_json(os.path.join(config.DATA_DIR, f"f{i}.json"), {"i": i})
+    if sys.argv[1] == "sigterm":
+        os.kill(os.getpid(), signal.SIGTERM)
+        time.sleep(5)
+""")
+
+def _child(data_dir, mode):
+    env = dict(os.environ, AKARU_DATA_DIR=str(data_dir), PYTHONPATH=ROOT)
+    return subprocess.run([sys.executable, "-c", CHILD, mode], env=env,
+                          cwd=ROOT, timeout=30).returncode
+
+def _written(data_dir):
+    return [json.loads((data_dir / f"f{i}.json").read_text())["i"] for i in range(3)]
+
+def test_exit_flushes_via_atexit(data_dir):
+    assert _child(data_dir, "exit") == 0
+    assert _written(data_dir) == [0, 1, 2]
+
+def test_sigterm_flushes(data_dir):
+    assert _child(data_dir, "sigterm") == 128 + signal.SIGTERM
+    assert _written(data_dir) == [0, 1, 2]